@@ -14,6 +14,10 @@ const { getTournamentAnalyzer } = require('../models/tournament-analyzer');
 const { API_CONFIG } = require('../config/app-config');
 const { checkAccessCode } = require('../middleware/access-code');
 const { requireAuth } = require('../middleware/supabase-auth');
+const { compressResponses } = require('../middleware/compression');
+const { pgnMemoryStorage, pgnFileFilter, handleUploadErrors } = require('../middleware/pgn-upload');
+const { frontendStatic, sendFrontendIndex } = require('../middleware/frontend');
+const { startCluster, getJobRecovery } = require('./cluster');
 
 // Import route configuration function
 const configureRoutes = require('./routes');
@@ -21,6 +25,8 @@ const configureRoutes = require('./routes');
 const app = express();
 const port = API_CONFIG.port;
 
+app.disable('x-powered-by');
+
 // Rate limiter for upload endpoint
 const uploadLimiter = rateLimit({
   windowMs: 15 * 60 * 1000, // 15 minutes
@@ -30,9 +36,10 @@ const uploadLimiter = rateLimit({
   legacyHeaders: false
 });
 
-// Multer configuration for file uploads (stored in memory)
+// Multer configuration for file uploads (stored in memory, checked for PGN while streaming)
 const multerUpload = multer({
-  storage: multer.memoryStorage(),
+  storage: pgnMemoryStorage(),
+  fileFilter: pgnFileFilter,
   limits: {
     fileSize: 10 * 1024 * 1024 // 10MB file size limit
   }
@@ -45,6 +52,18 @@ let tournamentManager = null;
 let tournamentAnalyzer = null;
 let sharedAnalyzer = null;
 
+// Keep the persisted engine evaluations bounded (engine_eval_cache)
+const EVAL_CACHE_PRUNE_INTERVAL_MS = 24 * 60 * 60 * 1000;
+
+async function pruneEngineEvalCache() {
+  try {
+    const AnalysisConfig = require('../models/analysis-config');
+    await database.pruneEngineEvalCache(AnalysisConfig.EVAL_CACHE.PERSISTENT_MAX_ROWS);
+  } catch (error) {
+    console.warn('⚠️ Failed to prune engine evaluation cache:', error.message);
+  }
+}
+
 async function initializeServices() {
   try {
     database = getDatabase();
@@ -58,10 +77,22 @@ async function initializeServices() {
     tournamentAnalyzer = getTournamentAnalyzer();
     await tournamentAnalyzer.initialize();
 
+    // Background analysis jobs from a previous (or crashed) process cannot be resumed
+    const jobRecovery = getJobRecovery();
+    if (jobRecovery) {
+      const AnalysisJobService = require('../services/AnalysisJobService');
+      await new AnalysisJobService({ database }).recoverInterruptedJobs(jobRecovery);
+    }
+
     // Initialize shared Stockfish analyzer (SINGLETON)
     console.log('🔧 Initializing shared Stockfish engine...');
     const ChessAnalyzer = require('../models/analyzer');
     sharedAnalyzer = new ChessAnalyzer();
+    sharedAnalyzer.setPersistentCache(database);
+    if (sharedAnalyzer.persistentCache) {
+      await pruneEngineEvalCache();
+      setInterval(pruneEngineEvalCache, EVAL_CACHE_PRUNE_INTERVAL_MS).unref();
+    }
 
     // Wait for Stockfish to be ready
     await new Promise((resolve) => {
@@ -103,11 +134,15 @@ app.use((req, res, next) => {
   }
 });
 
-// Serve Angular static files
-app.use(express.static(path.join(__dirname, '../../frontend/dist/chess-analyzer')));
+// Serve Angular static files (hashed bundles are cached long-term)
+const frontendDir = path.join(__dirname, '../../frontend/dist/chess-analyzer');
+app.use(frontendStatic(frontendDir));
 app.use(express.json({ limit: '10mb' }));
 app.use(express.text({ limit: '10mb', type: 'text/plain' }));
 
+// Compress API responses (brotli/gzip); ETags are computed on the compressed body
+app.use('/api', compressResponses());
+
 // Authentication middleware
 // Require authentication for all API endpoints except health check
 app.use('/api/health', (req, res, next) => next()); // Skip auth for health check
@@ -753,15 +788,17 @@ async function startServer() {
       sharedAnalyzer: () => sharedAnalyzer  // Now sharedAnalyzer is initialized!
     });
     app.use('/api', apiRoutes);
+    app.use('/api', handleUploadErrors);
     console.log('✅ API routes configured');
 
     // Serve Angular app for all non-API routes (MUST BE LAST)
+    const sendIndex = sendFrontendIndex(path.join(frontendDir, 'index-angular.html'));
     app.get('*', (req, res) => {
       // Only serve Angular for non-API routes
       if (req.path.startsWith('/api/')) {
         return res.status(404).json({ error: 'API endpoint not found' });
       }
-      res.sendFile(path.join(__dirname, '../../frontend/dist/chess-analyzer/index-angular.html'));
+      sendIndex(req, res);
     });
     console.log('✅ Catch-all route configured');
 
@@ -805,7 +842,7 @@ async function startServer() {
   }
 }
 
-// Start the server
-startServer();
+// Start the server (in WEB_CONCURRENCY worker processes when set)
+startCluster(API_CONFIG.workers, startServer);
 
 module.exports = app;
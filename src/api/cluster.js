@@ -0,0 +1,129 @@
+/**
+ * Cluster Launcher
+ *
+ * Runs the API server in several worker processes sharing one port, so a
+ * long-running request in one worker (Stockfish analysis, PGN parsing) does
+ * not hold up requests served by the others. Off by default: with
+ * WEB_CONCURRENCY unset or 1 the server runs in-process as before.
+ *
+ * Workers start one at a time: the first worker runs database migrations and
+ * job recovery before the rest are forked, so they never race each other.
+ * Each worker keeps its own Stockfish engines and evaluation cache.
+ */
+
+const defaultCluster = require('cluster');
+
+// Restart delay after a crash, doubled for each crash in a row
+const RESTART_DELAY_MS = 1000;
+const MAX_RESTART_DELAY_MS = 30000;
+// A worker that ran this long before exiting resets the crash streak
+const STABLE_UPTIME_MS = 60000;
+// Crashes in a row before the launcher gives up (the platform restarts it)
+const MAX_CRASHES_IN_A_ROW = 10;
+
+/**
+ * Which interrupted background jobs this process should fail at startup.
+ * - Not clustered, or the first worker of a fresh start: all of them.
+ * - A worker replacing a crashed one: only the crashed worker's jobs, so the
+ *   jobs its siblings are still processing are left alone.
+ * - Any other worker: none.
+ * @param {Object} [clusterModule] - cluster module (injectable for tests)
+ * @param {Object} [env] - Process environment
+ * @returns {{workerPid?: number}|null} Options for recoverInterruptedJobs(), or null
+ */
+function getJobRecovery(clusterModule = defaultCluster, env = process.env) {
+  if (!clusterModule.isWorker) return {};
+
+  const crashedPid = parseInt(env.RECOVER_JOBS_OF_PID);
+  if (Number.isFinite(crashedPid)) return { workerPid: crashedPid };
+
+  return clusterModule.worker.id === 1 ? {} : null;
+}
+
+/**
+ * Start the server, forking workers when more than one is configured
+ * @param {number} workers - Number of worker processes
+ * @param {Function} startWorker - Starts the server in the current process
+ * @param {Object} [clusterModule] - cluster module (injectable for tests)
+ */
+function startCluster(workers, startWorker, clusterModule = defaultCluster) {
+  if (workers <= 1 || !clusterModule.isPrimary) {
+    return startWorker();
+  }
+
+  console.log(`🧵 Starting ${workers} server workers (primary pid ${process.pid})`);
+
+  let started = 0;
+  let shuttingDown = false;
+  let crashesInARow = 0;
+  const startedAt = new Map(); // worker id -> fork time
+
+  const forkWorker = (env = {}) => {
+    const worker = clusterModule.fork(env);
+    startedAt.set(worker.id, Date.now());
+    worker.once('listening', () => {
+      if (started < workers) {
+        started++;
+        if (started < workers) forkWorker();
+      }
+    });
+    return worker;
+  };
+
+  clusterModule.on('exit', (worker, code, signal) => {
+    const uptime = Date.now() - (startedAt.get(worker.id) || 0);
+    startedAt.delete(worker.id);
+
+    if (shuttingDown) {
+      if (Object.keys(clusterModule.workers).length === 0) {
+        console.log('✅ All server workers stopped');
+        process.exit(0);
+      }
+      return;
+    }
+
+    // A worker that never came up (bad config, failed migration) would fail again
+    if (started === 0) {
+      console.error(`❌ Server worker ${worker.process.pid} failed to start`);
+      process.exit(code || 1);
+      return;
+    }
+
+    crashesInARow = uptime >= STABLE_UPTIME_MS ? 1 : crashesInARow + 1;
+    if (crashesInARow > MAX_CRASHES_IN_A_ROW) {
+      console.error(`❌ Server workers crashed ${MAX_CRASHES_IN_A_ROW} times in a row, giving up`);
+      process.exit(code || 1);
+      return;
+    }
+
+    const delay = Math.min(RESTART_DELAY_MS * 2 ** (crashesInARow - 1), MAX_RESTART_DELAY_MS);
+    console.error(`❌ Server worker ${worker.process.pid} exited (${signal || code}), restarting in ${delay}ms`);
+    setTimeout(() => {
+      if (!shuttingDown) {
+        // The replacement fails the jobs the crashed worker left behind
+        forkWorker({ RECOVER_JOBS_OF_PID: String(worker.process.pid) });
+      }
+    }, delay);
+  });
+
+  const shutdown = (forwardSignal) => {
+    shuttingDown = true;
+    if (Object.keys(clusterModule.workers).length === 0) {
+      process.exit(0);
+      return;
+    }
+    // Ctrl-C already reaches every worker through the process group
+    if (forwardSignal) {
+      for (const worker of Object.values(clusterModule.workers)) {
+        worker.process.kill('SIGINT');
+      }
+    }
+  };
+
+  process.on('SIGINT', () => shutdown(false));
+  process.on('SIGTERM', () => shutdown(true));
+
+  forkWorker();
+}
+
+module.exports = { startCluster, getJobRecovery };
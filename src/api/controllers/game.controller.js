@@ -14,10 +14,13 @@
 const { getDatabase } = require('../../models/database');
 const AccuracyCalculator = require('../../models/accuracy-calculator');
 
+const GAMES_PAGE_SIZE = 50;
+const MAX_GAMES_PAGE_SIZE = 200;
+
 class GameController {
   /**
-   * List all games
-   * GET /api/games
+   * List games, newest first
+   * GET /api/games?limit=50&offset=0
    */
   async list(req, res) {
     try {
@@ -28,6 +31,9 @@ class GameController {
         throw new Error('Database not initialized');
       }
 
+      const limit = Math.min(Math.max(parseInt(req.query.limit) || GAMES_PAGE_SIZE, 1), MAX_GAMES_PAGE_SIZE);
+      const offset = Math.max(parseInt(req.query.offset) || 0, 0);
+
       const games = await database.all(`
         SELECT
           id, white_player, black_player, result, date, event,
@@ -35,35 +41,33 @@ class GameController {
         FROM games
         WHERE user_id = ?
         ORDER BY created_at DESC
-        LIMIT 50
-      `, [req.userId]);
+        LIMIT ? OFFSET ?
+      `, [req.userId, limit, offset]);
+
+      // Resolve all ECO codes of the page with one query
+      const ecoCodes = games.map(game => {
+        const ecoMatch = game.pgn_content && game.pgn_content.match(/\[ECO "([^"]+)"\]/);
+        return ecoMatch ? ecoMatch[1] : null;
+      });
+      const openingNames = await this._getOpeningNames(ecoCodes.filter(Boolean));
 
-      // Add opening extraction to each game
-      const gamesWithOpenings = await Promise.all(games.map(async (game) => {
+      // Annotate rows in place rather than copying each one
+      games.forEach((game, index) => {
         let opening = null;
-        if (game.pgn_content) {
-          // Try to get ECO from PGN headers first
-          const ecoMatch = game.pgn_content.match(/\[ECO "([^"]+)"\]/);
-          if (ecoMatch) {
-            const ecoCode = ecoMatch[1];
-            opening = await this._getOpeningName(ecoCode);
-          } else {
-            // Fallback: Detect opening from moves
-            const openingDetector = require('../../models/opening-detector');
-            const detected = openingDetector.detect(game.pgn_content);
-            if (detected) {
-              opening = detected.name;
-            }
+        if (ecoCodes[index]) {
+          opening = openingNames.get(ecoCodes[index]) || null;
+        } else if (game.pgn_content) {
+          // Fallback: Detect opening from moves
+          const openingDetector = require('../../models/opening-detector');
+          const detected = openingDetector.detect(game.pgn_content);
+          if (detected) {
+            opening = detected.name;
           }
         }
+        game.opening = opening || 'Unknown Opening';
+      });
 
-        return {
-          ...game,
-          opening: opening || 'Unknown Opening'
-        };
-      }));
-
-      res.json(gamesWithOpenings);
+      res.json(games);
     } catch (error) {
       console.error('[NEW CONTROLLER] Games API error:', error);
       res.json([]);
@@ -132,15 +136,16 @@ class GameController {
         throw new Error('Database not initialized');
       }
 
-      const gameAnalysis = await database.getGameAnalysis(gameId, req.userId);
+      // Pre-serialized body: skips parsing stored alternatives only to re-stringify them
+      const gameAnalysisJSON = await database.getGameAnalysisJSON(gameId, req.userId);
 
       console.log('🎮 [GAME CONTROLLER] Game analysis requested');
     
-      if (!gameAnalysis) {
+      if (!gameAnalysisJSON) {
         return res.status(404).json({ error: 'Game not found' });
       }
     
-      res.json(gameAnalysis);
+      res.type('application/json').send(gameAnalysisJSON);
     } catch (error) {
       console.error('[GAME CONTROLLER] Analysis retrieval error:', error);
       res.json([]);
@@ -499,6 +504,29 @@ class GameController {
       return null;
     }
   }
+
+  /**
+   * Get opening names for several ECO codes in one query
+   * @private
+   * @param {string[]} ecoCodes - ECO codes (duplicates allowed)
+   * @returns {Promise<Map<string, string>>} ECO code -> opening name
+   */
+  async _getOpeningNames(ecoCodes) {
+    const uniqueCodes = [...new Set(ecoCodes)];
+    if (uniqueCodes.length === 0) return new Map();
+
+    try {
+      const database = getDatabase();
+      const placeholders = uniqueCodes.map(() => '?').join(', ');
+      const rows = await database.all(
+        `SELECT eco_code, opening_name FROM chess_openings WHERE eco_code IN (${placeholders})`,
+        uniqueCodes
+      );
+      return new Map(rows.map(row => [row.eco_code, row.opening_name]));
+    } catch (error) {
+      return new Map();
+    }
+  }
 }
 
 module.exports = new GameController();
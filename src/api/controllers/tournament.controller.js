@@ -253,9 +253,6 @@ class TournamentController {
       let wins = 0;
       let losses = 0;
       let draws = 0;
-      let totalBlunders = 0;
-      let totalCentipawnLoss = 0;
-      let totalMoves = 0;
 
       for (const game of games) {
         const isPlayerWhite = game.user_color === 'white';
@@ -271,37 +268,34 @@ class TournamentController {
         } else {
           losses++;
         }
+      }
 
-        // Get analysis data
-        const analysis = await database.all(`
-          SELECT a.centipawn_loss, a.move_number
-          FROM analysis a
-          INNER JOIN games g ON a.game_id = g.id
-          WHERE a.game_id = ? AND g.user_id = ?
-          ORDER BY a.move_number
-        `, [game.id, req.userId]);
-
-        // Filter moves for the user using user_color
-        const playerMoves = analysis.filter(move =>
-          (isPlayerWhite && move.move_number % 2 === 1) ||
-          (!isPlayerWhite && move.move_number % 2 === 0)
-        );
-
-        // Count blunders using user_color
-        const blunderCount = await database.get(`
-          SELECT COUNT(*) as count
-          FROM blunder_details bd
-          JOIN games g ON bd.game_id = g.id
-          WHERE bd.game_id = ?
-            AND bd.is_blunder = ?
-            AND g.user_id = ?
-            AND bd.player_color = g.user_color
-        `, [game.id, true, req.userId]);
+      // Aggregate the user's moves across the tournament in the database
+      // instead of loading each game's analysis rows (odd move numbers are White's moves).
+      // Like the win/loss count above, games without a user_color count as black.
+      const userMoves = await database.get(`
+        SELECT COALESCE(SUM(a.centipawn_loss), 0) as total_centipawn_loss, COUNT(*) as total_moves
+        FROM analysis a
+        INNER JOIN games g ON a.game_id = g.id
+        WHERE g.tournament_id = ? AND g.user_id = ?
+          AND ((g.user_color = 'white' AND a.move_number % 2 = 1) OR
+               (COALESCE(g.user_color, 'black') <> 'white' AND a.move_number % 2 = 0))
+      `, [tournamentId, req.userId]);
 
-        totalBlunders += parseInt(blunderCount?.count) || 0;
-        totalCentipawnLoss += playerMoves.reduce((sum, move) => sum + (move.centipawn_loss || 0), 0);
-        totalMoves += playerMoves.length;
-      }
+      // Count the user's blunders across the tournament using user_color
+      const blunderCount = await database.get(`
+        SELECT COUNT(*) as count
+        FROM blunder_details bd
+        JOIN games g ON bd.game_id = g.id
+        WHERE g.tournament_id = ?
+          AND bd.is_blunder = ?
+          AND g.user_id = ?
+          AND bd.player_color = g.user_color
+      `, [tournamentId, true, req.userId]);
+
+      const totalBlunders = parseInt(blunderCount?.count) || 0;
+      const totalCentipawnLoss = Number(userMoves?.total_centipawn_loss) || 0;
+      const totalMoves = parseInt(userMoves?.total_moves) || 0;
 
       const totalGames = games.length;
       const winRate = totalGames > 0 ? Math.round((wins / totalGames) * 100) : 0;
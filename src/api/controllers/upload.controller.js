@@ -6,11 +6,13 @@
  * - Manual PGN entry
  * - Game analysis and storage
  * - Tournament linkage
+ * - Background analysis jobs (opt-in via ?async=true)
  */
 
 const { TARGET_PLAYER } = require('../../config/app-config');
 const PGNUploadService = require('../../services/PGNUploadService');
 const GameAnalysisService = require('../../services/GameAnalysisService');
+const AnalysisJobService = require('../../services/AnalysisJobService');
 
 class UploadController {
   constructor(sharedAnalyzer = null) {
@@ -27,7 +29,19 @@ class UploadController {
     this.uploadService = new PGNUploadService({
       analysisService: analysisService
     });
+
+    this.jobService = new AnalysisJobService({ uploadService: this.uploadService });
   }
+
+  /**
+   * Whether the client asked for background analysis
+   * (?async=true or an "async" field in the JSON/FormData body)
+   */
+  _wantsAsync(req) {
+    const flag = (req.query && req.query.async) || (req.body && req.body.async);
+    return flag === true || flag === 'true';
+  }
+
   /**
    * Handle PGN file upload or text content
    * POST /api/upload
@@ -36,6 +50,9 @@ class UploadController {
    * Supports two formats:
    * 1. Multipart/form-data: file upload with 'pgn' field (from frontend file upload)
    * 2. JSON: { pgnContent: "...", tournamentId?: number } (from manual entry)
+   *
+   * With ?async=true the analysis runs in the background and the response is
+   * 202 { jobId, status, statusUrl }; poll GET /api/jobs/:id for the result.
    */
   async upload(req, res) {
     try {
@@ -60,14 +77,31 @@ class UploadController {
         return res.status(400).json({ error: 'No PGN content provided. Send either a file upload or JSON with pgnContent field.' });
       }
 
-      // Delegate to PGNUploadService
-      const result = await this.uploadService.processPGNUpload({
+      const uploadOptions = {
         pgnContent,
         originalFileName,
         assignedTournamentId,
         userId: req.userId,
         userColor  // Pass userColor to service
-      });
+      };
+
+      if (this._wantsAsync(req)) {
+        // Reject malformed PGN now rather than in a failed job
+        const validation = this.uploadService.pgnParser.validatePGN(pgnContent);
+        if (!validation.valid) {
+          return res.status(400).json({ error: validation.error });
+        }
+
+        const jobId = await this.jobService.enqueue(uploadOptions);
+        return res.status(202).json({
+          jobId,
+          status: AnalysisJobService.JOB_STATUS.QUEUED,
+          statusUrl: `/api/jobs/${jobId}`
+        });
+      }
+
+      // Delegate to PGNUploadService
+      const result = await this.uploadService.processPGNUpload(uploadOptions);
 
       res.json(result);
     } catch (error) {
@@ -76,6 +110,29 @@ class UploadController {
     }
   }
 
+  /**
+   * Get background analysis job status
+   * GET /api/jobs/:id
+   */
+  async getJob(req, res) {
+    try {
+      const jobId = parseInt(req.params.id);
+      if (isNaN(jobId)) {
+        return res.status(400).json({ error: 'Invalid job ID' });
+      }
+
+      const job = await this.jobService.getJob(jobId, req.userId);
+      if (!job) {
+        return res.status(404).json({ error: 'Job not found' });
+      }
+
+      res.json(job);
+    } catch (error) {
+      console.error('Analysis job status error:', error);
+      res.status(500).json({ error: 'Failed to retrieve job status' });
+    }
+  }
+
   /**
    * Handle manual PGN entry
    * POST /api/manual-pgn
@@ -64,6 +64,9 @@ function configureRoutes(middleware = {}) {
       middleware.uploadLimiter,
       uploadController.manualEntry.bind(uploadController)
     );
+
+    // Background analysis job status (for /upload?async=true)
+    router.get('/jobs/:id', uploadController.getJob.bind(uploadController));
   }
 
   // TODO: Mount other routes
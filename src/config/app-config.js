@@ -21,6 +21,7 @@ const TARGET_PLAYER = process.env.TARGET_PLAYER || 'AdvaitKumar1213';
  */
 const API_CONFIG = {
   port: process.env.PORT || 3000,
+  workers: parseInt(process.env.WEB_CONCURRENCY) || 1, // Server processes (see src/api/cluster.js)
   cacheTimeout: 5 * 60 * 1000, // 5 minutes
 };
 
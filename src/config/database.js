@@ -20,9 +20,101 @@ const sqliteDb = !usePostgres ? new sqlite3.Database(`./data/${dbFileName}`, (er
     console.log(`✅ Connected to SQLite database (${mode} mode)`);
     // Enable foreign key constraints (required for CASCADE DELETE to work)
     sqliteDb.run('PRAGMA foreign_keys = ON');
+    // WAL lets reads proceed during writes; synchronous=NORMAL only fsyncs at
+    // checkpoints instead of on every commit (still safe against app crashes)
+    sqliteDb.exec(`
+      PRAGMA journal_mode = WAL;
+      PRAGMA synchronous = NORMAL;
+      PRAGMA temp_store = MEMORY;
+      PRAGMA mmap_size = 268435456;
+      PRAGMA busy_timeout = 5000;
+    `, (pragmaErr) => {
+      if (pragmaErr) {
+        console.warn('⚠️ Failed to apply SQLite performance settings:', pragmaErr.message);
+      }
+    });
   }
 }) : null;
 
+// Prepared statement cache (SQLite only): each distinct SQL string is compiled
+// once and reused. Bounded so SQL built with varying shapes cannot grow it forever.
+const STATEMENT_CACHE_SIZE = 200;
+const statementCache = new Map(); // sql -> Promise<sqlite3.Statement>
+
+function prepareStatement(sql) {
+  const cached = statementCache.get(sql);
+  if (cached) {
+    // Refresh LRU position
+    statementCache.delete(sql);
+    statementCache.set(sql, cached);
+    return cached;
+  }
+
+  const prepared = new Promise((resolve, reject) => {
+    const statement = sqliteDb.prepare(sql, (err) => {
+      if (err) reject(err);
+      else resolve(statement);
+    });
+  });
+  // Never cache a statement that failed to compile
+  prepared.catch(() => statementCache.delete(sql));
+
+  statementCache.set(sql, prepared);
+  if (statementCache.size > STATEMENT_CACHE_SIZE) {
+    const [oldestSql, oldest] = statementCache.entries().next().value;
+    statementCache.delete(oldestSql);
+    // Finalize runs after any operations already queued on the statement
+    oldest.then(statement => statement.finalize()).catch(() => {});
+  }
+
+  return prepared;
+}
+
+async function finalizeStatements() {
+  const statements = [...statementCache.values()];
+  statementCache.clear();
+
+  await Promise.all(statements.map(prepared => prepared
+    .then(statement => new Promise(resolve => statement.finalize(() => resolve())))
+    .catch(() => {})));
+}
+
+// Separate SQLite connection for transactions: BEGIN on the shared connection
+// would pull every other request's statements into the transaction
+let sqliteTxDb = null;
+let sqliteTxQueue = Promise.resolve();
+
+function sqliteCall(connection, method, sql, params = []) {
+  return new Promise((resolve, reject) => {
+    connection[method](sql, params, function(err, result) {
+      if (err) reject(err);
+      else if (method === 'run') resolve({ lastID: this.lastID, changes: this.changes, id: this.lastID });
+      else resolve(result);
+    });
+  });
+}
+
+function getSqliteTxDb() {
+  if (!sqliteTxDb) {
+    sqliteTxDb = new sqlite3.Database(`./data/${dbFileName}`);
+    sqliteTxDb.serialize();
+    sqliteTxDb.exec('PRAGMA foreign_keys = ON; PRAGMA busy_timeout = 5000;');
+  }
+  return sqliteTxDb;
+}
+
+function toPostgresSql(sql, { returningId = false } = {}) {
+  // Convert SQLite ? placeholders to PostgreSQL $1, $2, etc.
+  let paramIndex = 1;
+  let pgSql = sql.replace(/\?/g, () => `$${paramIndex++}`);
+
+  // Add RETURNING id for INSERT statements if not already present
+  if (returningId && /^\s*INSERT\s+INTO/i.test(pgSql) && !/RETURNING/i.test(pgSql)) {
+    pgSql = pgSql.trim().replace(/;?\s*$/, '') + ' RETURNING id';
+  }
+  return pgSql;
+}
+
 if (usePostgres) {
   console.log('✅ Using PostgreSQL database (production mode)');
 }
@@ -37,16 +129,12 @@ const db = {
    */
   query: async (sql, params = []) => {
     if (usePostgres) {
-      // Convert SQLite ? placeholders to PostgreSQL $1, $2, etc.
-      let pgSql = sql;
-      let paramIndex = 1;
-      pgSql = pgSql.replace(/\?/g, () => `$${paramIndex++}`);
-
-      const result = await pgPool.query(pgSql, params);
+      const result = await pgPool.query(toPostgresSql(sql), params);
       return result.rows;
     } else {
+      const statement = await prepareStatement(sql);
       return new Promise((resolve, reject) => {
-        sqliteDb.all(sql, params, (err, rows) => {
+        statement.all(params, (err, rows) => {
           if (err) reject(err);
           else resolve(rows);
         });
@@ -62,27 +150,16 @@ const db = {
    */
   run: async (sql, params = []) => {
     if (usePostgres) {
-      // Convert SQLite ? placeholders to PostgreSQL $1, $2, etc.
-      let pgSql = sql;
-      let paramIndex = 1;
-      pgSql = pgSql.replace(/\?/g, () => `$${paramIndex++}`);
-
-      // Add RETURNING id for INSERT statements if not already present
-      const isInsert = /^\s*INSERT\s+INTO/i.test(pgSql);
-      const hasReturning = /RETURNING/i.test(pgSql);
-      if (isInsert && !hasReturning) {
-        pgSql = pgSql.trim().replace(/;?\s*$/, '') + ' RETURNING id';
-      }
-
-      const result = await pgPool.query(pgSql, params);
+      const result = await pgPool.query(toPostgresSql(sql, { returningId: true }), params);
       return {
         lastID: result.rows[0]?.id,
         changes: result.rowCount,
         id: result.rows[0]?.id  // Add id field for compatibility
       };
     } else {
+      const statement = await prepareStatement(sql);
       return new Promise((resolve, reject) => {
-        sqliteDb.run(sql, params, function(err) {
+        statement.run(params, function(err) {
           if (err) reject(err);
           else resolve({ lastID: this.lastID, changes: this.changes, id: this.lastID });
         });
@@ -98,15 +175,16 @@ const db = {
    */
   get: async (sql, params = []) => {
     if (usePostgres) {
-      let pgSql = sql;
-      let paramIndex = 1;
-      pgSql = pgSql.replace(/\?/g, () => `$${paramIndex++}`);
-
-      const result = await pgPool.query(pgSql, params);
+      const result = await pgPool.query(toPostgresSql(sql), params);
       return result.rows[0];
     } else {
+      const statement = await prepareStatement(sql);
       return new Promise((resolve, reject) => {
-        sqliteDb.get(sql, params, (err, row) => {
+        // get() stops after the first row: reset so a reused statement starts
+        // from the top and does not hold the read transaction open
+        statement.reset();
+        statement.get(params, (err, row) => {
+          statement.reset();
           if (err) reject(err);
           else resolve(row);
         });
@@ -132,6 +210,63 @@ const db = {
     }
   },
 
+  /**
+   * Run statements in one transaction, rolled back if fn throws.
+   * fn receives a handle with the same query/run/get interface bound to the
+   * transaction's connection (a pooled client on PostgreSQL, a dedicated
+   * connection on SQLite where transactions run one at a time).
+   * @param {Function} fn - async (tx) => result
+   * @returns {Promise<*>} Result of fn
+   */
+  transaction: async (fn) => {
+    if (usePostgres) {
+      const client = await pgPool.connect();
+      const tx = {
+        query: async (sql, params = []) => (await client.query(toPostgresSql(sql), params)).rows,
+        get: async (sql, params = []) => (await client.query(toPostgresSql(sql), params)).rows[0],
+        run: async (sql, params = []) => {
+          const result = await client.query(toPostgresSql(sql, { returningId: true }), params);
+          return { lastID: result.rows[0]?.id, changes: result.rowCount, id: result.rows[0]?.id };
+        }
+      };
+
+      try {
+        await client.query('BEGIN');
+        const result = await fn(tx);
+        await client.query('COMMIT');
+        return result;
+      } catch (error) {
+        await client.query('ROLLBACK').catch(() => {});
+        throw error;
+      } finally {
+        client.release();
+      }
+    }
+
+    const runTransaction = async () => {
+      const connection = getSqliteTxDb();
+      const tx = {
+        query: (sql, params) => sqliteCall(connection, 'all', sql, params),
+        get: (sql, params) => sqliteCall(connection, 'get', sql, params),
+        run: (sql, params) => sqliteCall(connection, 'run', sql, params)
+      };
+
+      await tx.run('BEGIN IMMEDIATE');
+      try {
+        const result = await fn(tx);
+        await tx.run('COMMIT');
+        return result;
+      } catch (error) {
+        await tx.run('ROLLBACK').catch(() => {});
+        throw error;
+      }
+    };
+
+    const result = sqliteTxQueue.then(runTransaction);
+    sqliteTxQueue = result.catch(() => {});
+    return result;
+  },
+
   /**
    * Close database connection
    * @returns {Promise<void>}
@@ -140,6 +275,13 @@ const db = {
     if (usePostgres) {
       await pgPool.end();
     } else if (sqliteDb) {
+      // SQLite refuses to close while prepared statements are still open
+      await finalizeStatements();
+      if (sqliteTxDb) {
+        await sqliteTxQueue;
+        await new Promise(resolve => sqliteTxDb.close(() => resolve()));
+        sqliteTxDb = null;
+      }
       return new Promise((resolve, reject) => {
         sqliteDb.close((err) => {
           if (err) reject(err);
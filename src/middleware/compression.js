@@ -0,0 +1,109 @@
+/**
+ * Response Compression Middleware
+ *
+ * Compresses JSON/text API responses with brotli or gzip (Node's built-in
+ * zlib, no extra dependency). Bodies are compressed before Express computes
+ * the ETag, so conditional requests (If-None-Match) still get 304 Not Modified.
+ */
+
+const zlib = require('zlib');
+
+// Responses smaller than this are sent as-is (headers would outweigh the savings)
+const COMPRESSION_THRESHOLD_BYTES = 1024;
+
+// Larger responses are compressed on the libuv threadpool instead of blocking
+// the event loop (a full analysis or dashboard payload takes milliseconds)
+const ASYNC_COMPRESSION_THRESHOLD_BYTES = 64 * 1024;
+
+// Fast settings: dashboard/analysis payloads are compressed on every request
+const BROTLI_OPTIONS = { params: { [zlib.constants.BROTLI_PARAM_QUALITY]: 4 } };
+const GZIP_OPTIONS = { level: 6 };
+
+const COMPRESSIBLE_TYPE = /^(application\/json|text\/)/;
+
+function compressBody(encoding, buffer) {
+  return encoding === 'br'
+    ? zlib.brotliCompressSync(buffer, BROTLI_OPTIONS)
+    : zlib.gzipSync(buffer, GZIP_OPTIONS);
+}
+
+function compressBodyAsync(encoding, buffer, callback) {
+  if (encoding === 'br') {
+    zlib.brotliCompress(buffer, BROTLI_OPTIONS, callback);
+  } else {
+    zlib.gzip(buffer, GZIP_OPTIONS, callback);
+  }
+}
+
+/**
+ * Create the compression middleware
+ * @param {Object} options
+ * @param {number} options.threshold - Minimum body size in bytes to compress
+ * @param {number} options.asyncThreshold - Body size in bytes from which compression runs off the event loop
+ * @returns {Function} Express middleware
+ */
+function compressResponses({
+  threshold = COMPRESSION_THRESHOLD_BYTES,
+  asyncThreshold = ASYNC_COMPRESSION_THRESHOLD_BYTES
+} = {}) {
+  return (req, res, next) => {
+    const send = res.send;
+
+    res.send = function (body) {
+      // res.json() and objects come back through here as a string
+      if (typeof body !== 'string' && !Buffer.isBuffer(body)) {
+        return send.call(this, body);
+      }
+
+      // Keep Express' default type for strings (sending a Buffer would turn it into octet-stream)
+      if (typeof body === 'string' && !this.get('Content-Type')) {
+        this.type('html');
+      }
+
+      const buffer = typeof body === 'string' ? Buffer.from(body) : body;
+      const contentType = this.get('Content-Type') || '';
+      const cacheControl = this.get('Cache-Control') || '';
+
+      if (buffer.length < threshold ||
+          !COMPRESSIBLE_TYPE.test(contentType) ||
+          this.get('Content-Encoding') ||
+          cacheControl.includes('no-transform')) {
+        return send.call(this, body);
+      }
+
+      this.vary('Accept-Encoding');
+      // Check brotli on its own: accepts() breaks q-value ties by the order in
+      // the request header, so "gzip, deflate, br" would always pick gzip
+      const encoding = req.acceptsEncodings('br') ? 'br' : (req.acceptsEncodings('gzip') ? 'gzip' : false);
+      if (!encoding) {
+        return send.call(this, body);
+      }
+
+      if (buffer.length >= asyncThreshold) {
+        compressBodyAsync(encoding, buffer, (error, compressed) => {
+          if (error) {
+            console.warn('⚠️ Response compression failed, sending uncompressed:', error.message);
+            send.call(this, body);
+            return;
+          }
+          this.set('Content-Encoding', encoding);
+          send.call(this, compressed);
+        });
+        return this;
+      }
+
+      try {
+        const compressed = compressBody(encoding, buffer);
+        this.set('Content-Encoding', encoding);
+        return send.call(this, compressed);
+      } catch (error) {
+        console.warn('⚠️ Response compression failed, sending uncompressed:', error.message);
+        return send.call(this, body);
+      }
+    };
+
+    next();
+  };
+}
+
+module.exports = { compressResponses, COMPRESSION_THRESHOLD_BYTES, ASYNC_COMPRESSION_THRESHOLD_BYTES };
@@ -0,0 +1,76 @@
+/**
+ * Frontend Serving Middleware
+ *
+ * Serves the built Angular app with cache headers:
+ * - Content-hashed bundles (main.<hash>.js, styles.<hash>.css, ...) never
+ *   change under the same name, so browsers and proxies may keep them for a year.
+ * - Other static files are cached for an hour.
+ * - The index page is kept in memory and always revalidated, so a deploy's new
+ *   bundle names are picked up at once; an unchanged index costs a 304 via its
+ *   ETag. Outside production the file is re-checked on each request so a
+ *   frontend rebuild shows up without restarting the server.
+ */
+
+const fs = require('fs');
+const path = require('path');
+const express = require('express');
+
+// Angular (webpack builder, outputHashing: all) appends a 16-20 hex digit content hash
+const HASHED_ASSET_REGEX = /\.[0-9a-f]{16,20}\.[a-z0-9]+$/;
+
+const IMMUTABLE_CACHE = 'public, max-age=31536000, immutable';
+const STATIC_CACHE = 'public, max-age=3600';
+const REVALIDATE = 'no-cache';
+
+function setStaticCacheHeaders(res, filePath) {
+  if (filePath.endsWith('.html')) {
+    res.setHeader('Cache-Control', REVALIDATE);
+  } else if (HASHED_ASSET_REGEX.test(path.basename(filePath))) {
+    res.setHeader('Cache-Control', IMMUTABLE_CACHE);
+  } else {
+    res.setHeader('Cache-Control', STATIC_CACHE);
+  }
+}
+
+/**
+ * Static file middleware for the frontend build
+ * @param {string} distDir - Angular output directory
+ * @returns {Function} Express middleware
+ */
+function frontendStatic(distDir) {
+  return express.static(distDir, { setHeaders: setStaticCacheHeaders });
+}
+
+/**
+ * Route handler sending the SPA index page from memory
+ * @param {string} indexPath - Path of the built index HTML
+ * @param {Object} [options]
+ * @param {boolean} [options.watch] - Reload the page when the file changes (default: outside production)
+ * @returns {Function} Express handler
+ */
+function sendFrontendIndex(indexPath, { watch = process.env.NODE_ENV !== 'production' } = {}) {
+  let cached = null; // { mtimeMs, html }
+
+  return (req, res) => {
+    if (cached && !watch) {
+      res.set('Cache-Control', REVALIDATE);
+      return res.type('html').send(cached.html);
+    }
+
+    let stats;
+    try {
+      stats = fs.statSync(indexPath);
+    } catch (error) {
+      return res.status(404).send('Frontend not built');
+    }
+
+    if (!cached || cached.mtimeMs !== stats.mtimeMs) {
+      cached = { mtimeMs: stats.mtimeMs, html: fs.readFileSync(indexPath, 'utf-8') };
+    }
+
+    res.set('Cache-Control', REVALIDATE);
+    res.type('html').send(cached.html);
+  };
+}
+
+module.exports = { frontendStatic, sendFrontendIndex, HASHED_ASSET_REGEX };
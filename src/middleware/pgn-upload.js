@@ -0,0 +1,147 @@
+/**
+ * PGN Upload Middleware
+ *
+ * Multer storage engine and filters for PGN file uploads.
+ * Uploads are still kept in memory (req.file.buffer), but the start of the
+ * stream is checked while it arrives, so a binary or non-PGN file is rejected
+ * after its first chunk instead of after buffering up to the 10MB limit.
+ */
+
+const path = require('path');
+const multer = require('multer');
+
+const INVALID_PGN_UPLOAD = 'INVALID_PGN_UPLOAD';
+
+// How much of the upload is inspected before deciding it looks like PGN
+const SNIFF_BYTES = 64 * 1024;
+
+const PGN_EXTENSIONS = new Set(['.pgn']);
+const PGN_MIME_TYPES = new Set(['application/x-chess-pgn', 'application/vnd.chess-pgn', 'text/plain']);
+
+// A PGN file starts with a tag pair "[", a comment "{" / ";", an escape "%", or movetext "1."
+const PGN_FIRST_CHARS = new Set(['[', '{', ';', '%', '1', '2', '3', '4', '5', '6', '7', '8', '9']);
+
+function invalidUpload(message) {
+  const error = new Error(message);
+  error.code = INVALID_PGN_UPLOAD;
+  return error;
+}
+
+/**
+ * Inspect the beginning of an upload
+ * @param {Buffer} prefix - First bytes of the file
+ * @returns {'ok'|'undecided'|string} 'undecided' while only whitespace was seen, otherwise 'ok' or an error message
+ */
+function sniffPGN(prefix) {
+  if (prefix.includes(0)) {
+    return 'Uploaded file is binary, not PGN';
+  }
+
+  const text = prefix.toString('utf-8').replace(/^\uFEFF/, '');
+  const firstChar = text.trimStart().charAt(0);
+  if (!firstChar) {
+    return 'undecided';
+  }
+  return PGN_FIRST_CHARS.has(firstChar) ? 'ok' : 'Uploaded file does not look like PGN';
+}
+
+/**
+ * Multer storage engine: memory storage that validates the stream as it arrives
+ */
+class PGNMemoryStorage {
+  _handleFile(req, file, cb) {
+    const chunks = [];
+    let size = 0;
+    let verdict = 'undecided';
+    let scanned = 0; // bytes checked for NUL so far (up to SNIFF_BYTES)
+    let finished = false;
+
+    const finish = (error, info) => {
+      if (finished) return;
+      finished = true;
+      if (error) {
+        // Drain the rest of the upload without keeping it
+        file.stream.resume();
+      }
+      cb(error, info);
+    };
+
+    file.stream.on('data', (chunk) => {
+      if (finished) return;
+      chunks.push(chunk);
+      size += chunk.length;
+
+      // A PGN start in the first chunk does not rule out binary data right after it
+      if (scanned < SNIFF_BYTES) {
+        const window = chunk.subarray(0, SNIFF_BYTES - scanned);
+        scanned += window.length;
+        if (window.includes(0)) {
+          return finish(invalidUpload('Uploaded file is binary, not PGN'));
+        }
+      }
+
+      if (verdict === 'undecided') {
+        verdict = sniffPGN(Buffer.concat(chunks, size).subarray(0, SNIFF_BYTES));
+        if (verdict === 'undecided' && size >= SNIFF_BYTES) {
+          verdict = 'Uploaded file does not look like PGN';
+        }
+        if (verdict !== 'ok' && verdict !== 'undecided') {
+          finish(invalidUpload(verdict));
+        }
+      }
+    });
+
+    file.stream.on('error', finish);
+
+    file.stream.on('end', () => {
+      if (verdict === 'undecided') {
+        return finish(invalidUpload('Uploaded PGN file is empty'));
+      }
+      finish(null, { buffer: Buffer.concat(chunks, size), size });
+    });
+  }
+
+  _removeFile(req, file, cb) {
+    delete file.buffer;
+    cb(null);
+  }
+}
+
+/**
+ * Multer fileFilter: reject files that are neither .pgn nor a PGN/text MIME type
+ * before any of their content is read
+ */
+function pgnFileFilter(req, file, cb) {
+  const extension = path.extname(file.originalname || '').toLowerCase();
+  if (PGN_EXTENSIONS.has(extension) || PGN_MIME_TYPES.has(file.mimetype)) {
+    return cb(null, true);
+  }
+  cb(invalidUpload('Only .pgn files can be uploaded'));
+}
+
+/**
+ * Error handler turning upload errors into JSON client errors
+ * (mount after the upload routes)
+ */
+function handleUploadErrors(err, req, res, next) {
+  if (err instanceof multer.MulterError) {
+    const status = err.code === 'LIMIT_FILE_SIZE' ? 413 : 400;
+    return res.status(status).json({ error: err.message });
+  }
+  if (err && err.code === INVALID_PGN_UPLOAD) {
+    return res.status(400).json({ error: err.message });
+  }
+  next(err);
+}
+
+function pgnMemoryStorage() {
+  return new PGNMemoryStorage();
+}
+
+module.exports = {
+  pgnMemoryStorage,
+  pgnFileFilter,
+  handleUploadErrors,
+  sniffPGN,
+  INVALID_PGN_UPLOAD
+};
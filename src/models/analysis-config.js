@@ -6,19 +6,62 @@
  * Single source of truth to ensure consistency across modules.
  */
 
+const os = require('os');
+
+/**
+ * Non-negative integer from an environment variable, or the fallback when
+ * it is unset or not a number
+ */
+function envCount(name, fallback) {
+  const value = parseInt(process.env[name]);
+  return Number.isFinite(value) && value >= 0 ? value : fallback;
+}
+
+// Positions of a game searched in parallel, each on its own single-threaded engine
+const SEARCH_WORKERS = envCount('STOCKFISH_SEARCH_WORKERS', 0) ||
+  Math.max(1, Math.min(4, os.cpus().length - 1));
+const WARM_POOL_SIZE = envCount('STOCKFISH_WARM_POOL_SIZE', 1);
+
 const AnalysisConfig = {
   /**
    * Stockfish engine settings
    */
   ENGINE: {
-    HASH_MB: process.env.NODE_ENV === 'test' ? 64 : 512,  // Lower for tests, higher for production
-    THREADS: 1,         // Number of threads (1 for determinism)
+    // Hash table size per engine (override with STOCKFISH_HASH_MB). Fixed rather
+    // than derived from the core count, so a position searches the same on every
+    // host (ADR 004) and persisted evaluations stay shareable. Up to
+    // SEARCH_WORKERS + WARM_POOL_SIZE engines each allocate this much.
+    HASH_MB: envCount('STOCKFISH_HASH_MB', 0) || (process.env.NODE_ENV === 'test' ? 64 : 128),
+    // Search threads per engine (override with STOCKFISH_THREADS).
+    // Keep at 1: multi-threaded search is non-deterministic (ADR 004)
+    THREADS: envCount('STOCKFISH_THREADS', 0) || 1,
+    // Pre-warmed engines kept ready so spawn/handshake overlaps the current search
+    // (override with STOCKFISH_WARM_POOL_SIZE; 0 = spawn on demand)
+    WARM_POOL_SIZE,
+    // Override with STOCKFISH_SEARCH_WORKERS; 1 = sequential
+    SEARCH_WORKERS,
+  },
+
+  /**
+   * In-process position evaluation cache (transposition table)
+   * Each search runs on a fresh engine, so a cached result is identical
+   * to re-running the search and determinism is preserved.
+   */
+  EVAL_CACHE: {
+    MAX_ENTRIES: process.env.NODE_ENV === 'test' ? 1000 : 50000,  // LRU cap (~200 bytes per entry)
+    // Also persist evaluations in the engine_eval_cache table so they survive
+    // restarts and are shared across uploads (disable with PERSISTENT_EVAL_CACHE=false)
+    PERSISTENT: process.env.PERSISTENT_EVAL_CACHE !== 'false',
+    // Newest rows kept in engine_eval_cache (~200 bytes each), pruned at startup
+    // and daily (override with PERSISTENT_EVAL_CACHE_MAX_ROWS)
+    PERSISTENT_MAX_ROWS: envCount('PERSISTENT_EVAL_CACHE_MAX_ROWS', 0) || 500000,
   },
 
   /**
    * Analysis depth levels (legacy - use NODES for Lichess compatibility)
    */
   DEPTH: {
+    SCREEN: 8,      // First pass of selective deepening
     QUICK: 12,      // For real-time preview
     STANDARD: 12,   // Default analysis (current)
     DEEP: 18,       // Detailed analysis mode
@@ -33,6 +76,7 @@ const AnalysisConfig = {
    * Nodes provide more predictable evaluation regardless of position complexity.
    */
   NODES: {
+    SCREEN: 30000,      // 30K - First pass of selective deepening
     QUICK: 150000,      // 150K - Fast preview (~autoTutor)
     STANDARD: 300000,   // 300K - Default analysis (~autoHunter) - best speed/accuracy trade-off
     DEEP: 1000000,      // 1M - Detailed analysis (~manualRequest)
@@ -44,6 +88,30 @@ const AnalysisConfig = {
    */
   USE_NODES: true,
 
+  /**
+   * Selective deepening (opt-in)
+   * Screen every position with a cheap search, then re-search at full strength
+   * only the positions around moves whose screening loss reaches THRESHOLD_CP.
+   * Off by default: quiet positions keep screening evaluations, which shifts
+   * accuracy numbers away from Lichess-aligned full-strength analysis (ADR 006).
+   */
+  SELECTIVE_DEEPENING: {
+    ENABLED: process.env.SELECTIVE_DEEPENING === 'true',
+    SCREEN_QUALITY: 'SCREEN',
+    THRESHOLD_CP: 50   // Same as CLASSIFICATION.CP_INACCURACY
+  },
+
+  /**
+   * Opening book: the leading moves of a game that follow a known opening line
+   * (OpeningDetector) are not searched. Only the first position out of book is
+   * searched and book positions take its evaluation, so book moves score 0cp loss.
+   * Off by default: Lichess analyses book moves too (ADR 006).
+   */
+  OPENING_BOOK: {
+    ENABLED: process.env.OPENING_BOOK === 'true',
+    MAX_PLIES: 10   // Longest line OpeningDetector matches
+  },
+
   /**
    * Win probability drop thresholds for move classification
    * Based on Lichess source code:
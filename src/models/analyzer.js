@@ -7,6 +7,8 @@ const TacticalDetector = require('./tactical-detector');
 const WinProbability = require('./win-probability');
 const EvaluationNormalizer = require('./evaluation-normalizer');
 const AnalysisConfig = require('./analysis-config');
+const EnginePool = require('./engine-pool');
+const openingDetector = require('./opening-detector');
 
 class ChessAnalyzer {
   constructor() {
@@ -17,9 +19,21 @@ class ChessAnalyzer {
     this.isAnalyzing = false;
     this.activeProcesses = new Set(); // Track all active Stockfish processes
     this.timeouts = new Set(); // Track all active timeouts
+    this.evaluationCache = new Map(); // LRU transposition table: position + search limit -> evaluation
+    this.enginePool = new EnginePool(); // Pre-warmed single-use engines for position searches
+    this.persistentCache = null; // Database backing the evaluation cache across restarts (see setPersistentCache)
+    this.engineName = null; // Reported by Stockfish ("id name ..."), part of the persistent cache key
     this.setupEngine();
   }
 
+  /**
+   * Persist evaluations in the database in addition to the in-process cache
+   * @param {Database} database - Database with getCachedEngineEvaluation/storeCachedEngineEvaluation
+   */
+  setPersistentCache(database) {
+    this.persistentCache = AnalysisConfig.EVAL_CACHE.PERSISTENT ? database : null;
+  }
+
   /**
    * Get evaluation options based on config
    * Uses nodes-based analysis if USE_NODES is true (Lichess-compatible)
@@ -72,11 +86,15 @@ class ChessAnalyzer {
       // Set up event handlers BEFORE sending any commands
       this.engine.stdout.on('data', (data) => {
         const output = data.toString();
+        const idMatch = output.match(/^id name (.+)$/m);
+        if (idMatch) {
+          this.engineName = idMatch[1].trim();
+        }
         if (output.includes('uciok')) {
           // Engine acknowledged UCI protocol
-          // Set Threads to 1 for deterministic analysis results
-          console.log('🔧 [DETERMINISM] Setting Threads=1 for deterministic analysis');
-          this.engine.stdin.write('setoption name Threads value 1\n');
+          // Threads from config (1 by default for deterministic analysis results)
+          console.log(`🔧 [DETERMINISM] Setting Threads=${AnalysisConfig.ENGINE.THREADS}`);
+          this.engine.stdin.write(`setoption name Threads value ${AnalysisConfig.ENGINE.THREADS}\n`);
           // Set Hash size from config for better evaluation quality
           console.log(`🔧 [CONFIG] Setting Hash=${AnalysisConfig.ENGINE.HASH_MB}MB`);
           this.engine.stdin.write(`setoption name Hash value ${AnalysisConfig.ENGINE.HASH_MB}\n`);
@@ -85,7 +103,7 @@ class ChessAnalyzer {
         }
         if (output.includes('readyok')) {
           this.isReady = true;
-          console.log('✅ Real Stockfish engine ready (deterministic mode: Threads=1)');
+          console.log(`✅ Real Stockfish engine ready (Threads=${AnalysisConfig.ENGINE.THREADS})`);
         }
       });
 
@@ -173,7 +191,8 @@ class ChessAnalyzer {
         throw new Error('No moves provided for analysis');
       }
 
-      if (!this.isReady) {
+      // After close() there is no engine; it is restarted below
+      if (!this.isReady && this.engine) {
         throw new Error('Stockfish engine not ready');
       }
 
@@ -225,26 +244,32 @@ class ChessAnalyzer {
       // Get evaluation options based on config
       const evalOptions = this.getEvalOptions('STANDARD');
 
+      // Every position of the mainline is an independent search, so search them all
+      // up front across parallel engines. The position after a move is the next
+      // move's "before" position, so each distinct position is searched only once.
+      const positions = this._collectPositions(moves);
+      const evaluations = await this._evaluateMainline(moves, positions, evalOptions);
+      const prefetchedAlternatives = fetchAlternatives
+        ? await this._searchPositions(
+          positions.slice(0, -1).filter(fen => !evaluations.get(fen)?.book),
+          fen => this.generateAlternatives(fen, evalOptions, 10))
+        : new Map();
+
       for (let i = 0; i < moves.length; i++) {
         const move = moves[i];
 
         try {
-          // Small delay between moves for better analysis quality
-          if (i > 0) {
-            await new Promise(resolve => setTimeout(resolve, 100));
-          }
-
           // Get position before move
           const beforeFen = chess.fen();
 
           // Get best move evaluation before the actual move
-          const beforeEval = await this.evaluatePosition(beforeFen, evalOptions);
+          const beforeEval = evaluations.get(beforeFen) || await this.evaluatePosition(beforeFen, evalOptions);
 
           // Fetch up to 10 alternative moves for each position
+          // (book positions only offer the book move)
           let alternatives = [];
-          if (fetchAlternatives) {
-            console.log(`🔄 Fetching alternatives for move ${i + 1}...`);
-            alternatives = await this.generateAlternatives(beforeFen, evalOptions, 10);
+          if (fetchAlternatives && !beforeEval.book) {
+            alternatives = prefetchedAlternatives.get(beforeFen) || await this.generateAlternatives(beforeFen, evalOptions, 10);
             console.log(`✅ Found ${alternatives.length} alternatives for move ${i + 1}`);
           } else {
             // Fallback to just the best move - convert UCI to SAN
@@ -286,14 +311,15 @@ class ChessAnalyzer {
 
           // Get evaluation after the move
           const afterFen = chess.fen();
-          const afterEval = await this.evaluatePosition(afterFen, evalOptions);
+          const afterEval = evaluations.get(afterFen) || await this.evaluatePosition(afterFen, evalOptions);
+          const [beforeScore, afterScore] = this._pairedScores(beforeEval, afterEval);
 
           // Calculate centipawn loss using direct evaluation comparison (most accurate)
           const isWhiteMove = i % 2 === 0;
           let centipawnLoss = 0;
           
           // Use direct evaluation comparison as primary method
-          const rawCentipawnLoss = this.calculateCentipawnLoss(beforeEval.evaluation, afterEval.evaluation, isWhiteMove);
+          const rawCentipawnLoss = this.calculateCentipawnLoss(beforeScore, afterScore, isWhiteMove);
           centipawnLoss = rawCentipawnLoss;
           
           // Alternative method: compare with best alternative (for validation/debugging)
@@ -324,8 +350,8 @@ class ChessAnalyzer {
           // Stockfish returns eval from side-to-move's perspective
           // Before move: mover's turn, so beforeEval is from mover's perspective
           // After move: opponent's turn, so afterEval is from opponent's perspective
-          const evalBeforeWhite = EvaluationNormalizer.toWhitePerspective(beforeEval.evaluation, isWhiteMove);
-          const evalAfterWhite = EvaluationNormalizer.toWhitePerspective(afterEval.evaluation, !isWhiteMove);
+          const evalBeforeWhite = EvaluationNormalizer.toWhitePerspective(beforeScore, isWhiteMove);
+          const evalAfterWhite = EvaluationNormalizer.toWhitePerspective(afterScore, !isWhiteMove);
 
           // Calculate per-move accuracy and win probabilities using win-probability algorithm (ADR 005)
           // Win probability should be calculated from the mover's perspective for accuracy
@@ -557,37 +583,301 @@ class ChessAnalyzer {
     }
   }
 
+  /**
+   * Replay the mainline once and return every distinct position in move order
+   * (starting position plus the position after each legal move)
+   * @param {Array<string>} moves - SAN moves
+   * @returns {Array<string>} FENs
+   */
+  _collectPositions(moves) {
+    const chess = new Chess();
+    const fens = new Set([chess.fen()]);
+
+    for (const move of moves) {
+      try {
+        chess.move(move);
+        fens.add(chess.fen());
+      } catch (error) {
+        // Invalid moves are skipped by the analysis loop as well
+      }
+    }
+
+    return [...fens];
+  }
+
+  /**
+   * Run a search for each position with up to ENGINE.SEARCH_WORKERS searches in flight.
+   * Every search runs on its own fresh single-threaded engine, so results do not
+   * depend on scheduling order (ADR 004). Failed searches are left out of the map
+   * and retried by the caller, which reports the error per move.
+   * @param {Array<string>} fens - Positions to search
+   * @param {Function} search - fen => Promise<result>
+   * @returns {Promise<Map<string, *>>} FEN -> result
+   */
+  async _searchPositions(fens, search) {
+    const results = new Map();
+    const workers = Math.max(1, Math.min(AnalysisConfig.ENGINE.SEARCH_WORKERS, fens.length));
+    let next = 0;
+
+    const worker = async () => {
+      while (next < fens.length) {
+        const fen = fens[next++];
+        try {
+          results.set(fen, await search(fen));
+        } catch (error) {
+          console.warn(`⚠️ Search failed for position ${fen}:`, error.message);
+        }
+      }
+    };
+
+    await Promise.all(Array.from({ length: workers }, worker));
+    return results;
+  }
+
+  /**
+   * Evaluate every position of the mainline.
+   *
+   * With SELECTIVE_DEEPENING enabled, all positions are first screened with a cheap
+   * search and only the positions around moves that look like an inaccuracy or worse
+   * are searched again at full strength. Quiet positions keep their screening
+   * evaluation; re-searched positions also keep it as screenEvaluation, so a
+   * move next to a re-searched one is scored from two screening evaluations
+   * (see _pairedScores). Both passes are fixed-limit searches on fresh engines,
+   * so the result is still deterministic.
+   * @param {Array<string>} moves - SAN moves
+   * @param {Array<string>} positions - Distinct FENs from _collectPositions()
+   * @param {Object} evalOptions - Full-strength search limit
+   * @returns {Promise<Map<string, Object>>} FEN -> evaluation
+   */
+  async _evaluateMainline(moves, positions, evalOptions) {
+    const book = this._openingBookLine(moves);
+    if (book) {
+      const bookFens = new Set(book.fens);
+      positions = positions.filter(fen => !bookFens.has(fen));
+      console.log(`📖 [BOOK] Skipping ${book.fens.length} opening book positions`);
+    }
+
+    const deepening = AnalysisConfig.SELECTIVE_DEEPENING;
+    if (!deepening.ENABLED) {
+      const evaluations = await this._searchPositions(positions, fen => this.evaluatePosition(fen, evalOptions));
+      if (book) this._applyOpeningBook(evaluations, book);
+      return evaluations;
+    }
+
+    const screenOptions = this.getEvalOptions(deepening.SCREEN_QUALITY);
+    const evaluations = await this._searchPositions(positions, fen => this.evaluatePosition(fen, screenOptions));
+    if (book) this._applyOpeningBook(evaluations, book);
+
+    // Both sides of every move whose screening loss reaches the threshold
+    const critical = new Set();
+    const chess = new Chess();
+    for (let i = 0; i < moves.length; i++) {
+      const beforeFen = chess.fen();
+      try {
+        chess.move(moves[i]);
+      } catch (error) {
+        continue;
+      }
+      const afterFen = chess.fen();
+      const beforeEval = evaluations.get(beforeFen);
+      const afterEval = evaluations.get(afterFen);
+
+      if (!beforeEval || !afterEval ||
+          this.calculateCentipawnLoss(beforeEval.evaluation, afterEval.evaluation, i % 2 === 0) >= deepening.THRESHOLD_CP) {
+        critical.add(beforeFen);
+        critical.add(afterFen);
+      }
+    }
+
+    const deepened = await this._searchPositions([...critical], fen => this.evaluatePosition(fen, evalOptions));
+    deepened.forEach((evaluation, fen) => {
+      const screenEval = evaluations.get(fen);
+      evaluations.set(fen, screenEval && !screenEval.book
+        ? { ...evaluation, screenEvaluation: screenEval.evaluation }
+        : evaluation);
+    });
+    if (book) this._applyOpeningBook(evaluations, book);
+
+    console.log(`🔬 [DEEPENING] Re-searched ${deepened.size}/${positions.length} positions at full strength`);
+    return evaluations;
+  }
+
+  /**
+   * Scores of a move's positions searched at the same limit. With selective
+   * deepening, a move next to a re-searched move can have one full-strength
+   * and one screening evaluation; comparing those would report a loss that is
+   * only the difference between the two search limits, so both screening
+   * scores are used instead.
+   * @param {Object} beforeEval - Evaluation before the move
+   * @param {Object} afterEval - Evaluation after the move
+   * @returns {Array<number>} [before, after] scores, each from its side to move
+   */
+  _pairedScores(beforeEval, afterEval) {
+    const beforeDeepened = beforeEval.screenEvaluation !== undefined;
+    const afterDeepened = afterEval.screenEvaluation !== undefined;
+    if (beforeDeepened === afterDeepened) {
+      return [beforeEval.evaluation, afterEval.evaluation];
+    }
+    return [
+      beforeDeepened ? beforeEval.screenEvaluation : beforeEval.evaluation,
+      afterDeepened ? afterEval.screenEvaluation : afterEval.evaluation
+    ];
+  }
+
+  /**
+   * Leading moves of the game that follow a known opening line (OPENING_BOOK)
+   * @param {Array<string>} moves - SAN moves
+   * @returns {{fens: Array<string>, bookMoves: Array<string>, exitFen: string}|null}
+   *   Position before each book move, the book moves in UCI, and the first position out of book
+   */
+  _openingBookLine(moves) {
+    const book = AnalysisConfig.OPENING_BOOK;
+    if (!book.ENABLED) return null;
+
+    let plies = 0;
+    for (let depth = Math.min(book.MAX_PLIES, moves.length); depth > 0; depth--) {
+      if (openingDetector.openings.has(moves.slice(0, depth).join(' '))) {
+        plies = depth;
+        break;
+      }
+    }
+    if (plies === 0) return null;
+
+    const chess = new Chess();
+    const fens = [];
+    const bookMoves = [];
+    for (let i = 0; i < plies; i++) {
+      fens.push(chess.fen());
+      const moveResult = chess.move(moves[i]);
+      bookMoves.push(moveResult.from + moveResult.to + (moveResult.promotion || ''));
+    }
+
+    return { fens, bookMoves, exitFen: chess.fen() };
+  }
+
+  /**
+   * Give every book position the evaluation of the first position out of book,
+   * from its own side to move. If that search failed, book positions stay
+   * missing and are searched by the caller like any other failed search.
+   */
+  _applyOpeningBook(evaluations, book) {
+    const exitEval = evaluations.get(book.exitFen);
+    if (!exitEval) return;
+
+    book.fens.forEach((fen, i) => {
+      const sign = (book.fens.length - i) % 2 === 0 ? 1 : -1;
+      const bookEval = {
+        bestMove: book.bookMoves[i],
+        evaluation: sign * exitEval.evaluation,
+        book: true
+      };
+      if (exitEval.screenEvaluation !== undefined) {
+        bookEval.screenEvaluation = sign * exitEval.screenEvaluation;
+      }
+      evaluations.set(fen, bookEval);
+    });
+  }
+
   async evaluatePosition(fen, depthOrOptions = 12) {
     // Support both legacy depth parameter and new options object
     const options = typeof depthOrOptions === 'object' 
       ? depthOrOptions 
       : { depth: depthOrOptions };
-    
-    return this._evaluateWithFreshEngine(fen, options);
+
+    const cacheKey = this._evaluationCacheKey(fen, options);
+    const cached = this.evaluationCache.get(cacheKey);
+    if (cached) {
+      // Refresh LRU position
+      this.evaluationCache.delete(cacheKey);
+      this.evaluationCache.set(cacheKey, cached);
+      return { ...cached };
+    }
+
+    const persistentKey = this._persistentCacheKey(cacheKey);
+    if (persistentKey) {
+      try {
+        const stored = await this.persistentCache.getCachedEngineEvaluation(persistentKey);
+        if (stored) {
+          this._cacheEvaluation(cacheKey, stored);
+          return { ...stored };
+        }
+      } catch (error) {
+        console.warn('⚠️ Persistent evaluation cache lookup failed:', error.message);
+      }
+    }
+
+    const result = await this._evaluateWithFreshEngine(fen, options);
+
+    // Only cache completed searches (timeouts/crashes return a fallback result)
+    if (!result.incomplete) {
+      this._cacheEvaluation(cacheKey, result);
+      if (persistentKey) {
+        this.persistentCache.storeCachedEngineEvaluation(persistentKey, result)
+          .catch(error => console.warn('⚠️ Failed to persist evaluation:', error.message));
+      }
+    }
+
+    return result;
+  }
+
+  /**
+   * Key for the persistent cache: the in-process key plus the engine identity,
+   * since results are only reproducible with the same binary and settings.
+   * Returns null (no persistence) until the engine has reported its name.
+   */
+  _persistentCacheKey(cacheKey) {
+    if (!this.persistentCache || !this.engineName) return null;
+    const { HASH_MB, THREADS } = AnalysisConfig.ENGINE;
+    return `${cacheKey}|${this.engineName}|hash ${HASH_MB}|threads ${THREADS}`;
+  }
+
+  /**
+   * Build the transposition table key for a position and search limit.
+   * The fullmove counter is dropped: it never affects a fixed depth/nodes
+   * search, so transpositions reached at a different move number share an
+   * entry. The halfmove clock stays because it drives the 50-move rule.
+   */
+  _evaluationCacheKey(fen, options = {}) {
+    const limit = options.nodes ? `nodes ${options.nodes}` : `depth ${options.depth || 12}`;
+    const lastSpace = fen.lastIndexOf(' ');
+    const position = lastSpace > 0 ? fen.slice(0, lastSpace) : fen;
+    return `${position}|${limit}`;
+  }
+
+  /**
+   * Store an evaluation, evicting the least recently used entry when full
+   */
+  _cacheEvaluation(cacheKey, result) {
+    const maxEntries = AnalysisConfig.EVAL_CACHE.MAX_ENTRIES;
+    if (maxEntries <= 0) return;
+
+    this.evaluationCache.set(cacheKey, { bestMove: result.bestMove, evaluation: result.evaluation });
+    if (this.evaluationCache.size > maxEntries) {
+      const oldestKey = this.evaluationCache.keys().next().value;
+      this.evaluationCache.delete(oldestKey);
+    }
   }
 
   async _evaluateWithFreshEngine(fen, options = {}) {
     const { depth = 12, nodes = null } = options;
-    
+
+    // Fresh (never used) Stockfish instance that has already completed the UCI handshake
+    const engine = await this.enginePool.acquire();
+
     return new Promise((resolve, reject) => {
-      // Spawn fresh Stockfish instance
-      const { spawn } = require('child_process');
-      const engine = spawn('stockfish');
-      
       // Track this process
       this.activeProcesses.add(engine);
-      
+
       let bestMove = '';
       let evaluation = 0;
       let resolved = false;
-      let engineReady = false;
       
       const timeout = setTimeout(() => {
         if (!resolved) {
           engine.kill();
           this.activeProcesses.delete(engine);
           resolved = true;
-          resolve({ bestMove: bestMove || 'e4', evaluation });
+          resolve({ bestMove: bestMove || 'e4', evaluation, incomplete: true });
         }
       }, 10000);
       
@@ -598,25 +888,6 @@ class ChessAnalyzer {
         const lines = output.split('\n');
         
         for (const line of lines) {
-          if (line.includes('uciok')) {
-            // Engine acknowledged UCI protocol
-            engine.stdin.write('setoption name Threads value 1\n');
-            engine.stdin.write(`setoption name Hash value ${AnalysisConfig.ENGINE.HASH_MB}\n`);
-            engine.stdin.write('isready\n');
-          }
-          
-          if (line.includes('readyok') && !engineReady) {
-            engineReady = true;
-            // Engine is ready, start analysis
-            engine.stdin.write(`position fen ${fen}\n`);
-            // Use nodes-based analysis if specified (Lichess-compatible), otherwise depth
-            if (nodes) {
-              engine.stdin.write(`go nodes ${nodes}\n`);
-            } else {
-              engine.stdin.write(`go depth ${depth}\n`);
-            }
-          }
-          
           if (line.startsWith('bestmove') && !resolved) {
             bestMove = line.split(' ')[1] || 'e4';
             clearTimeout(timeout);
@@ -663,12 +934,18 @@ class ChessAnalyzer {
           clearTimeout(timeout);
           this.timeouts.delete(timeout);
           resolved = true;
-          resolve({ bestMove: bestMove || 'e4', evaluation });
+          resolve({ bestMove: bestMove || 'e4', evaluation, incomplete: true });
         }
       });
 
-      // Start UCI protocol
-      engine.stdin.write('uci\n');
+      // Engine is ready, start analysis
+      engine.stdin.write(`position fen ${fen}\n`);
+      // Use nodes-based analysis if specified (Lichess-compatible), otherwise depth
+      if (nodes) {
+        engine.stdin.write(`go nodes ${nodes}\n`);
+      } else {
+        engine.stdin.write(`go depth ${depth}\n`);
+      }
     });
   }
 
@@ -710,6 +987,11 @@ class ChessAnalyzer {
   }
 
   async close() {
+    // Stop warming new engines. The replacement pool spawns nothing until the
+    // next search, so a closed analyzer can still be reused.
+    this.enginePool.close();
+    this.enginePool = new EnginePool();
+
     // Clear all timeouts first
     for (const timeout of this.timeouts) {
       clearTimeout(timeout);
@@ -736,6 +1018,7 @@ class ChessAnalyzer {
       }
     }
     this.activeProcesses.clear();
+    this.evaluationCache.clear();
 
     // Wait a bit for processes to close
     await new Promise(resolve => setTimeout(resolve, 100));
@@ -755,18 +1038,17 @@ class ChessAnalyzer {
     const analysis = [];
     let totalCentipawnLoss = 0;
     const blunders = [];
-    
+    const evalOptions = this.getEvalOptions('STANDARD');
+
+    // Search every distinct position of the mainline up front across parallel engines
+    const evaluations = await this._evaluateMainline(moves, this._collectPositions(moves), evalOptions);
+
     for (let i = 0; i < moves.length; i++) {
       const move = moves[i];
-      
+
       try {
-        if (i > 0) {
-          await new Promise(resolve => setTimeout(resolve, 100));
-        }
-        
         const beforeFen = chess.fen();
-        const evalOptions = this.getEvalOptions('STANDARD');
-        const beforeEval = await this.evaluatePosition(beforeFen, evalOptions);
+        const beforeEval = evaluations.get(beforeFen) || await this.evaluatePosition(beforeFen, evalOptions);
         
         // Generate alternatives for significant positions
         let alternatives = [];
@@ -781,16 +1063,17 @@ class ChessAnalyzer {
         }
         
         const afterFen = chess.fen();
-        const afterEval = await this.evaluatePosition(afterFen, evalOptions);
-        
+        const afterEval = evaluations.get(afterFen) || await this.evaluatePosition(afterFen, evalOptions);
+        const [beforeScore, afterScore] = this._pairedScores(beforeEval, afterEval);
+
         const isWhiteMove = i % 2 === 0;
-        const centipawnLoss = this.calculateCentipawnLoss(beforeEval.evaluation, afterEval.evaluation, isWhiteMove);
+        const centipawnLoss = this.calculateCentipawnLoss(beforeScore, afterScore, isWhiteMove);
         const cappedCentipawnLoss = Math.min(centipawnLoss, 500);
         const isBlunder = cappedCentipawnLoss > 200;
 
         // ADR 006: Normalize evaluations to White's perspective
-        const evalBeforeWhite = EvaluationNormalizer.toWhitePerspective(beforeEval.evaluation, isWhiteMove);
-        const evalAfterWhite = EvaluationNormalizer.toWhitePerspective(afterEval.evaluation, !isWhiteMove);
+        const evalBeforeWhite = EvaluationNormalizer.toWhitePerspective(beforeScore, isWhiteMove);
+        const evalAfterWhite = EvaluationNormalizer.toWhitePerspective(afterScore, !isWhiteMove);
         const evalBeforeMover = EvaluationNormalizer.toMoverPerspective(evalBeforeWhite, isWhiteMove);
         const evalAfterMover = EvaluationNormalizer.toMoverPerspective(evalAfterWhite, isWhiteMove);
 
@@ -879,19 +1162,17 @@ class ChessAnalyzer {
 
   async _generateAlternativesWithFreshEngine(fen, options, maxAlternatives) {
     const { depth = 12, nodes = null } = options;
-    
+
+    // Fresh (never used) Stockfish instance that has already completed the UCI handshake
+    const engine = await this.enginePool.acquire();
+
     return new Promise((resolve, reject) => {
-      // Spawn fresh Stockfish instance
-      const { spawn } = require('child_process');
-      const engine = spawn('stockfish');
-      
       // Track this process
       this.activeProcesses.add(engine);
-      
+
       const alternatives = [];
       let resolved = false;
       let lastDepthSeen = 0;
-      let engineReady = false;
 
       // Create a chess instance for UCI to SAN conversion
       const { Chess } = require('chess.js');
@@ -914,26 +1195,6 @@ class ChessAnalyzer {
         const lines = output.split('\n');
 
         for (const line of lines) {
-          if (line.includes('uciok')) {
-            // Engine acknowledged UCI protocol
-            engine.stdin.write('setoption name Threads value 1\n');
-            engine.stdin.write(`setoption name Hash value ${AnalysisConfig.ENGINE.HASH_MB}\n`);
-            engine.stdin.write(`setoption name MultiPV value ${maxAlternatives}\n`);
-            engine.stdin.write('isready\n');
-          }
-          
-          if (line.includes('readyok') && !engineReady) {
-            engineReady = true;
-            // Engine is ready, start analysis
-            engine.stdin.write(`position fen ${fen}\n`);
-            // Use nodes-based analysis if specified (Lichess-compatible), otherwise depth
-            if (nodes) {
-              engine.stdin.write(`go nodes ${nodes}\n`);
-            } else {
-              engine.stdin.write(`go depth ${depth}\n`);
-            }
-          }
-
           // Look for multipv lines with score cp or score mate
           const cpMatch = line.match(/info.*depth (\d+).*multipv (\d+).*score cp (-?\d+).*pv (.+)/);
           const mateMatch = line.match(/info.*depth (\d+).*multipv (\d+).*score mate (-?\d+).*pv (.+)/);
@@ -1101,8 +1362,15 @@ class ChessAnalyzer {
         }
       });
 
-      // Start UCI protocol
-      engine.stdin.write('uci\n');
+      // Engine is ready, start analysis
+      engine.stdin.write(`setoption name MultiPV value ${maxAlternatives}\n`);
+      engine.stdin.write(`position fen ${fen}\n`);
+      // Use nodes-based analysis if specified (Lichess-compatible), otherwise depth
+      if (nodes) {
+        engine.stdin.write(`go nodes ${nodes}\n`);
+      } else {
+        engine.stdin.write(`go depth ${depth}\n`);
+      }
     });
   }
 }
@@ -3,6 +3,19 @@ const fs = require('fs');
 const db = require('../config/database');
 const { TARGET_PLAYER } = require('../config/app-config');
 
+// Bound parameters per INSERT statement (SQLITE_MAX_VARIABLE_NUMBER on older builds)
+const MAX_INSERT_PARAMS = 999;
+
+// Serialized game analysis bodies kept in memory (a few hundred KB each at most)
+const ANALYSIS_JSON_CACHE_SIZE = 100;
+
+const ANALYSIS_COLUMNS = [
+  'game_id', 'move_number', 'move', 'evaluation', 'centipawn_loss', 'best_move', 'alternatives',
+  'is_blunder', 'is_mistake', 'is_inaccuracy', 'fen_before', 'fen_after', 'time_spent', 'time_remaining',
+  'move_quality', 'move_accuracy', 'win_probability_before', 'win_probability_after',
+  'is_best', 'is_excellent', 'is_good'
+];
+
 class Database {
   constructor() {
     // Use different database for testing vs development
@@ -11,6 +24,7 @@ class Database {
     this.dbPath = path.join(__dirname, '../../data', dbFileName);
     this.db = db; // Use the dual database layer
     this.usePostgres = !!process.env.DATABASE_URL;
+    this.analysisJSONCache = new Map(); // gameId -> { version, json }
     this.ensureDataDirectory();
   }
 
@@ -212,6 +226,58 @@ class Database {
     }
   }
 
+  /**
+   * Run fn in a transaction (rolled back if it throws).
+   * fn receives this Database bound to the transaction's connection, so the
+   * usual methods (run, get, all, insertRows, ...) can be called on it.
+   * Nested calls join the outer transaction.
+   * @param {Function} fn - async (tx) => result
+   * @returns {Promise<*>} Result of fn
+   */
+  async transaction(fn) {
+    if (this.inTransaction) return fn(this);
+
+    return this.db.transaction(txDb => {
+      const tx = Object.create(this);
+      tx.db = txDb;
+      tx.inTransaction = true;
+      return fn(tx);
+    });
+  }
+
+  /**
+   * Insert many rows with multi-row VALUES statements instead of one
+   * round trip per row. Rows are chunked to stay under the bound parameter limit;
+   * a batch that needs several statements is written in one transaction, so a
+   * failing chunk does not leave the earlier chunks behind.
+   * @param {string} table - Table name
+   * @param {Array<string>} columns - Column names
+   * @param {Array<Array>} rows - Row values, in column order
+   * @returns {Promise<number>} Number of rows inserted
+   */
+  async insertRows(table, columns, rows) {
+    if (!rows || rows.length === 0) return 0;
+
+    const rowsPerStatement = Math.max(1, Math.floor(MAX_INSERT_PARAMS / columns.length));
+    const placeholder = `(${columns.map(() => '?').join(', ')})`;
+
+    const insertChunks = async (target) => {
+      for (let start = 0; start < rows.length; start += rowsPerStatement) {
+        const chunk = rows.slice(start, start + rowsPerStatement);
+        const sql = `INSERT INTO ${table} (${columns.join(', ')}) VALUES ${chunk.map(() => placeholder).join(', ')}`;
+        await target.run(sql, chunk.flat());
+      }
+    };
+
+    if (rows.length > rowsPerStatement) {
+      await this.transaction(insertChunks);
+    } else {
+      await insertChunks(this);
+    }
+
+    return rows.length;
+  }
+
   // Game operations (updated for database storage)
   async insertGame(gameData, pgnContent = null) {
     const contentHash = pgnContent ?
@@ -278,18 +344,8 @@ class Database {
   }
 
   // Analysis operations
-  async insertAnalysis(gameId, analysisData) {
-    const sql = `
-      INSERT INTO analysis (
-        game_id, move_number, move, evaluation, centipawn_loss, best_move, alternatives,
-        is_blunder, is_mistake, is_inaccuracy, fen_before, fen_after, time_spent, time_remaining,
-        move_quality, move_accuracy, win_probability_before, win_probability_after,
-        is_best, is_excellent, is_good
-      )
-      VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    `;
-
-    const params = [
+  _analysisParams(gameId, analysisData) {
+    return [
       gameId,
       analysisData.move_number || 1,
       analysisData.move || '',
@@ -313,23 +369,61 @@ class Database {
       analysisData.is_excellent || false,
       analysisData.is_good || false
     ];
+  }
+
+  _shouldStoreBlunderDetails(analysisData) {
+    return (analysisData.is_blunder || analysisData.is_mistake || analysisData.is_inaccuracy) &&
+      analysisData.categorization &&
+      analysisData.fen_before;
+  }
+
+  async _insertBlunderDetailsSafely(gameId, analysisData) {
+    try {
+      await this.insertBlunderDetails(gameId, analysisData);
+    } catch (error) {
+      console.warn(`Failed to insert blunder details for game ${gameId}, move ${analysisData.move_number}:`, error.message);
+    }
+  }
+
+  async insertAnalysis(gameId, analysisData) {
+    const sql = `
+      INSERT INTO analysis (${ANALYSIS_COLUMNS.join(', ')})
+      VALUES (${ANALYSIS_COLUMNS.map(() => '?').join(', ')})
+    `;
 
-    const result = await this.run(sql, params);
+    const result = await this.run(sql, this._analysisParams(gameId, analysisData));
 
     // If this is a poor move with categorization data, save to blunder_details
-    if ((analysisData.is_blunder || analysisData.is_mistake || analysisData.is_inaccuracy) &&
-        analysisData.categorization &&
-        analysisData.fen_before) {
-      try {
-        await this.insertBlunderDetails(gameId, analysisData);
-      } catch (error) {
-        console.warn(`Failed to insert blunder details for game ${gameId}, move ${analysisData.move_number}:`, error.message);
-      }
+    if (this._shouldStoreBlunderDetails(analysisData)) {
+      await this._insertBlunderDetailsSafely(gameId, analysisData);
     }
 
     return result;
   }
 
+  /**
+   * Insert the analysis of every move of a game using multi-row inserts.
+   * Blunder details are still written per poor move (only a handful per game).
+   * @param {number} gameId - Game ID
+   * @param {Array} analysisRows - Move analysis objects
+   * @returns {Promise<number>} Number of analysis rows inserted
+   */
+  async insertAnalysisBatch(gameId, analysisRows) {
+    const inserted = await this.insertRows(
+      'analysis',
+      ANALYSIS_COLUMNS,
+      analysisRows.map(analysisData => this._analysisParams(gameId, analysisData))
+    );
+
+    for (const analysisData of analysisRows) {
+      if (this._shouldStoreBlunderDetails(analysisData)) {
+        await this._insertBlunderDetailsSafely(gameId, analysisData);
+      }
+    }
+
+    return inserted;
+  }
+
   async insertBlunderDetails(gameId, analysisData) {
     const categorization = analysisData.categorization;
 
@@ -672,12 +766,27 @@ class Database {
 
   // Alternative moves methods
   async storeAlternativeMoves(gameId, moveNumber, alternatives) {
-    for (const alt of alternatives) {
-      await this.run(`
-        INSERT INTO alternative_moves (game_id, move_number, alternative_move, evaluation, depth, line_moves)
-        VALUES (?, ?, ?, ?, ?, ?)
-      `, [gameId, moveNumber, alt.move, alt.evaluation, alt.depth || 15, alt.line ? alt.line.join(' ') : null]);
+    await this.storeAlternativeMovesBatch(gameId, [{ moveNumber, alternatives }]);
+  }
+
+  /**
+   * Store alternatives for many moves of a game using multi-row inserts
+   * @param {number} gameId - Game ID
+   * @param {Array<{moveNumber: number, alternatives: Array}>} moves - Alternatives per move
+   */
+  async storeAlternativeMovesBatch(gameId, moves) {
+    const rows = [];
+    for (const { moveNumber, alternatives } of moves) {
+      for (const alt of alternatives) {
+        rows.push([gameId, moveNumber, alt.move, alt.evaluation, alt.depth || 15, alt.line ? alt.line.join(' ') : null]);
+      }
     }
+
+    return await this.insertRows(
+      'alternative_moves',
+      ['game_id', 'move_number', 'alternative_move', 'evaluation', 'depth', 'line_moves'],
+      rows
+    );
   }
 
   async getAlternativeMoves(gameId, moveNumber, userId = 'default_user') {
@@ -697,6 +806,64 @@ class Database {
     `, [gameId, moveNumber, fen, evaluation, bestMove, depth, mateIn]);
   }
 
+  /**
+   * Store many position evaluations of a game using multi-row inserts
+   * @param {number} gameId - Game ID
+   * @param {Array<{moveNumber, fen, evaluation, bestMove, depth, mateIn}>} evaluations
+   */
+  async storePositionEvaluationsBatch(gameId, evaluations) {
+    return await this.insertRows(
+      'position_evaluations',
+      ['game_id', 'move_number', 'fen', 'evaluation', 'best_move', 'depth', 'mate_in'],
+      evaluations.map(e => [gameId, e.moveNumber, e.fen, e.evaluation, e.bestMove, e.depth, e.mateIn ?? null])
+    );
+  }
+
+  /**
+   * Get a persisted engine evaluation (shared across users and games)
+   * @param {string} cacheKey - Position + search limit + engine key
+   * @returns {Promise<{bestMove, evaluation}|null>}
+   */
+  async getCachedEngineEvaluation(cacheKey) {
+    const row = await this.get(
+      'SELECT best_move, evaluation FROM engine_eval_cache WHERE cache_key = ?',
+      [cacheKey]
+    );
+    return row ? { bestMove: row.best_move, evaluation: row.evaluation } : null;
+  }
+
+  /**
+   * Persist an engine evaluation; an existing entry for the key is kept
+   * @param {string} cacheKey - Position + search limit + engine key
+   * @param {Object} result - { bestMove, evaluation }
+   */
+  async storeCachedEngineEvaluation(cacheKey, { bestMove, evaluation }) {
+    await this.run(
+      'INSERT INTO engine_eval_cache (cache_key, best_move, evaluation) VALUES (?, ?, ?) ON CONFLICT (cache_key) DO NOTHING',
+      [cacheKey, bestMove, evaluation]
+    );
+  }
+
+  /**
+   * Keep only the newest maxRows persisted engine evaluations.
+   * Old entries are dropped first; a position that is still common is simply
+   * searched and stored again the next time it comes up.
+   * @param {number} maxRows - Rows to keep
+   * @returns {Promise<number>} Number of rows deleted
+   */
+  async pruneEngineEvalCache(maxRows) {
+    const result = await this.run(`
+      DELETE FROM engine_eval_cache
+      WHERE id <= (SELECT id FROM engine_eval_cache ORDER BY id DESC LIMIT 1 OFFSET ?)
+    `, [maxRows]);
+
+    const deleted = result?.changes || 0;
+    if (deleted > 0) {
+      console.log(`🧹 Pruned ${deleted} old engine evaluations (keeping ${maxRows})`);
+    }
+    return deleted;
+  }
+
   async getPositionEvaluation(gameId, moveNumber, userId = 'default_user') {
     return await this.get(`
       SELECT pe.* FROM position_evaluations pe
@@ -705,7 +872,7 @@ class Database {
     `, [gameId, moveNumber, userId]);
   }
 
-  async getGameAnalysis(gameId, userId = 'default_user') {
+  async _getGameAnalysisRows(gameId, userId) {
     const game = await this.get('SELECT * FROM games WHERE id = ? AND user_id = ?', [gameId, userId]);
     if (!game) return null;
 
@@ -716,13 +883,77 @@ class Database {
       ORDER BY a.move_number
     `, [gameId, userId]);
 
+    return { game, analysis };
+  }
+
+  async getGameAnalysis(gameId, userId = 'default_user') {
+    const rows = await this._getGameAnalysisRows(gameId, userId);
+    if (!rows) return null;
+
     // Parse JSON fields
-    const parsedAnalysis = analysis.map(move => ({
+    const parsedAnalysis = rows.analysis.map(move => ({
       ...move,
       alternatives: move.alternatives ? JSON.parse(move.alternatives) : []
     }));
 
-    return { game, analysis: parsedAnalysis };
+    return { game: rows.game, analysis: parsedAnalysis };
+  }
+
+  /**
+   * Same payload as getGameAnalysis(), already serialized for the HTTP response.
+   * The alternatives column is stored as JSON text, so it is spliced into the
+   * body as-is instead of being parsed and re-stringified for every move.
+   *
+   * Analysis rows are written once per game, so the body is cached and reused
+   * while the game row, the number of analysis rows and the last row id are
+   * unchanged; a repeat request then costs two indexed lookups.
+   * @returns {Promise<string|null>} JSON body, or null if the game was not found
+   */
+  async getGameAnalysisJSON(gameId, userId = 'default_user') {
+    const game = await this.get('SELECT * FROM games WHERE id = ? AND user_id = ?', [gameId, userId]);
+    if (!game) return null;
+
+    const stats = await this.get(
+      'SELECT COUNT(*) as moves, MAX(id) as last_id FROM analysis WHERE game_id = ?',
+      [gameId]
+    );
+    const gameJSON = JSON.stringify(game);
+    const version = `${stats?.moves}:${stats?.last_id}:${gameJSON}`;
+
+    const cached = this.analysisJSONCache.get(gameId);
+    if (cached && cached.version === version) {
+      // Refresh LRU position
+      this.analysisJSONCache.delete(gameId);
+      this.analysisJSONCache.set(gameId, cached);
+      return cached.json;
+    }
+
+    const analysis = await this.all(`
+      SELECT a.* FROM analysis a
+      JOIN games g ON a.game_id = g.id
+      WHERE a.game_id = ? AND g.user_id = ?
+      ORDER BY a.move_number
+    `, [gameId, userId]);
+
+    const moves = analysis.map(({ alternatives, ...move }) => {
+      const alternativesJSON = typeof alternatives === 'string' && alternatives
+        ? alternatives
+        : JSON.stringify(alternatives || []);
+      const moveJSON = JSON.stringify(move);
+      return moveJSON === '{}'
+        ? `{"alternatives":${alternativesJSON}}`
+        : `${moveJSON.slice(0, -1)},"alternatives":${alternativesJSON}}`;
+    });
+
+    const json = `{"game":${gameJSON},"analysis":[${moves.join(',')}]}`;
+
+    this.analysisJSONCache.delete(gameId);
+    this.analysisJSONCache.set(gameId, { version, json });
+    if (this.analysisJSONCache.size > ANALYSIS_JSON_CACHE_SIZE) {
+      this.analysisJSONCache.delete(this.analysisJSONCache.keys().next().value);
+    }
+
+    return json;
   }
 
   async close() {
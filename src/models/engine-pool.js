@@ -0,0 +1,169 @@
+/**
+ * Stockfish Engine Pool
+ *
+ * Keeps pre-warmed Stockfish processes ready for position analysis.
+ *
+ * Every engine handed out by acquire() has completed the UCI handshake
+ * (uci -> setoption -> isready) but has never searched. Callers use an engine
+ * for exactly ONE search and then kill it, so each search still starts from a
+ * pristine process (ADR 004 determinism). What the pool removes from the
+ * critical path is the process spawn, NNUE network load and handshake, which
+ * now overlap with the previous search instead of preceding every position.
+ */
+
+const { spawn } = require('child_process');
+const AnalysisConfig = require('./analysis-config');
+
+const WARMUP_TIMEOUT_MS = 30000;
+
+class EnginePool {
+  /**
+   * @param {Object} options
+   * @param {number} options.size - Number of warm engines to keep in reserve
+   * @param {string} options.command - Stockfish executable
+   */
+  constructor({ size = AnalysisConfig.ENGINE.WARM_POOL_SIZE, command = 'stockfish' } = {}) {
+    this.size = size;
+    this.command = command;
+    this.ready = [];     // Warm engines waiting to be handed out
+    this.waiters = [];   // Pending acquire() calls
+    this.warming = new Set();
+    this.closed = false;
+  }
+
+  /**
+   * Get a ready-to-search engine. The caller owns the process afterwards
+   * and must kill it once its search is done.
+   * @returns {Promise<ChildProcess>}
+   */
+  acquire() {
+    if (this.closed) {
+      return Promise.reject(new Error('Engine pool is closed'));
+    }
+
+    const promise = this.ready.length > 0
+      ? Promise.resolve(this.ready.shift())
+      : new Promise((resolve, reject) => this.waiters.push({ resolve, reject }));
+
+    this._fill();
+    return promise;
+  }
+
+  /**
+   * Start warming engines until ready + warming covers the reserve size
+   * plus any callers still waiting
+   */
+  _fill() {
+    while (!this.closed && this.ready.length + this.warming.size < this.size + this.waiters.length) {
+      this._warmEngine();
+    }
+  }
+
+  _warmEngine() {
+    const engine = spawn(this.command);
+    this.warming.add(engine);
+
+    let buffer = '';
+    let settled = false;
+
+    const cleanup = () => {
+      clearTimeout(timeout);
+      this.warming.delete(engine);
+      engine.stdout.removeListener('data', onData);
+      engine.removeListener('error', onFailure);
+      engine.removeListener('close', onClose);
+    };
+
+    const onReady = () => {
+      settled = true;
+      cleanup();
+
+      if (this.closed) {
+        engine.kill();
+        return;
+      }
+
+      // Drop the engine from the reserve if it dies before being handed out
+      engine.once('close', () => {
+        const index = this.ready.indexOf(engine);
+        if (index !== -1) this.ready.splice(index, 1);
+      });
+
+      const waiter = this.waiters.shift();
+      if (waiter) {
+        waiter.resolve(engine);
+      } else {
+        this.ready.push(engine);
+      }
+    };
+
+    const onFailure = (error) => {
+      if (settled) return;
+      settled = true;
+      cleanup();
+      engine.kill();
+      if (this.closed) return;
+
+      const waiter = this.waiters.shift();
+      if (waiter) {
+        waiter.reject(error);
+      } else {
+        console.error('❌ Failed to warm Stockfish engine:', error.message);
+      }
+    };
+
+    const onClose = (code) => onFailure(new Error(`Stockfish exited during warm-up (code ${code})`));
+
+    const onData = (data) => {
+      buffer += data.toString();
+      const lines = buffer.split('\n');
+      buffer = lines.pop();
+
+      for (const line of lines) {
+        if (line.startsWith('uciok')) {
+          engine.stdin.write(`setoption name Threads value ${AnalysisConfig.ENGINE.THREADS}\n`);
+          engine.stdin.write(`setoption name Hash value ${AnalysisConfig.ENGINE.HASH_MB}\n`);
+          engine.stdin.write('isready\n');
+        } else if (line.startsWith('readyok')) {
+          onReady();
+          return;
+        }
+      }
+    };
+
+    const timeout = setTimeout(() => {
+      onFailure(new Error('Timed out waiting for Stockfish to become ready'));
+    }, WARMUP_TIMEOUT_MS);
+
+    engine.stdout.on('data', onData);
+    engine.stdin.on('error', onFailure); // EPIPE if the process dies mid-handshake
+    engine.on('error', onFailure);
+    engine.on('close', onClose);
+
+    // Start UCI protocol
+    engine.stdin.write('uci\n');
+  }
+
+  /**
+   * Kill all reserve and warming engines and reject pending callers
+   */
+  close() {
+    this.closed = true;
+
+    for (const engine of [...this.ready, ...this.warming]) {
+      try {
+        engine.kill();
+      } catch (error) {
+        // Ignore errors when killing processes
+      }
+    }
+    this.ready = [];
+    this.warming.clear();
+
+    for (const waiter of this.waiters.splice(0)) {
+      waiter.reject(new Error('Engine pool is closed'));
+    }
+  }
+}
+
+module.exports = EnginePool;
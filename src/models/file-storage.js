@@ -8,9 +8,33 @@ class FileStorage {
     this.pgnDir = path.join(this.baseDir, 'pgn');
     this.tournamentsDir = path.join(this.baseDir, 'tournaments');
     this.backupDir = path.join(this.baseDir, 'backups');
+    // Directory listings cached by directory mtime, so repeated requests cost
+    // one stat per folder instead of reading every folder. Invalidated on our own writes.
+    this.listingCache = new Map();
     this.ensureDirectories();
   }
 
+  /**
+   * Return a cached listing of dirPath while the directory's mtime is unchanged
+   * (adding, removing or renaming an entry bumps the mtime; changes inside a
+   * subdirectory or to a file's content do not)
+   */
+  getCachedListing(dirPath, buildListing) {
+    const mtimeMs = fs.statSync(dirPath).mtimeMs;
+    const cached = this.listingCache.get(dirPath);
+    if (cached && cached.mtimeMs === mtimeMs) {
+      return cached.listing;
+    }
+
+    const listing = buildListing();
+    this.listingCache.set(dirPath, { mtimeMs, listing });
+    return listing;
+  }
+
+  invalidateListing(...dirPaths) {
+    dirPaths.forEach(dirPath => this.listingCache.delete(dirPath));
+  }
+
   ensureDirectories() {
     const dirs = [this.baseDir, this.pgnDir, this.tournamentsDir, this.backupDir];
     dirs.forEach(dir => {
@@ -28,6 +52,7 @@ class FileStorage {
     
     if (!fs.existsSync(tournamentPath)) {
       fs.mkdirSync(tournamentPath, { recursive: true });
+      this.invalidateListing(this.tournamentsDir);
       console.log(`🏆 Created tournament folder: ${sanitizedName}`);
     }
     
@@ -44,6 +69,8 @@ class FileStorage {
       const filePath = path.join(tournamentPath, fileName);
       
       fs.writeFileSync(filePath, pgnContent, 'utf8');
+      // File counts in the folder listing change too
+      this.invalidateListing(tournamentPath, this.tournamentsDir);
       console.log(`💾 Stored PGN in tournament folder: ${tournamentName}/${fileName}`);
       
       return {
@@ -65,16 +92,21 @@ class FileStorage {
         return [];
       }
       
-      return fs.readdirSync(this.tournamentsDir)
-        .filter(item => {
-          const itemPath = path.join(this.tournamentsDir, item);
-          return fs.statSync(itemPath).isDirectory();
-        })
-        .map(folderName => ({
-          name: folderName,
-          path: path.join(this.tournamentsDir, folderName),
-          fileCount: this.countPGNFiles(path.join(this.tournamentsDir, folderName))
-        }));
+      const folderNames = this.getCachedListing(this.tournamentsDir, () =>
+        fs.readdirSync(this.tournamentsDir, { withFileTypes: true })
+          .filter(entry => entry.isDirectory())
+          .map(entry => entry.name)
+      );
+
+      // Counts are validated against each folder's own mtime
+      return folderNames.map(name => {
+        const folderPath = path.join(this.tournamentsDir, name);
+        return {
+          name,
+          path: folderPath,
+          fileCount: this.countPGNFilesCached(folderPath)
+        };
+      });
     } catch (error) {
       console.error('❌ Failed to list tournament folders:', error.message);
       return [];
@@ -90,14 +122,18 @@ class FileStorage {
         return [];
       }
       
+      // Not cached: size and modified time change without touching the folder's mtime
       return fs.readdirSync(tournamentPath)
         .filter(file => file.endsWith('.pgn'))
-        .map(fileName => ({
-          name: fileName,
-          path: path.join(tournamentPath, fileName),
-          size: fs.statSync(path.join(tournamentPath, fileName)).size,
-          modified: fs.statSync(path.join(tournamentPath, fileName)).mtime
-        }));
+        .map(fileName => {
+          const stats = fs.statSync(path.join(tournamentPath, fileName));
+          return {
+            name: fileName,
+            path: path.join(tournamentPath, fileName),
+            size: stats.size,
+            modified: stats.mtime
+          };
+        });
     } catch (error) {
       console.error('❌ Failed to list tournament files:', error.message);
       return [];
@@ -114,6 +150,15 @@ class FileStorage {
     }
   }
 
+  // Count PGN files in directory, cached while the directory's mtime is unchanged
+  countPGNFilesCached(dirPath) {
+    try {
+      return this.getCachedListing(dirPath, () => this.countPGNFiles(dirPath));
+    } catch (error) {
+      return 0;
+    }
+  }
+
   // Read PGN file
   readPGNFile(filePath) {
     try {
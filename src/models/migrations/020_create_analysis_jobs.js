@@ -0,0 +1,63 @@
+/**
+ * Migration 020: Create analysis jobs table
+ *
+ * Tracks PGN uploads that are analyzed in the background.
+ * POST /api/upload?async=true returns 202 with a job id and the client
+ * polls GET /api/jobs/:id until the job is completed or failed.
+ *
+ * worker_pid records which server process runs each job, so with several
+ * server workers (WEB_CONCURRENCY) the replacement of a crashed worker fails
+ * exactly that worker's jobs.
+ */
+
+class Migration020 {
+  constructor(db) {
+    this.db = db;
+    this.version = 20;
+    this.name = 'create_analysis_jobs';
+  }
+
+  async up() {
+    console.log('🔄 Running migration 020: Create analysis jobs table');
+
+    const { idType, textType, timestampType } = this.db.getSQLTypes();
+
+    console.log('  🔧 Creating analysis_jobs table...');
+    await this.db.run(`
+      CREATE TABLE IF NOT EXISTS analysis_jobs (
+        id ${idType},
+        user_id ${textType} NOT NULL,
+        status ${textType} NOT NULL DEFAULT 'queued',
+        original_file_name ${textType},
+        result ${textType},
+        error ${textType},
+        worker_pid INTEGER,
+        created_at ${timestampType} DEFAULT CURRENT_TIMESTAMP,
+        updated_at ${timestampType} DEFAULT CURRENT_TIMESTAMP
+      )
+    `);
+
+    console.log('  📑 Creating indexes for analysis_jobs...');
+    await this.db.run(`
+      CREATE INDEX IF NOT EXISTS idx_analysis_jobs_user_id
+      ON analysis_jobs(user_id)
+    `);
+
+    await this.db.run(`
+      CREATE INDEX IF NOT EXISTS idx_analysis_jobs_status
+      ON analysis_jobs(status)
+    `);
+
+    console.log('✅ Migration 020 completed: Analysis jobs table created');
+  }
+
+  async down() {
+    console.log('🔄 Rolling back migration 020: Create analysis jobs table');
+
+    await this.db.run('DROP TABLE IF EXISTS analysis_jobs');
+
+    console.log('✅ Migration 020 rollback completed');
+  }
+}
+
+module.exports = Migration020;
@@ -0,0 +1,46 @@
+/**
+ * Migration 021: Create engine evaluation cache table
+ *
+ * Persists Stockfish evaluations across games, uploads and server restarts.
+ * Common opening positions recur in almost every upload, so they are only
+ * searched once. The cache key covers the position, the search limit and the
+ * engine (version, hash, threads), so a cached entry is exactly what a fresh
+ * deterministic search would return.
+ */
+
+class Migration021 {
+  constructor(db) {
+    this.db = db;
+    this.version = 21;
+    this.name = 'create_engine_eval_cache';
+  }
+
+  async up() {
+    console.log('🔄 Running migration 021: Create engine evaluation cache table');
+
+    const { idType, textType, timestampType } = this.db.getSQLTypes();
+
+    console.log('  🔧 Creating engine_eval_cache table...');
+    await this.db.run(`
+      CREATE TABLE IF NOT EXISTS engine_eval_cache (
+        id ${idType},
+        cache_key ${textType} NOT NULL UNIQUE,
+        best_move ${textType},
+        evaluation INTEGER NOT NULL,
+        created_at ${timestampType} DEFAULT CURRENT_TIMESTAMP
+      )
+    `);
+
+    console.log('✅ Migration 021 completed: Engine evaluation cache table created');
+  }
+
+  async down() {
+    console.log('🔄 Rolling back migration 021: Create engine evaluation cache table');
+
+    await this.db.run('DROP TABLE IF EXISTS engine_eval_cache');
+
+    console.log('✅ Migration 021 rollback completed');
+  }
+}
+
+module.exports = Migration021;
@@ -0,0 +1,53 @@
+/**
+ * Migration 022: Add composite indexes for the hot read queries
+ *
+ * The single-column indexes on games(user_id) and analysis(game_id) still
+ * leave a sort step (or a table lookup per row) in the queries run on every
+ * dashboard refresh:
+ * - games list: WHERE user_id = ? ORDER BY created_at DESC LIMIT ?
+ * - trends: WHERE user_id = ? ORDER BY date
+ * - tournament pages: WHERE tournament_id = ? AND user_id = ? ORDER BY created_at
+ * - game analysis: WHERE game_id = ? ORDER BY move_number
+ *
+ * The analysis index also carries centipawn_loss, so the accuracy aggregates
+ * (SUM/COUNT over the user's moves by move_number parity) are answered from
+ * the index alone.
+ */
+
+class Migration022 {
+  constructor(db) {
+    this.db = db;
+    this.version = 22;
+    this.name = 'add_query_indexes';
+  }
+
+  async up() {
+    console.log('🔄 Running migration 022: Add composite query indexes');
+
+    const indexes = [
+      'CREATE INDEX IF NOT EXISTS idx_games_user_created ON games(user_id, created_at)',
+      'CREATE INDEX IF NOT EXISTS idx_games_user_date ON games(user_id, date)',
+      'CREATE INDEX IF NOT EXISTS idx_games_tournament_user ON games(tournament_id, user_id, created_at)',
+      'CREATE INDEX IF NOT EXISTS idx_analysis_game_move ON analysis(game_id, move_number, centipawn_loss)'
+    ];
+
+    console.log('  📑 Creating indexes...');
+    for (const sql of indexes) {
+      await this.db.run(sql);
+    }
+
+    console.log('✅ Migration 022 completed: Composite query indexes created');
+  }
+
+  async down() {
+    console.log('🔄 Rolling back migration 022: Add composite query indexes');
+
+    for (const name of ['idx_games_user_created', 'idx_games_user_date', 'idx_games_tournament_user', 'idx_analysis_game_move']) {
+      await this.db.run(`DROP INDEX IF EXISTS ${name}`);
+    }
+
+    console.log('✅ Migration 022 rollback completed');
+  }
+}
+
+module.exports = Migration022;
@@ -1,5 +1,22 @@
+const crypto = require('crypto');
 const { Chess } = require('chess.js');
 
+// Opening lines are matched on at most this many plies
+const MAX_OPENING_PLIES = 10;
+// Bounded cache of PGN detections (games lists re-detect the same games on every request)
+const DETECTION_CACHE_SIZE = 1000;
+
+const FEN_HEADER_REGEX = /^\s*\[FEN\s/m;
+const HEADER_LINE_REGEX = /^\s*\[.*$/gm;
+// Variations (possibly nested), ";" comments and "%" escapes are left to the full parse
+const FULL_PARSE_MOVETEXT_REGEX = /[(;%]/;
+const COMMENT_REGEX = /\{[^}]*\}/g;
+const VARIATION_REGEX = /\([^)]*\)/g;
+const BLACK_MOVE_NUMBER_REGEX = /\d+\.\.\./g;
+const MOVE_NUMBER_REGEX = /\d+\./g;
+const RESULT_REGEX = /1-0|0-1|1\/2-1\/2|\*/g;
+const WHITESPACE_REGEX = /\s+/;
+
 /**
  * Detects chess opening based on the first moves
  * Returns { eco: 'C50', name: 'Italian Game' } or null
@@ -93,6 +110,8 @@ class OpeningDetector {
       // Petroff Defense
       ['e4 e5 Nf3 Nf6', { eco: 'C42', name: 'Petrov Defense' }],
     ]);
+
+    this.detectionCache = new Map(); // sha1(pgn) -> { eco, name } | null
   }
 
   /**
@@ -106,11 +125,7 @@ class OpeningDetector {
 
       // Parse moves from PGN if string input
       if (typeof input === 'string') {
-        // Clean and extract moves from PGN
-        moves = this.extractMovesFromPgn(input);
-        if (!moves || moves.length === 0) {
-          return null;
-        }
+        return this._detectFromPgn(input);
       } else {
         moves = input;
       }
@@ -120,7 +135,7 @@ class OpeningDetector {
       }
 
       // Try to match progressively longer sequences (up to 10 moves)
-      const maxDepth = Math.min(10, moves.length);
+      const maxDepth = Math.min(MAX_OPENING_PLIES, moves.length);
       let bestMatch = null;
 
       // Start from longest sequence and work backwards for best match
@@ -140,6 +155,51 @@ class OpeningDetector {
     }
   }
 
+  /**
+   * Detect opening from PGN content, caching the result per PGN
+   * @private
+   * @param {string} pgn - PGN content
+   * @returns {object|null} - { eco, name } or null
+   */
+  _detectFromPgn(pgn) {
+    const key = crypto.createHash('sha1').update(pgn).digest('hex');
+    if (this.detectionCache.has(key)) {
+      return this.detectionCache.get(key);
+    }
+
+    const moves = this.extractOpeningMoves(pgn);
+    const result = moves.length > 0 ? this.detect(moves) : null;
+
+    if (this.detectionCache.size >= DETECTION_CACHE_SIZE) {
+      this.detectionCache.delete(this.detectionCache.keys().next().value);
+    }
+    this.detectionCache.set(key, result);
+    return result;
+  }
+
+  /**
+   * Extract only the opening plies needed for detection.
+   * Replays the first MAX_OPENING_PLIES tokens of the movetext instead of
+   * loading the whole game; falls back to a full parse for set-up positions
+   * and for movetext with variations, ";" comments or "%" escapes, which the
+   * quick scan cannot strip reliably.
+   * @param {string} pgn - PGN content
+   * @returns {array} - Array of SAN moves
+   */
+  extractOpeningMoves(pgn) {
+    const quickScan = !FEN_HEADER_REGEX.test(pgn) &&
+      !FULL_PARSE_MOVETEXT_REGEX.test(pgn.replace(HEADER_LINE_REGEX, ''));
+
+    if (quickScan) {
+      const moves = this.manualExtractMoves(pgn, MAX_OPENING_PLIES);
+      if (moves.length === MAX_OPENING_PLIES) {
+        return moves;
+      }
+    }
+
+    return (this.extractMovesFromPgn(pgn) || []).slice(0, MAX_OPENING_PLIES);
+  }
+
   /**
    * Extract moves from PGN string, handling malformed PGN
    * @param {string} pgn - PGN content
@@ -165,9 +225,10 @@ class OpeningDetector {
   /**
    * Manually extract moves from PGN when chess.js fails
    * @param {string} pgn - PGN content
+   * @param {number} [maxPlies=Infinity] - Stop after this many moves
    * @returns {array} - Array of SAN moves
    */
-  manualExtractMoves(pgn) {
+  manualExtractMoves(pgn, maxPlies = Infinity) {
     // Remove headers (lines starting with [)
     const lines = pgn.split('\n');
     const moveLines = lines.filter(line => !line.trim().startsWith('[') && line.trim().length > 0);
@@ -179,19 +240,22 @@ class OpeningDetector {
 
     // Remove move numbers, result indicators, comments, and variations
     let cleaned = moveText
-      .replace(/\{[^}]*\}/g, '') // Remove comments
-      .replace(/\([^)]*\)/g, '') // Remove variations
-      .replace(/\d+\.\.\./g, '') // Remove "1..." notation
-      .replace(/\d+\./g, '') // Remove move numbers
-      .replace(/1-0|0-1|1\/2-1\/2|\*/g, '') // Remove result
+      .replace(COMMENT_REGEX, '') // Remove comments
+      .replace(VARIATION_REGEX, '') // Remove variations
+      .replace(BLACK_MOVE_NUMBER_REGEX, '') // Remove "1..." notation
+      .replace(MOVE_NUMBER_REGEX, '') // Remove move numbers
+      .replace(RESULT_REGEX, '') // Remove result
       .trim();
 
     // Split by whitespace and filter out empty strings
-    const tokens = cleaned.split(/\s+/).filter(t => t.length > 0);
+    const tokens = cleaned.split(WHITESPACE_REGEX).filter(t => t.length > 0);
 
     // Validate moves by trying to play them
     const chess = new Chess();
     for (const token of tokens) {
+      if (moves.length >= maxPlies) {
+        break;
+      }
       try {
         const move = chess.move(token);
         if (move) {
@@ -191,40 +191,40 @@ class TournamentAnalyzer {
         ORDER BY g.created_at ASC
       `, [tournamentId, userId]);
 
-      // Fetch analysis data for each game
-      const trends = [];
-      for (let index = 0; index < games.length; index++) {
-        const game = games[index];
-
-        const gameAnalysis = await this.db.all(`
-          SELECT move_number, centipawn_loss, is_blunder
-          FROM analysis
-          WHERE game_id = ?
-          ORDER BY move_number
-        `, [game.id]);
-
-        // Calculate metrics for player moves only using user_color
-        const playerMoves = gameAnalysis.filter(move =>
-          (game.user_color === 'white' && move.move_number % 2 === 1) ||
-          (game.user_color === 'black' && move.move_number % 2 === 0)
-        );
+      // Sum each game's user moves in one grouped query instead of loading
+      // every game's analysis rows (odd move numbers are White's moves)
+      const moveTotals = await this.db.all(`
+        SELECT
+          a.game_id,
+          COUNT(*) as total_moves,
+          COALESCE(SUM(a.centipawn_loss), 0) as total_centipawn_loss,
+          SUM(CASE WHEN a.is_blunder THEN 1 ELSE 0 END) as blunders
+        FROM analysis a
+        JOIN games g ON a.game_id = g.id
+        WHERE g.tournament_id = ?
+          AND g.user_id = ?
+          AND ((g.user_color = 'white' AND a.move_number % 2 = 1) OR (g.user_color = 'black' AND a.move_number % 2 = 0))
+        GROUP BY a.game_id
+      `, [tournamentId, userId]);
 
-        const blunders = playerMoves.filter(a => a.is_blunder === true).length;
-        const totalCpl = playerMoves.reduce((sum, move) => sum + (move.centipawn_loss || 0), 0);
-        const avgCentipawnLoss = playerMoves.length > 0 ? Math.round(totalCpl / playerMoves.length) : 0;
+      const totalsByGame = new Map(moveTotals.map(row => [row.game_id, row]));
 
-        // Calculate accuracy from average centipawn loss
-        const accuracy = AccuracyCalculator.calculateAccuracy(avgCentipawnLoss);
+      const trends = games.map((game, index) => {
+        const totals = totalsByGame.get(game.id);
+        const totalMoves = parseInt(totals?.total_moves) || 0;
+        const totalCpl = Number(totals?.total_centipawn_loss) || 0;
+        const avgCentipawnLoss = totalMoves > 0 ? Math.round(totalCpl / totalMoves) : 0;
 
-        trends.push({
+        return {
           gameNumber: index + 1,
           gameId: game.id,
           date: game.date,
-          accuracy,
-          blunders,
+          // Calculate accuracy from average centipawn loss
+          accuracy: AccuracyCalculator.calculateAccuracy(avgCentipawnLoss),
+          blunders: parseInt(totals?.blunders) || 0,
           avgCentipawnLoss
-        });
-      }
+        };
+      });
 
       return trends;
     } catch (error) {
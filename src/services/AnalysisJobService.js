@@ -0,0 +1,141 @@
+/**
+ * AnalysisJobService
+ *
+ * Runs PGN upload analysis in the background so the upload request can
+ * return immediately (202 Accepted + job id) instead of holding the
+ * connection open for the whole Stockfish analysis.
+ *
+ * Job state is persisted in the analysis_jobs table (migration 020) so
+ * clients can poll GET /api/jobs/:id. Jobs run one at a time, in order:
+ * the shared analyzer serializes games anyway (ADR 004), and running uploads
+ * one by one keeps duplicate detection and tournament resolution race-free.
+ */
+
+const { getDatabase } = require('../models/database');
+
+const JOB_STATUS = {
+  QUEUED: 'queued',
+  PROCESSING: 'processing',
+  COMPLETED: 'completed',
+  FAILED: 'failed'
+};
+
+class AnalysisJobService {
+  /**
+   * @param {Object} options
+   * @param {PGNUploadService} options.uploadService - Service that runs the upload pipeline
+   * @param {Database} options.database - Database instance
+   */
+  constructor({ uploadService = null, database = null } = {}) {
+    this.uploadService = uploadService;
+    this.database = database || getDatabase();
+    this.queue = [];
+    this.isProcessing = false;
+  }
+
+  /**
+   * Record a job and queue the upload for background analysis
+   * @param {Object} uploadOptions - Same options as PGNUploadService.processPGNUpload()
+   * @returns {Promise<number>} Job ID
+   */
+  async enqueue(uploadOptions) {
+    const result = await this.database.run(
+      'INSERT INTO analysis_jobs (user_id, status, original_file_name, worker_pid) VALUES (?, ?, ?, ?)',
+      [uploadOptions.userId, JOB_STATUS.QUEUED, uploadOptions.originalFileName || null, process.pid]
+    );
+    const jobId = result.lastID;
+
+    this.queue.push({ jobId, uploadOptions });
+    console.log(`📥 [JOBS] Queued analysis job ${jobId}. Queue length: ${this.queue.length}`);
+
+    if (!this.isProcessing) {
+      this._processQueue();
+    }
+
+    return jobId;
+  }
+
+  /**
+   * Get a job owned by the user
+   * @param {number} jobId - Job ID
+   * @param {string} userId - User ID
+   * @returns {Promise<Object|null>} Job, or null if not found
+   */
+  async getJob(jobId, userId) {
+    const job = await this.database.get(
+      'SELECT * FROM analysis_jobs WHERE id = ? AND user_id = ?',
+      [jobId, userId]
+    );
+    if (!job) return null;
+
+    return {
+      id: job.id,
+      status: job.status,
+      fileName: job.original_file_name,
+      result: job.result ? JSON.parse(job.result) : null,
+      error: job.error || null,
+      createdAt: job.created_at,
+      updatedAt: job.updated_at
+    };
+  }
+
+  /**
+   * Fail jobs left queued/processing by a previous server process.
+   * The PGN of an in-memory queue entry does not survive a restart.
+   * @param {Object} [options]
+   * @param {number} [options.workerPid] - Only fail the jobs of this (crashed) server worker
+   * @returns {Promise<void>}
+   */
+  async recoverInterruptedJobs({ workerPid = null } = {}) {
+    let sql = 'UPDATE analysis_jobs SET status = ?, error = ?, updated_at = CURRENT_TIMESTAMP WHERE status IN (?, ?)';
+    const params = [JOB_STATUS.FAILED, 'Interrupted by server restart, please upload again', JOB_STATUS.QUEUED, JOB_STATUS.PROCESSING];
+    if (workerPid) {
+      sql += ' AND worker_pid = ?';
+      params.push(workerPid);
+    }
+
+    const result = await this.database.run(sql, params);
+    if (result && result.changes > 0) {
+      console.log(`⚠️ [JOBS] Marked ${result.changes} interrupted analysis jobs as failed`);
+    }
+  }
+
+  async _processQueue() {
+    if (this.queue.length === 0) {
+      this.isProcessing = false;
+      return;
+    }
+
+    this.isProcessing = true;
+    const { jobId, uploadOptions } = this.queue.shift();
+    console.log(`⚙️ [JOBS] Processing analysis job ${jobId}. Remaining in queue: ${this.queue.length}`);
+
+    try {
+      await this._updateJob(jobId, JOB_STATUS.PROCESSING);
+      const result = await this.uploadService.processPGNUpload(uploadOptions);
+      await this._updateJob(jobId, JOB_STATUS.COMPLETED, { result: JSON.stringify(result) });
+      console.log(`✅ [JOBS] Analysis job ${jobId} completed`);
+    } catch (error) {
+      console.error(`❌ [JOBS] Analysis job ${jobId} failed:`, error.message);
+      try {
+        await this._updateJob(jobId, JOB_STATUS.FAILED, { error: error.message || 'Failed to process PGN file' });
+      } catch (updateError) {
+        console.error(`❌ [JOBS] Failed to record failure of job ${jobId}:`, updateError.message);
+      }
+    }
+
+    // Process next job
+    setImmediate(() => this._processQueue());
+  }
+
+  async _updateJob(jobId, status, { result = null, error = null } = {}) {
+    await this.database.run(
+      'UPDATE analysis_jobs SET status = ?, result = ?, error = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?',
+      [status, result, error, jobId]
+    );
+  }
+}
+
+AnalysisJobService.JOB_STATUS = JOB_STATUS;
+
+module.exports = AnalysisJobService;
@@ -51,6 +51,23 @@ class BlunderService {
     return parseInt(result?.count) || 0;
   }
 
+  /**
+   * Get blunder count across all games of a user
+   * @param {string} userId - User ID
+   * @returns {Promise<number>} Number of blunders made by the user
+   */
+  async getBlunderCountForUser(userId) {
+    const result = await this.database.get(`
+      SELECT COUNT(*) as count
+      FROM blunder_details bd
+      JOIN games g ON bd.game_id = g.id
+      WHERE g.user_id = ?
+        AND bd.is_blunder = TRUE
+        AND bd.player_color = g.user_color
+    `, [userId]);
+    return parseInt(result?.count) || 0;
+  }
+
   /**
    * Get all blunders for a user with optional filters
    * @param {string} userId - User ID
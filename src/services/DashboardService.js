@@ -39,7 +39,6 @@ class DashboardService {
     let totalWins = 0, totalLosses = 0, totalDraws = 0;
     let whiteWins = 0, whiteLosses = 0, whiteDraws = 0, whiteGames = 0;
     let blackWins = 0, blackLosses = 0, blackDraws = 0, blackGames = 0;
-    let totalBlunders = 0, totalCentipawnLoss = 0, totalMoves = 0;
 
     for (const game of games) {
       const isPlayerWhite = game.user_color === 'white';
@@ -61,19 +60,6 @@ class DashboardService {
         if (isPlayerWhite) whiteLosses++;
         if (isPlayerBlack) blackLosses++;
       }
-
-      const analysis = await this.database.all(`
-        SELECT centipawn_loss, move_number FROM analysis WHERE game_id = ? ORDER BY move_number
-      `, [game.id]);
-
-      const playerMoves = analysis.filter(move =>
-        (isPlayerWhite && move.move_number % 2 === 1) || (isPlayerBlack && move.move_number % 2 === 0)
-      );
-
-      const blunderCount = await this.blunderService.getBlunderCountForGame(game.id, game.user_color);
-      totalBlunders += blunderCount;
-      totalCentipawnLoss += playerMoves.reduce((sum, move) => sum + (move.centipawn_loss || 0), 0);
-      totalMoves += playerMoves.length;
     }
 
     const totalGames = games.length;
@@ -81,21 +67,20 @@ class DashboardService {
     const whiteWinRate = whiteGames > 0 ? Math.round((whiteWins / whiteGames) * 100) : 0;
     const blackWinRate = blackGames > 0 ? Math.round((blackWins / blackGames) * 100) : 0;
 
-    const gamesWithAnalysis = [];
-    for (const game of games) {
-      const analysis = await this.database.all(`
-        SELECT centipawn_loss, move_number FROM analysis WHERE game_id = ? ORDER BY move_number
-      `, [game.id]);
-      if (analysis.length > 0) {
-        gamesWithAnalysis.push({
-          ...game, analysis,
-          white_player: game.user_color === 'white' ? 'user' : 'opponent',
-          black_player: game.user_color === 'black' ? 'user' : 'opponent'
-        });
-      }
-    }
+    // Aggregate the user's moves across all games in the database instead of
+    // loading every game's analysis rows (odd move numbers are White's moves)
+    const userMoves = await this.database.get(`
+      SELECT COALESCE(SUM(a.centipawn_loss), 0) as total_centipawn_loss, COUNT(*) as total_moves
+      FROM analysis a JOIN games g ON a.game_id = g.id
+      WHERE g.user_id = ?
+        AND ((g.user_color = 'white' AND a.move_number % 2 = 1) OR (g.user_color = 'black' AND a.move_number % 2 = 0))
+    `, [userId]);
+
+    const totalMoves = parseInt(userMoves?.total_moves) || 0;
+    const totalCentipawnLoss = Number(userMoves?.total_centipawn_loss) || 0;
+    const avgAccuracy = totalMoves > 0 ? AccuracyCalculator.calculateAccuracy(totalCentipawnLoss / totalMoves) : 0;
 
-    const avgAccuracy = AccuracyCalculator.calculateOverallAccuracy(gamesWithAnalysis, 'user');
+    const totalBlunders = totalGames > 0 ? await this.blunderService.getBlunderCountForUser(userId) : 0;
 
     return {
       overall: { overallWinRate, avgAccuracy, totalGames, totalBlunders },
@@ -123,6 +123,36 @@ class GameStorageService {
     let tacticalOpportunities = 0;
     let freePiecesDetected = 0;
 
+    if (analysisData.length === 0) {
+      return;
+    }
+
+    // Write all rows for the game with multi-row inserts instead of one round trip per row
+    await this.database.insertAnalysisBatch(gameId, analysisData);
+
+    // Store alternative moves (up to 15 per move)
+    const alternativesByMove = analysisData
+      .filter(moveAnalysis => moveAnalysis.alternatives && moveAnalysis.alternatives.length > 0)
+      .map(moveAnalysis => ({ moveNumber: moveAnalysis.move_number, alternatives: moveAnalysis.alternatives }));
+    if (alternativesByMove.length > 0) {
+      await this.database.storeAlternativeMovesBatch(gameId, alternativesByMove);
+    }
+
+    // Store position evaluations with FEN
+    const positionEvaluations = analysisData
+      .filter(moveAnalysis => moveAnalysis.fen_before)
+      .map(moveAnalysis => ({
+        moveNumber: moveAnalysis.move_number,
+        fen: moveAnalysis.fen_before,
+        evaluation: moveAnalysis.evaluation,
+        bestMove: moveAnalysis.best_move,
+        depth: 12,
+        mateIn: null
+      }));
+    if (positionEvaluations.length > 0) {
+      await this.database.storePositionEvaluationsBatch(gameId, positionEvaluations);
+    }
+
     for (let i = 0; i < analysisData.length; i++) {
       const moveAnalysis = analysisData[i];
       // Determine whose move it is from the FEN (more reliable than move_number)
@@ -130,27 +160,6 @@ class GameStorageService {
       const isWhiteMove = moveAnalysis.fen_before && moveAnalysis.fen_before.includes(' w ');
       const playerColor = isWhiteMove ? 'white' : 'black';
 
-      // Insert move analysis
-      await this.database.insertAnalysis(gameId, moveAnalysis);
-
-      // Store alternative moves (up to 15)
-      if (moveAnalysis.alternatives && moveAnalysis.alternatives.length > 0) {
-        await this.database.storeAlternativeMoves(gameId, moveAnalysis.move_number, moveAnalysis.alternatives);
-      }
-
-      // Store position evaluation with FEN
-      if (moveAnalysis.fen_before) {
-        await this.database.storePositionEvaluation(
-          gameId,
-          moveAnalysis.move_number,
-          moveAnalysis.fen_before,
-          moveAnalysis.evaluation,
-          moveAnalysis.best_move,
-          12, // depth
-          null // mateIn
-        );
-      }
-
       // ADR 009 Phase 5.1: Detect tactical opportunities
       // Only for the user's moves (if userColor is specified)
       if (userColor && playerColor === userColor && moveAnalysis.fen_before && moveAnalysis.best_move) {
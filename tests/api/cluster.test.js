@@ -0,0 +1,185 @@
+/**
+ * Cluster Launcher Tests
+ */
+
+const EventEmitter = require('events');
+const { startCluster, getJobRecovery } = require('../../src/api/cluster');
+
+function createFakeCluster() {
+  const cluster = new EventEmitter();
+  cluster.isPrimary = true;
+  cluster.isWorker = false;
+  cluster.workers = {};
+  let nextId = 1;
+
+  cluster.fork = jest.fn((env) => {
+    const worker = new EventEmitter();
+    worker.id = nextId++;
+    worker.env = env;
+    worker.process = { pid: 1000 + worker.id, kill: jest.fn() };
+    cluster.workers[worker.id] = worker;
+    return worker;
+  });
+
+  cluster.exitWorker = (worker, code = 1) => {
+    delete cluster.workers[worker.id];
+    cluster.emit('exit', worker, code, null);
+  };
+
+  return cluster;
+}
+
+describe('Cluster launcher', () => {
+  let startWorker;
+  let signalHandlers;
+
+  beforeEach(() => {
+    jest.useFakeTimers();
+    startWorker = jest.fn();
+    signalHandlers = {};
+    jest.spyOn(process, 'on').mockImplementation((event, handler) => {
+      signalHandlers[event] = handler;
+      return process;
+    });
+    jest.spyOn(process, 'exit').mockImplementation(() => {});
+    jest.spyOn(console, 'log').mockImplementation(() => {});
+    jest.spyOn(console, 'error').mockImplementation(() => {});
+  });
+
+  afterEach(() => {
+    jest.useRealTimers();
+    jest.restoreAllMocks();
+  });
+
+  it('should run the server in-process with a single worker', () => {
+    const cluster = createFakeCluster();
+
+    startCluster(1, startWorker, cluster);
+
+    expect(startWorker).toHaveBeenCalledTimes(1);
+    expect(cluster.fork).not.toHaveBeenCalled();
+  });
+
+  it('should run the server inside a forked worker', () => {
+    const cluster = createFakeCluster();
+    cluster.isPrimary = false;
+    cluster.isWorker = true;
+
+    startCluster(4, startWorker, cluster);
+
+    expect(startWorker).toHaveBeenCalledTimes(1);
+  });
+
+  it('should fork workers one after another', () => {
+    const cluster = createFakeCluster();
+
+    startCluster(3, startWorker, cluster);
+
+    expect(startWorker).not.toHaveBeenCalled();
+    expect(cluster.fork).toHaveBeenCalledTimes(1);
+
+    cluster.workers[1].emit('listening');
+    expect(cluster.fork).toHaveBeenCalledTimes(2);
+
+    cluster.workers[2].emit('listening');
+    cluster.workers[3].emit('listening');
+    expect(cluster.fork).toHaveBeenCalledTimes(3);
+  });
+
+  it('should restart a crashed worker after a delay', () => {
+    const cluster = createFakeCluster();
+    startCluster(2, startWorker, cluster);
+    cluster.workers[1].emit('listening');
+    cluster.workers[2].emit('listening');
+
+    cluster.exitWorker(cluster.workers[1]);
+    expect(cluster.fork).toHaveBeenCalledTimes(2);
+
+    jest.advanceTimersByTime(1000);
+
+    expect(cluster.fork).toHaveBeenCalledTimes(3);
+    // The replacement fails the jobs of the crashed worker
+    expect(cluster.workers[3].env).toEqual({ RECOVER_JOBS_OF_PID: '1001' });
+    expect(process.exit).not.toHaveBeenCalled();
+  });
+
+  it('should back off when workers keep crashing', () => {
+    const cluster = createFakeCluster();
+    startCluster(2, startWorker, cluster);
+    cluster.workers[1].emit('listening');
+    cluster.workers[2].emit('listening');
+
+    cluster.exitWorker(cluster.workers[1]);
+    jest.advanceTimersByTime(1000);
+    cluster.exitWorker(cluster.workers[3]);
+
+    jest.advanceTimersByTime(1999);
+    expect(cluster.fork).toHaveBeenCalledTimes(3);
+    jest.advanceTimersByTime(1);
+    expect(cluster.fork).toHaveBeenCalledTimes(4);
+  });
+
+  it('should give up after too many crashes in a row', () => {
+    const cluster = createFakeCluster();
+    startCluster(2, startWorker, cluster);
+    cluster.workers[1].emit('listening');
+    cluster.workers[2].emit('listening');
+
+    for (let crash = 0; crash < 10; crash++) {
+      const [worker] = Object.values(cluster.workers);
+      cluster.exitWorker(worker);
+      jest.advanceTimersByTime(30000);
+    }
+    expect(process.exit).not.toHaveBeenCalled();
+
+    cluster.exitWorker(Object.values(cluster.workers)[0]);
+
+    expect(process.exit).toHaveBeenCalledWith(1);
+  });
+
+  it('should give up when the first worker fails to start', () => {
+    const cluster = createFakeCluster();
+    startCluster(2, startWorker, cluster);
+
+    cluster.exitWorker(cluster.workers[1], 1);
+
+    expect(process.exit).toHaveBeenCalledWith(1);
+    expect(cluster.fork).toHaveBeenCalledTimes(1);
+  });
+
+  it('should stop workers on SIGTERM without restarting them', () => {
+    const cluster = createFakeCluster();
+    startCluster(2, startWorker, cluster);
+    cluster.workers[1].emit('listening');
+    cluster.workers[2].emit('listening');
+    const [first, second] = Object.values(cluster.workers);
+
+    signalHandlers.SIGTERM();
+
+    expect(first.process.kill).toHaveBeenCalledWith('SIGINT');
+    expect(second.process.kill).toHaveBeenCalledWith('SIGINT');
+
+    cluster.exitWorker(first, 0);
+    expect(process.exit).not.toHaveBeenCalled();
+    cluster.exitWorker(second, 0);
+
+    expect(cluster.fork).toHaveBeenCalledTimes(2);
+    expect(process.exit).toHaveBeenCalledWith(0);
+  });
+
+  describe('getJobRecovery', () => {
+    it('should recover all jobs when not clustered or in the first worker', () => {
+      expect(getJobRecovery({ isWorker: false }, {})).toEqual({});
+      expect(getJobRecovery({ isWorker: true, worker: { id: 1 } }, {})).toEqual({});
+    });
+
+    it('should only recover the crashed worker\'s jobs in its replacement', () => {
+      expect(getJobRecovery({ isWorker: true, worker: { id: 5 } }, { RECOVER_JOBS_OF_PID: '1001' }))
+        .toEqual({ workerPid: 1001 });
+    });
+
+    it('should leave jobs alone in the other workers', () => {
+      expect(getJobRecovery({ isWorker: true, worker: { id: 3 } }, {})).toBeNull();
+    });
+  });
+});
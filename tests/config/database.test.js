@@ -0,0 +1,75 @@
+/**
+ * SQLite connection tests
+ *
+ * The shared connection runs in WAL mode and reuses prepared statements,
+ * so repeated queries must keep returning fresh, correct results.
+ */
+
+const db = require('../../src/config/database');
+
+describe('SQLite connection', () => {
+  beforeAll(async () => {
+    await db.exec('DROP TABLE IF EXISTS statement_cache_test');
+    await db.exec('CREATE TABLE statement_cache_test (id INTEGER PRIMARY KEY, name TEXT)');
+  });
+
+  afterAll(async () => {
+    await db.exec('DROP TABLE IF EXISTS statement_cache_test');
+  });
+
+  it('should run in WAL journal mode', async () => {
+    const row = await db.get('PRAGMA journal_mode');
+
+    expect(row.journal_mode).toBe('wal');
+  });
+
+  it('should return insert ids from a reused statement', async () => {
+    const first = await db.run('INSERT INTO statement_cache_test (name) VALUES (?)', ['alpha']);
+    const second = await db.run('INSERT INTO statement_cache_test (name) VALUES (?)', ['beta']);
+
+    expect(second.lastID).toBe(first.lastID + 1);
+    expect(second.changes).toBe(1);
+  });
+
+  it('should bind new parameters on every get', async () => {
+    const sql = 'SELECT name FROM statement_cache_test WHERE name = ?';
+
+    expect(await db.get(sql, ['alpha'])).toEqual({ name: 'alpha' });
+    expect(await db.get(sql, ['beta'])).toEqual({ name: 'beta' });
+    expect(await db.get(sql, ['gamma'])).toBeUndefined();
+  });
+
+  it('should see rows written after a statement was cached', async () => {
+    const sql = 'SELECT name FROM statement_cache_test ORDER BY id';
+    expect((await db.query(sql)).map(r => r.name)).toEqual(['alpha', 'beta']);
+
+    await db.run('INSERT INTO statement_cache_test (name) VALUES (?)', ['gamma']);
+
+    expect((await db.query(sql)).map(r => r.name)).toEqual(['alpha', 'beta', 'gamma']);
+  });
+
+  it('should commit a transaction', async () => {
+    await db.transaction(async (tx) => {
+      await tx.run('INSERT INTO statement_cache_test (name) VALUES (?)', ['committed']);
+    });
+
+    expect(await db.get('SELECT name FROM statement_cache_test WHERE name = ?', ['committed'])).toEqual({ name: 'committed' });
+  });
+
+  it('should roll back a transaction that throws', async () => {
+    await expect(db.transaction(async (tx) => {
+      await tx.run('INSERT INTO statement_cache_test (name) VALUES (?)', ['rolled-back']);
+      throw new Error('abort');
+    })).rejects.toThrow('abort');
+
+    expect(await db.get('SELECT name FROM statement_cache_test WHERE name = ?', ['rolled-back'])).toBeUndefined();
+  });
+
+  it('should surface SQL errors without caching the broken statement', async () => {
+    await expect(db.query('SELECT * FROM missing_table_xyz')).rejects.toThrow(/no such table/);
+
+    await db.exec('CREATE TABLE missing_table_xyz (id INTEGER)');
+    await expect(db.query('SELECT * FROM missing_table_xyz')).resolves.toEqual([]);
+    await db.exec('DROP TABLE missing_table_xyz');
+  });
+});
@@ -28,6 +28,7 @@ describe('GameController', () => {
       all: jest.fn(),
       get: jest.fn(),
       getGameAnalysis: jest.fn(),
+      getGameAnalysisJSON: jest.fn(),
       getAlternativeMoves: jest.fn(),
       getPositionEvaluation: jest.fn()
     };
@@ -44,6 +45,8 @@ describe('GameController', () => {
 
     mockRes = {
       json: jest.fn(),
+      send: jest.fn(),
+      type: jest.fn().mockReturnThis(),
       status: jest.fn().mockReturnThis()
     };
 
@@ -63,14 +66,15 @@ describe('GameController', () => {
         }
       ];
 
-      mockDb.all.mockResolvedValue(mockGames);
-      mockDb.get.mockResolvedValue({ opening_name: 'Caro-Kann Defense' });
+      mockDb.all
+        .mockResolvedValueOnce(mockGames)
+        .mockResolvedValueOnce([{ eco_code: 'B10', opening_name: 'Caro-Kann Defense' }]);
 
       await gameController.list(mockReq, mockRes);
 
       expect(mockDb.all).toHaveBeenCalledWith(
         expect.stringContaining('WHERE user_id = ?'),
-        ['test-user-id']
+        ['test-user-id', 50, 0]
       );
       expect(mockRes.json).toHaveBeenCalledWith(
         expect.arrayContaining([
@@ -82,6 +86,52 @@ describe('GameController', () => {
       );
     });
 
+    it('should look up all ECO codes of the page in one query', async () => {
+      mockDb.all
+        .mockResolvedValueOnce([
+          { id: 1, pgn_content: '[ECO "B10"]' },
+          { id: 2, pgn_content: '[ECO "C50"]' },
+          { id: 3, pgn_content: '[ECO "B10"]' }
+        ])
+        .mockResolvedValueOnce([
+          { eco_code: 'B10', opening_name: 'Caro-Kann Defense' },
+          { eco_code: 'C50', opening_name: 'Italian Game' }
+        ]);
+
+      await gameController.list(mockReq, mockRes);
+
+      expect(mockDb.all).toHaveBeenCalledTimes(2);
+      expect(mockDb.all).toHaveBeenLastCalledWith(
+        expect.stringContaining('eco_code IN (?, ?)'),
+        ['B10', 'C50']
+      );
+      expect(mockDb.get).not.toHaveBeenCalled();
+      expect(mockRes.json.mock.calls[0][0].map(g => g.opening)).toEqual([
+        'Caro-Kann Defense', 'Italian Game', 'Caro-Kann Defense'
+      ]);
+    });
+
+    it('should page with limit and offset query parameters', async () => {
+      mockReq.query = { limit: '20', offset: '40' };
+      mockDb.all.mockResolvedValue([]);
+
+      await gameController.list(mockReq, mockRes);
+
+      expect(mockDb.all).toHaveBeenCalledWith(
+        expect.stringContaining('LIMIT ? OFFSET ?'),
+        ['test-user-id', 20, 40]
+      );
+    });
+
+    it('should clamp out-of-range paging parameters', async () => {
+      mockReq.query = { limit: '100000', offset: '-5' };
+      mockDb.all.mockResolvedValue([]);
+
+      await gameController.list(mockReq, mockRes);
+
+      expect(mockDb.all).toHaveBeenCalledWith(expect.any(String), ['test-user-id', 200, 0]);
+    });
+
     it('should handle database errors gracefully', async () => {
       mockDb.all.mockRejectedValue(new Error('Database error'));
 
@@ -166,25 +216,36 @@ describe('GameController', () => {
   describe('getAnalysis()', () => {
     it('should return analysis for a game', async () => {
       mockReq.params.id = '1';
-      const mockAnalysis = {
+      const mockAnalysisJSON = JSON.stringify({
         game: { id: 1, white_player: 'Player1', black_player: 'Player2' },
         analysis: [
-          { move_number: 1, centipawn_loss: 10 },
-          { move_number: 2, centipawn_loss: 15 }
+          { move_number: 1, centipawn_loss: 10, alternatives: [] },
+          { move_number: 2, centipawn_loss: 15, alternatives: [] }
         ]
-      };
+      });
+
+      mockDb.getGameAnalysisJSON.mockResolvedValue(mockAnalysisJSON);
 
-      mockDb.getGameAnalysis.mockResolvedValue(mockAnalysis);
+      await gameController.getAnalysis(mockReq, mockRes);
+
+      expect(mockDb.getGameAnalysisJSON).toHaveBeenCalledWith(1, 'test-user-id');
+      expect(mockRes.type).toHaveBeenCalledWith('application/json');
+      expect(mockRes.send).toHaveBeenCalledWith(mockAnalysisJSON);
+    });
+
+    it('should return 404 when game is not found', async () => {
+      mockReq.params.id = '999';
+      mockDb.getGameAnalysisJSON.mockResolvedValue(null);
 
       await gameController.getAnalysis(mockReq, mockRes);
 
-      expect(mockDb.getGameAnalysis).toHaveBeenCalledWith(1, 'test-user-id');
-      expect(mockRes.json).toHaveBeenCalledWith(mockAnalysis);
+      expect(mockRes.status).toHaveBeenCalledWith(404);
+      expect(mockRes.json).toHaveBeenCalledWith({ error: 'Game not found' });
     });
 
     it('should return empty array on error', async () => {
       mockReq.params.id = '1';
-      mockDb.getGameAnalysis.mockRejectedValue(new Error('Database error'));
+      mockDb.getGameAnalysisJSON.mockRejectedValue(new Error('Database error'));
 
       await gameController.getAnalysis(mockReq, mockRes);
 
@@ -0,0 +1,85 @@
+/**
+ * Tournament player performance against a real database
+ *
+ * The aggregate SQL in getPlayerPerformance is not exercised by the mocked
+ * controller tests, so these run it on the test database.
+ */
+
+const tournamentController = require('../../src/api/controllers/tournament.controller');
+const { getDatabase } = require('../../src/models/database');
+
+describe('TournamentController.getPlayerPerformance() with a database', () => {
+  const userId = 'performance_user';
+  let database;
+  let tournamentId;
+  let mockRes;
+
+  async function insertGame(result, userColor, centipawnLosses) {
+    const game = await database.insertGame({
+      whitePlayer: 'White',
+      blackPlayer: 'Black',
+      result,
+      date: '2024-01-01',
+      event: 'Performance Open',
+      tournamentId,
+      userId,
+      userColor
+    });
+
+    for (const [index, centipawnLoss] of centipawnLosses.entries()) {
+      await database.insertAnalysis(game.lastID, {
+        move_number: index + 1,
+        move: 'e4',
+        evaluation: 0,
+        centipawn_loss: centipawnLoss,
+        best_move: 'e4'
+      });
+    }
+  }
+
+  beforeAll(async () => {
+    database = getDatabase();
+    await database.initialize();
+    await database.runMigrations();
+  });
+
+  afterAll(async () => {
+    await database.close();
+  });
+
+  beforeEach(async () => {
+    await database.run('DELETE FROM blunder_details');
+    await database.run('DELETE FROM alternative_moves');
+    await database.run('DELETE FROM position_evaluations');
+    await database.run('DELETE FROM analysis');
+    await database.run('DELETE FROM games');
+    await database.run('DELETE FROM tournaments WHERE user_id = ?', [userId]);
+
+    const tournament = await database.insertTournament({ name: 'Performance Open', eventType: 'classical', userId });
+    tournamentId = tournament.lastID;
+
+    mockRes = {
+      status: jest.fn().mockReturnThis(),
+      json: jest.fn().mockReturnThis()
+    };
+  });
+
+  test('should count games without a user_color as black, like the win/loss count', async () => {
+    // White game: the user's moves are 1 and 3
+    await insertGame('1-0', 'white', [10, 99, 30, 99]);
+    // Pre-user_color game: treated as black, so the user's moves are 2 and 4
+    await insertGame('0-1', null, [99, 20, 99, 40]);
+
+    await tournamentController.getPlayerPerformance(
+      { params: { id: String(tournamentId) }, query: {}, userId },
+      mockRes
+    );
+
+    expect(mockRes.json).toHaveBeenCalledWith(expect.objectContaining({
+      totalGames: 2,
+      wins: 2,
+      losses: 0,
+      avgCentipawnLoss: 25
+    }));
+  });
+});
@@ -474,16 +474,11 @@ describe('TournamentController', () => {
         }
       ];
 
-      mockDatabase.all
-        .mockResolvedValueOnce(mockGames) // First call for games
-        .mockResolvedValueOnce([{ centipawn_loss: 20, move_number: 1 }]) // Analysis for game 1
-        .mockResolvedValueOnce([{ centipawn_loss: 15, move_number: 2 }]) // Analysis for game 2
-        .mockResolvedValueOnce([{ centipawn_loss: 10, move_number: 1 }]); // Analysis for game 3
+      mockDatabase.all.mockResolvedValueOnce(mockGames);
 
       mockDatabase.get
-        .mockResolvedValueOnce({ count: 1 }) // Blunders for game 1
-        .mockResolvedValueOnce({ count: 0 }) // Blunders for game 2
-        .mockResolvedValueOnce({ count: 2 }); // Blunders for game 3
+        .mockResolvedValueOnce({ total_centipawn_loss: 45, total_moves: 3 }) // User moves across the tournament
+        .mockResolvedValueOnce({ count: 3 }); // Blunders across the tournament
 
       await tournamentController.getPlayerPerformance(mockReq, mockRes);
 
@@ -500,7 +495,38 @@ describe('TournamentController', () => {
         draws: 1,
         winRate: expect.any(Number),
         avgAccuracy: expect.any(Number),
-        totalBlunders: 3
+        totalBlunders: 3,
+        avgCentipawnLoss: 15
+      }));
+    });
+
+    it('should aggregate moves and blunders in one query each, not per game', async () => {
+      mockReq.params.id = '1';
+
+      const mockGames = Array.from({ length: 20 }, (_, i) => ({
+        id: i + 1,
+        result: '1-0',
+        user_color: 'white'
+      }));
+
+      mockDatabase.all.mockResolvedValueOnce(mockGames);
+      mockDatabase.get
+        .mockResolvedValueOnce({ total_centipawn_loss: 0, total_moves: 0 })
+        .mockResolvedValueOnce({ count: 0 });
+
+      await tournamentController.getPlayerPerformance(mockReq, mockRes);
+
+      expect(mockDatabase.all).toHaveBeenCalledTimes(1);
+      expect(mockDatabase.get).toHaveBeenCalledTimes(2);
+      expect(mockDatabase.get).toHaveBeenCalledWith(
+        expect.stringContaining('g.tournament_id = ?'),
+        [1, 'test-user-123']
+      );
+      expect(mockRes.json).toHaveBeenCalledWith(expect.objectContaining({
+        totalGames: 20,
+        wins: 20,
+        avgAccuracy: 0,
+        avgCentipawnLoss: 0
       }));
     });
 
@@ -6,12 +6,18 @@
 
 // Must mock PGNUploadService BEFORE requiring the controller
 jest.mock('../../src/services/PGNUploadService');
+jest.mock('../../src/services/AnalysisJobService', () => {
+  const MockAnalysisJobService = jest.fn();
+  MockAnalysisJobService.JOB_STATUS = { QUEUED: 'queued', PROCESSING: 'processing', COMPLETED: 'completed', FAILED: 'failed' };
+  return MockAnalysisJobService;
+});
 
 const UploadController = require('../../src/api/controllers/upload.controller');
 const PGNUploadService = require('../../src/services/PGNUploadService');
+const AnalysisJobService = require('../../src/services/AnalysisJobService');
 
 describe('UploadController', () => {
-  let uploadController, mockReq, mockRes, mockUploadService, mockAnalyzer;
+  let uploadController, mockReq, mockRes, mockUploadService, mockAnalyzer, mockJobService;
 
   beforeEach(() => {
     // Reset all mocks before each test
@@ -42,11 +48,20 @@ describe('UploadController', () => {
     // Create mock methods
     mockUploadService = {
       processPGNUpload: jest.fn(),
-      processManualEntry: jest.fn()
+      processManualEntry: jest.fn(),
+      pgnParser: {
+        validatePGN: jest.fn(() => ({ valid: true }))
+      }
+    };
+
+    mockJobService = {
+      enqueue: jest.fn(),
+      getJob: jest.fn()
     };
 
-    // Mock the PGNUploadService constructor to return our mock
+    // Mock the service constructors to return our mocks
     PGNUploadService.mockImplementation(() => mockUploadService);
+    AnalysisJobService.mockImplementation(() => mockJobService);
 
     // Create controller instance with mock analyzer
     uploadController = new UploadController(mockAnalyzer);
@@ -352,4 +367,84 @@ describe('UploadController', () => {
       });
     });
   });
+
+  describe('upload() with async=true', () => {
+    it('should queue the upload and return 202 with a job id', async () => {
+      mockReq.query = { async: 'true' };
+      mockReq.body = { pgnContent: '[Event "Test"]\n1. e4 e5' };
+      mockJobService.enqueue.mockResolvedValue(7);
+
+      await uploadController.upload(mockReq, mockRes);
+
+      expect(mockJobService.enqueue).toHaveBeenCalledWith({
+        pgnContent: '[Event "Test"]\n1. e4 e5',
+        originalFileName: 'uploaded.pgn',
+        assignedTournamentId: null,
+        userId: 'test-user-123',
+        userColor: null
+      });
+      expect(mockUploadService.processPGNUpload).not.toHaveBeenCalled();
+      expect(mockRes.status).toHaveBeenCalledWith(202);
+      expect(mockRes.json).toHaveBeenCalledWith({
+        jobId: 7,
+        status: 'queued',
+        statusUrl: '/api/jobs/7'
+      });
+    });
+
+    it('should accept the async flag in the FormData body', async () => {
+      mockReq.file = { buffer: Buffer.from('[Event "Test"]\n1. e4 e5'), originalname: 'game.pgn' };
+      mockReq.body = { async: 'true' };
+      mockJobService.enqueue.mockResolvedValue(8);
+
+      await uploadController.upload(mockReq, mockRes);
+
+      expect(mockJobService.enqueue).toHaveBeenCalledWith(expect.objectContaining({ originalFileName: 'game.pgn' }));
+      expect(mockRes.status).toHaveBeenCalledWith(202);
+    });
+
+    it('should reject invalid PGN before queueing', async () => {
+      mockReq.query = { async: 'true' };
+      mockReq.body = { pgnContent: 'not a pgn' };
+      mockUploadService.pgnParser.validatePGN.mockReturnValue({ valid: false, error: 'Invalid PGN format' });
+
+      await uploadController.upload(mockReq, mockRes);
+
+      expect(mockJobService.enqueue).not.toHaveBeenCalled();
+      expect(mockRes.status).toHaveBeenCalledWith(400);
+      expect(mockRes.json).toHaveBeenCalledWith({ error: 'Invalid PGN format' });
+    });
+  });
+
+  describe('getJob()', () => {
+    it('should return the job for the current user', async () => {
+      const job = { id: 7, status: 'completed', result: { success: true }, error: null };
+      mockReq.params.id = '7';
+      mockJobService.getJob.mockResolvedValue(job);
+
+      await uploadController.getJob(mockReq, mockRes);
+
+      expect(mockJobService.getJob).toHaveBeenCalledWith(7, 'test-user-123');
+      expect(mockRes.json).toHaveBeenCalledWith(job);
+    });
+
+    it('should return 404 for unknown jobs', async () => {
+      mockReq.params.id = '99';
+      mockJobService.getJob.mockResolvedValue(null);
+
+      await uploadController.getJob(mockReq, mockRes);
+
+      expect(mockRes.status).toHaveBeenCalledWith(404);
+      expect(mockRes.json).toHaveBeenCalledWith({ error: 'Job not found' });
+    });
+
+    it('should return 400 for a non-numeric job id', async () => {
+      mockReq.params.id = 'abc';
+
+      await uploadController.getJob(mockReq, mockRes);
+
+      expect(mockRes.status).toHaveBeenCalledWith(400);
+      expect(mockJobService.getJob).not.toHaveBeenCalled();
+    });
+  });
 });
@@ -0,0 +1,126 @@
+/**
+ * Compression Middleware Tests
+ */
+
+const request = require('supertest');
+const express = require('express');
+const zlib = require('zlib');
+const { compressResponses } = require('../../src/middleware/compression');
+
+describe('compressResponses', () => {
+  let app;
+  const largePayload = {
+    moves: Array.from({ length: 200 }, (_, i) => ({ move_number: i + 1, move: 'e4', evaluation: 20 }))
+  };
+
+  beforeEach(() => {
+    app = express();
+    app.use(compressResponses());
+    app.get('/large', (req, res) => res.json(largePayload));
+    app.get('/small', (req, res) => res.json({ ok: true }));
+    app.get('/html', (req, res) => res.send('<p>'.repeat(1000)));
+    app.get('/binary', (req, res) => res.type('png').send(Buffer.alloc(4096)));
+  });
+
+  it('should gzip large JSON responses', async () => {
+    const response = await request(app)
+      .get('/large')
+      .set('Accept-Encoding', 'gzip')
+      .expect(200);
+
+    expect(response.headers['content-encoding']).toBe('gzip');
+    expect(response.headers['vary']).toContain('Accept-Encoding');
+    expect(response.headers['content-type']).toMatch(/application\/json/);
+    expect(response.body).toEqual(largePayload);
+  });
+
+  it('should prefer brotli when the client accepts it', async () => {
+    const response = await request(app)
+      .get('/large')
+      .set('Accept-Encoding', 'gzip, br')
+      .buffer(true)
+      .parse((res, callback) => {
+        const chunks = [];
+        res.on('data', chunk => chunks.push(chunk));
+        res.on('end', () => callback(null, Buffer.concat(chunks)));
+      });
+
+    expect(response.headers['content-encoding']).toBe('br');
+  });
+
+  it('should fall back to gzip when brotli is refused', async () => {
+    const response = await request(app)
+      .get('/large')
+      .set('Accept-Encoding', 'br;q=0, gzip')
+      .expect(200);
+
+    expect(response.headers['content-encoding']).toBe('gzip');
+    expect(response.body).toEqual(largePayload);
+  });
+
+  it('should send uncompressed bodies to clients without Accept-Encoding', async () => {
+    const response = await request(app)
+      .get('/large')
+      .set('Accept-Encoding', 'identity')
+      .expect(200);
+
+    expect(response.headers['content-encoding']).toBeUndefined();
+    expect(response.body).toEqual(largePayload);
+  });
+
+  it('should leave small and binary responses alone', async () => {
+    const small = await request(app).get('/small').set('Accept-Encoding', 'gzip');
+    const binary = await request(app).get('/binary').set('Accept-Encoding', 'gzip');
+
+    expect(small.headers['content-encoding']).toBeUndefined();
+    expect(binary.headers['content-encoding']).toBeUndefined();
+  });
+
+  it('should keep the html content type for plain strings', async () => {
+    const response = await request(app).get('/html').set('Accept-Encoding', 'gzip');
+
+    expect(response.headers['content-encoding']).toBe('gzip');
+    expect(response.headers['content-type']).toMatch(/text\/html/);
+  });
+
+  it('should compress large responses off the event loop', async () => {
+    const asyncApp = express();
+    asyncApp.use(compressResponses({ asyncThreshold: 2048 }));
+    asyncApp.get('/large', (req, res) => res.json(largePayload));
+
+    const gzipped = await request(asyncApp)
+      .get('/large')
+      .set('Accept-Encoding', 'gzip')
+      .expect(200);
+    const brotli = await request(asyncApp)
+      .get('/large')
+      .set('Accept-Encoding', 'br')
+      .buffer(true)
+      .parse((res, callback) => {
+        const chunks = [];
+        res.on('data', chunk => chunks.push(chunk));
+        res.on('end', () => callback(null, Buffer.concat(chunks)));
+      });
+
+    expect(gzipped.headers['content-encoding']).toBe('gzip');
+    expect(gzipped.body).toEqual(largePayload);
+    expect(brotli.headers['content-encoding']).toBe('br');
+    expect(JSON.parse(zlib.brotliDecompressSync(brotli.body))).toEqual(largePayload);
+
+    await request(asyncApp)
+      .get('/large')
+      .set('Accept-Encoding', 'gzip')
+      .set('If-None-Match', gzipped.headers.etag)
+      .expect(304);
+  });
+
+  it('should answer repeat requests with 304 Not Modified', async () => {
+    const first = await request(app).get('/large').set('Accept-Encoding', 'gzip');
+
+    await request(app)
+      .get('/large')
+      .set('Accept-Encoding', 'gzip')
+      .set('If-None-Match', first.headers.etag)
+      .expect(304);
+  });
+});
@@ -0,0 +1,91 @@
+/**
+ * Frontend Serving Middleware Tests
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const request = require('supertest');
+const express = require('express');
+const { frontendStatic, sendFrontendIndex } = require('../../src/middleware/frontend');
+
+describe('Frontend serving', () => {
+  let app;
+  let distDir;
+  let indexPath;
+
+  beforeEach(() => {
+    distDir = fs.mkdtempSync(path.join(os.tmpdir(), 'frontend-test-'));
+    indexPath = path.join(distDir, 'index-angular.html');
+    fs.writeFileSync(indexPath, '<html><script src="main.0123456789abcdef.js"></script></html>');
+    fs.writeFileSync(path.join(distDir, 'main.0123456789abcdef.js'), 'console.log(1);');
+    fs.writeFileSync(path.join(distDir, 'favicon.ico'), 'icon');
+
+    app = express();
+    app.use(frontendStatic(distDir));
+    app.get('*', sendFrontendIndex(indexPath));
+  });
+
+  afterEach(() => {
+    fs.rmSync(distDir, { recursive: true, force: true });
+  });
+
+  it('should cache content-hashed bundles for a year', async () => {
+    const response = await request(app).get('/main.0123456789abcdef.js').expect(200);
+
+    expect(response.headers['cache-control']).toBe('public, max-age=31536000, immutable');
+  });
+
+  it('should cache unhashed static files for an hour', async () => {
+    const response = await request(app).get('/favicon.ico').expect(200);
+
+    expect(response.headers['cache-control']).toBe('public, max-age=3600');
+  });
+
+  it('should serve the index page for app routes with revalidation', async () => {
+    const response = await request(app).get('/games/42').expect(200);
+
+    expect(response.headers['content-type']).toMatch(/text\/html/);
+    expect(response.headers['cache-control']).toBe('no-cache');
+    expect(response.text).toContain('main.0123456789abcdef.js');
+  });
+
+  it('should answer an unchanged index page with 304', async () => {
+    const first = await request(app).get('/dashboard');
+
+    await request(app)
+      .get('/dashboard')
+      .set('If-None-Match', first.headers.etag)
+      .expect(304);
+  });
+
+  it('should pick up a rebuilt index page', async () => {
+    await request(app).get('/').expect(200);
+
+    fs.writeFileSync(indexPath, '<html>rebuilt</html>');
+    const future = new Date(Date.now() + 5000);
+    fs.utimesSync(indexPath, future, future);
+
+    const response = await request(app).get('/').expect(200);
+    expect(response.text).toBe('<html>rebuilt</html>');
+  });
+
+  it('should not re-read the index page when not watching', async () => {
+    const staticApp = express();
+    staticApp.get('*', sendFrontendIndex(indexPath, { watch: false }));
+    await request(staticApp).get('/').expect(200);
+
+    fs.writeFileSync(indexPath, '<html>rebuilt</html>');
+    const future = new Date(Date.now() + 5000);
+    fs.utimesSync(indexPath, future, future);
+
+    const response = await request(staticApp).get('/').expect(200);
+    expect(response.text).toContain('main.0123456789abcdef.js');
+  });
+
+  it('should return 404 when the frontend is not built', async () => {
+    fs.rmSync(indexPath);
+
+    await request(app).get('/dashboard').expect(404);
+  });
+});
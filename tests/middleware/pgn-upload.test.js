@@ -0,0 +1,117 @@
+/**
+ * PGN Upload Middleware Tests
+ */
+
+const request = require('supertest');
+const express = require('express');
+const multer = require('multer');
+const { PassThrough } = require('stream');
+const {
+  pgnMemoryStorage,
+  pgnFileFilter,
+  handleUploadErrors,
+  sniffPGN
+} = require('../../src/middleware/pgn-upload');
+
+describe('PGN upload middleware', () => {
+  const validPGN = '[Event "Test"]\n[White "A"]\n[Black "B"]\n\n1. e4 e5 1-0\n';
+
+  describe('sniffPGN', () => {
+    it('should accept tag pairs, comments and bare movetext', () => {
+      expect(sniffPGN(Buffer.from(validPGN))).toBe('ok');
+      expect(sniffPGN(Buffer.from('﻿\n  [Event "Test"]'))).toBe('ok');
+      expect(sniffPGN(Buffer.from('{ annotated by club } [Event "x"]'))).toBe('ok');
+      expect(sniffPGN(Buffer.from('1. d4 d5'))).toBe('ok');
+    });
+
+    it('should wait while only whitespace has arrived', () => {
+      expect(sniffPGN(Buffer.from('\n\n   '))).toBe('undecided');
+    });
+
+    it('should reject binary and non-PGN content', () => {
+      expect(sniffPGN(Buffer.from([0x89, 0x50, 0x4e, 0x47, 0x00]))).toMatch(/binary/);
+      expect(sniffPGN(Buffer.from('<html><body>'))).toMatch(/does not look like PGN/);
+    });
+  });
+
+  describe('pgnMemoryStorage', () => {
+    function handleChunks(chunks) {
+      return new Promise((resolve) => {
+        const stream = new PassThrough();
+        pgnMemoryStorage()._handleFile({}, { stream }, (error, info) => resolve({ error, info }));
+        chunks.forEach(chunk => stream.write(chunk));
+        stream.end();
+      });
+    }
+
+    it('should reject binary data arriving after a PGN-looking first chunk', async () => {
+      const { error } = await handleChunks([Buffer.from(validPGN), Buffer.from([0x50, 0x4b, 0x00, 0x03])]);
+
+      expect(error.message).toMatch(/binary/);
+    });
+
+    it('should only scan the first 64KB for NUL bytes', async () => {
+      const start = Buffer.from(validPGN.padEnd(64 * 1024, ' '));
+      const { error, info } = await handleChunks([start, Buffer.from([0x00])]);
+
+      expect(error).toBeNull();
+      expect(info.size).toBe(64 * 1024 + 1);
+    });
+  });
+
+  describe('multer integration', () => {
+    let app;
+
+    beforeEach(() => {
+      app = express();
+      const upload = multer({ storage: pgnMemoryStorage(), fileFilter: pgnFileFilter, limits: { fileSize: 1024 } });
+      app.post('/upload', upload.single('pgn'), (req, res) => {
+        res.json({ content: req.file.buffer.toString('utf-8'), size: req.file.size });
+      });
+      app.use(handleUploadErrors);
+    });
+
+    it('should buffer a valid PGN upload', async () => {
+      const response = await request(app)
+        .post('/upload')
+        .attach('pgn', Buffer.from(validPGN), 'game.pgn')
+        .expect(200);
+
+      expect(response.body).toEqual({ content: validPGN, size: Buffer.byteLength(validPGN) });
+    });
+
+    it('should reject files that are not PGN by content', async () => {
+      const response = await request(app)
+        .post('/upload')
+        .attach('pgn', Buffer.from('<html></html>'), 'game.pgn')
+        .expect(400);
+
+      expect(response.body.error).toMatch(/does not look like PGN/);
+    });
+
+    it('should reject other file types before reading them', async () => {
+      const response = await request(app)
+        .post('/upload')
+        .attach('pgn', Buffer.from(validPGN), { filename: 'game.exe', contentType: 'application/octet-stream' })
+        .expect(400);
+
+      expect(response.body.error).toBe('Only .pgn files can be uploaded');
+    });
+
+    it('should reject empty files', async () => {
+      const response = await request(app)
+        .post('/upload')
+        .attach('pgn', Buffer.from('   \n'), 'game.pgn')
+        .expect(400);
+
+      expect(response.body.error).toBe('Uploaded PGN file is empty');
+    });
+
+    it('should answer oversized uploads with 413', async () => {
+      await request(app)
+        .post('/upload')
+        .attach('pgn', Buffer.from(validPGN.repeat(100)), 'game.pgn')
+        .expect(413);
+    });
+  });
+});
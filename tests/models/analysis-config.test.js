@@ -131,4 +131,45 @@ describe('AnalysisConfig', () => {
       expect(AnalysisConfig.getClassificationByCpLoss(0, -10000)).toBe('blunder');
     });
   });
+
+  describe('ENGINE environment overrides', () => {
+    const originalEnv = { ...process.env };
+
+    afterEach(() => {
+      process.env = { ...originalEnv };
+    });
+
+    function loadEngineConfig(env) {
+      Object.assign(process.env, env);
+      let config;
+      jest.isolateModules(() => {
+        config = require('../../src/models/analysis-config');
+      });
+      return config.ENGINE;
+    }
+
+    test('should fall back to the default warm pool size for a non-numeric value', () => {
+      expect(loadEngineConfig({ STOCKFISH_WARM_POOL_SIZE: 'two' }).WARM_POOL_SIZE).toBe(1);
+    });
+
+    test('should allow disabling the warm pool', () => {
+      expect(loadEngineConfig({ STOCKFISH_WARM_POOL_SIZE: '0' }).WARM_POOL_SIZE).toBe(0);
+    });
+
+    test('should not tie the hash size to the number of engines', () => {
+      const single = loadEngineConfig({ STOCKFISH_SEARCH_WORKERS: '1', STOCKFISH_WARM_POOL_SIZE: '0' });
+      const parallel = loadEngineConfig({ STOCKFISH_SEARCH_WORKERS: '4', STOCKFISH_WARM_POOL_SIZE: '2' });
+
+      // Same Hash on every host keeps searches and persisted evaluations comparable
+      expect(parallel.HASH_MB).toBe(single.HASH_MB);
+    });
+
+    test('should use an explicit per-engine hash size', () => {
+      expect(loadEngineConfig({ STOCKFISH_HASH_MB: '256', STOCKFISH_SEARCH_WORKERS: '4' }).HASH_MB).toBe(256);
+    });
+
+    test('should fall back to one thread for a non-numeric value', () => {
+      expect(loadEngineConfig({ STOCKFISH_THREADS: 'auto' }).THREADS).toBe(1);
+    });
+  });
 });
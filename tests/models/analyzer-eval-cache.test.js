@@ -0,0 +1,149 @@
+/**
+ * ChessAnalyzer Evaluation Cache Tests
+ *
+ * Verifies the in-process transposition table around evaluatePosition()
+ * and the reuse of the post-move evaluation as the next pre-move evaluation.
+ */
+
+const ChessAnalyzer = require('../../src/models/analyzer');
+const AnalysisConfig = require('../../src/models/analysis-config');
+
+describe('ChessAnalyzer Evaluation Cache', () => {
+  let analyzer;
+  const startingFen = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1';
+
+  beforeEach(() => {
+    analyzer = new ChessAnalyzer();
+    analyzer._evaluateWithFreshEngine = jest.fn(async () => ({ bestMove: 'e2e4', evaluation: 25 }));
+  });
+
+  afterEach(async () => {
+    if (analyzer) {
+      await analyzer.close();
+    }
+  });
+
+  test('should only search a position once for the same search limit', async () => {
+    const first = await analyzer.evaluatePosition(startingFen, { nodes: 1000 });
+    const second = await analyzer.evaluatePosition(startingFen, { nodes: 1000 });
+
+    expect(first).toEqual({ bestMove: 'e2e4', evaluation: 25 });
+    expect(second).toEqual(first);
+    expect(analyzer._evaluateWithFreshEngine).toHaveBeenCalledTimes(1);
+  });
+
+  test('should search again for a different search limit', async () => {
+    await analyzer.evaluatePosition(startingFen, { nodes: 1000 });
+    await analyzer.evaluatePosition(startingFen, { nodes: 2000 });
+    await analyzer.evaluatePosition(startingFen, 10);
+
+    expect(analyzer._evaluateWithFreshEngine).toHaveBeenCalledTimes(3);
+  });
+
+  test('should share entries between move numbers of the same position', async () => {
+    await analyzer.evaluatePosition(startingFen, 10);
+    await analyzer.evaluatePosition(startingFen.replace(/ 1$/, ' 7'), 10);
+
+    expect(analyzer._evaluateWithFreshEngine).toHaveBeenCalledTimes(1);
+  });
+
+  test('should keep the halfmove clock in the key', async () => {
+    await analyzer.evaluatePosition(startingFen, 10);
+    await analyzer.evaluatePosition(startingFen.replace(' 0 1', ' 12 1'), 10);
+
+    expect(analyzer._evaluateWithFreshEngine).toHaveBeenCalledTimes(2);
+  });
+
+  test('should not cache incomplete searches', async () => {
+    analyzer._evaluateWithFreshEngine = jest.fn(async () => ({ bestMove: 'e4', evaluation: 0, incomplete: true }));
+
+    await analyzer.evaluatePosition(startingFen, 10);
+    await analyzer.evaluatePosition(startingFen, 10);
+
+    expect(analyzer._evaluateWithFreshEngine).toHaveBeenCalledTimes(2);
+  });
+
+  test('should evict the least recently used entry when full', async () => {
+    const originalMax = AnalysisConfig.EVAL_CACHE.MAX_ENTRIES;
+    AnalysisConfig.EVAL_CACHE.MAX_ENTRIES = 2;
+
+    try {
+      await analyzer.evaluatePosition('fen-a', 10);
+      await analyzer.evaluatePosition('fen-b', 10);
+      await analyzer.evaluatePosition('fen-a', 10); // Touch a, b becomes oldest
+      await analyzer.evaluatePosition('fen-c', 10); // Evicts b
+
+      expect(analyzer.evaluationCache.size).toBe(2);
+      expect(analyzer.evaluationCache.has(analyzer._evaluationCacheKey('fen-a', { depth: 10 }))).toBe(true);
+      expect(analyzer.evaluationCache.has(analyzer._evaluationCacheKey('fen-b', { depth: 10 }))).toBe(false);
+    } finally {
+      AnalysisConfig.EVAL_CACHE.MAX_ENTRIES = originalMax;
+    }
+  });
+
+  test('should evaluate each position of a game once', async () => {
+    analyzer.isReady = true;
+    analyzer.setupEngine = jest.fn(() => { analyzer.isReady = true; });
+    analyzer.generateAlternatives = jest.fn(async () => []);
+
+    const moves = ['e4', 'e5', 'Nf3'];
+    const result = await analyzer.analyzeGame(moves, false);
+
+    expect(result.moves).toHaveLength(3);
+    // Starting position + one position after each move
+    expect(analyzer._evaluateWithFreshEngine).toHaveBeenCalledTimes(moves.length + 1);
+  }, 10000);
+
+  describe('persistent cache', () => {
+    let mockDatabase;
+
+    beforeEach(() => {
+      mockDatabase = {
+        getCachedEngineEvaluation: jest.fn(async () => null),
+        storeCachedEngineEvaluation: jest.fn(async () => {})
+      };
+      analyzer.setPersistentCache(mockDatabase);
+      analyzer.engineName = 'Stockfish 16';
+    });
+
+    test('should use a stored evaluation instead of searching', async () => {
+      mockDatabase.getCachedEngineEvaluation.mockResolvedValue({ bestMove: 'd2d4', evaluation: 31 });
+
+      const result = await analyzer.evaluatePosition(startingFen, { nodes: 1000 });
+
+      expect(result).toEqual({ bestMove: 'd2d4', evaluation: 31 });
+      expect(analyzer._evaluateWithFreshEngine).not.toHaveBeenCalled();
+      expect(mockDatabase.getCachedEngineEvaluation).toHaveBeenCalledWith(
+        expect.stringContaining('|nodes 1000|Stockfish 16|')
+      );
+    });
+
+    test('should store completed searches', async () => {
+      await analyzer.evaluatePosition(startingFen, { nodes: 1000 });
+
+      expect(mockDatabase.storeCachedEngineEvaluation).toHaveBeenCalledWith(
+        expect.stringContaining('Stockfish 16'),
+        { bestMove: 'e2e4', evaluation: 25 }
+      );
+    });
+
+    test('should not persist before the engine has identified itself', async () => {
+      analyzer.engineName = null;
+
+      await analyzer.evaluatePosition(startingFen, { nodes: 1000 });
+
+      expect(mockDatabase.getCachedEngineEvaluation).not.toHaveBeenCalled();
+      expect(mockDatabase.storeCachedEngineEvaluation).not.toHaveBeenCalled();
+    });
+
+    test('should fall back to searching when the lookup fails', async () => {
+      const warnSpy = jest.spyOn(console, 'warn').mockImplementation();
+      mockDatabase.getCachedEngineEvaluation.mockRejectedValue(new Error('database is locked'));
+
+      const result = await analyzer.evaluatePosition(startingFen, { nodes: 1000 });
+
+      expect(result).toEqual({ bestMove: 'e2e4', evaluation: 25 });
+      warnSpy.mockRestore();
+    });
+  });
+});
@@ -0,0 +1,79 @@
+/**
+ * ChessAnalyzer Opening Book Tests
+ *
+ * Leading moves that follow a known opening line are not searched; book
+ * positions take the evaluation of the first position out of book.
+ */
+
+const ChessAnalyzer = require('../../src/models/analyzer');
+const AnalysisConfig = require('../../src/models/analysis-config');
+
+describe('ChessAnalyzer Opening Book', () => {
+  let analyzer;
+  let originalEnabled;
+  const fullOptions = { nodes: AnalysisConfig.NODES.STANDARD };
+
+  beforeEach(() => {
+    originalEnabled = AnalysisConfig.OPENING_BOOK.ENABLED;
+    analyzer = new ChessAnalyzer();
+    jest.spyOn(console, 'log').mockImplementation();
+  });
+
+  afterEach(async () => {
+    AnalysisConfig.OPENING_BOOK.ENABLED = originalEnabled;
+    console.log.mockRestore();
+    if (analyzer) {
+      await analyzer.close();
+    }
+  });
+
+  test('should not look up the book when disabled', () => {
+    AnalysisConfig.OPENING_BOOK.ENABLED = false;
+
+    expect(analyzer._openingBookLine(['e4', 'e5', 'Nf3', 'Nc6', 'Bb5'])).toBeNull();
+  });
+
+  test('should find the longest known opening line', () => {
+    AnalysisConfig.OPENING_BOOK.ENABLED = true;
+
+    const book = analyzer._openingBookLine(['e4', 'e5', 'Nf3', 'Nc6', 'Bb5', 'a6', 'h4']);
+
+    expect(book.fens).toHaveLength(6);
+    expect(book.bookMoves).toEqual(['e2e4', 'e7e5', 'g1f3', 'b8c6', 'f1b5', 'a7a6']);
+  });
+
+  test('should return null when the game leaves theory on move one', () => {
+    AnalysisConfig.OPENING_BOOK.ENABLED = true;
+
+    expect(analyzer._openingBookLine(['a4', 'h5'])).toBeNull();
+  });
+
+  test('should only search positions out of book', async () => {
+    AnalysisConfig.OPENING_BOOK.ENABLED = true;
+    const moves = ['e4', 'c5', 'Nf3', 'a6'];
+    const positions = analyzer._collectPositions(moves);
+    analyzer.evaluatePosition = jest.fn(async () => ({ bestMove: 'd2d4', evaluation: 40 }));
+
+    const evaluations = await analyzer._evaluateMainline(moves, positions, fullOptions);
+
+    // Book line "e4 c5 Nf3": searched only from the position after 2. Nf3
+    expect(analyzer.evaluatePosition.mock.calls.map(([fen]) => fen)).toEqual([positions[3], positions[4]]);
+    // Black to move after 2. Nf3 scores +40; White to move one ply earlier sees -40
+    expect(evaluations.get(positions[2])).toEqual({ bestMove: 'g1f3', evaluation: -40, book: true });
+    expect(evaluations.get(positions[1])).toEqual({ bestMove: 'c7c5', evaluation: 40, book: true });
+    expect(evaluations.get(positions[0]).bestMove).toBe('e2e4');
+  });
+
+  test('should score book moves with zero centipawn loss', async () => {
+    AnalysisConfig.OPENING_BOOK.ENABLED = true;
+    analyzer.isReady = true;
+    analyzer.setupEngine = jest.fn(() => { analyzer.isReady = true; });
+    analyzer.generateAlternatives = jest.fn(async () => []);
+    analyzer._evaluateWithFreshEngine = jest.fn(async () => ({ bestMove: 'd2d4', evaluation: 35 }));
+
+    const result = await analyzer.analyzeGame(['e4', 'c5', 'Nf3', 'a6'], false);
+
+    expect(result.moves.slice(0, 3).map(m => m.centipawn_loss)).toEqual([0, 0, 0]);
+    expect(analyzer._evaluateWithFreshEngine).toHaveBeenCalledTimes(2);
+  }, 10000);
+});
@@ -0,0 +1,111 @@
+/**
+ * ChessAnalyzer Parallel Search Tests
+ *
+ * Verifies that the positions of a game are searched concurrently
+ * (bounded by ENGINE.SEARCH_WORKERS) and that the result does not depend
+ * on the order in which searches complete.
+ */
+
+const ChessAnalyzer = require('../../src/models/analyzer');
+const AnalysisConfig = require('../../src/models/analysis-config');
+
+describe('ChessAnalyzer Parallel Search', () => {
+  let analyzer;
+  let originalWorkers;
+
+  beforeEach(() => {
+    originalWorkers = AnalysisConfig.ENGINE.SEARCH_WORKERS;
+    analyzer = new ChessAnalyzer();
+    analyzer.isReady = true;
+    analyzer.setupEngine = jest.fn(() => { analyzer.isReady = true; });
+    analyzer.generateAlternatives = jest.fn(async () => []);
+  });
+
+  afterEach(async () => {
+    AnalysisConfig.ENGINE.SEARCH_WORKERS = originalWorkers;
+    if (analyzer) {
+      await analyzer.close();
+    }
+  });
+
+  test('should collect each distinct position of the mainline once', () => {
+    const positions = analyzer._collectPositions(['e4', 'e5', 'Nf3', 'Nc6']);
+
+    expect(positions).toHaveLength(5);
+    expect(positions[0]).toBe('rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1');
+  });
+
+  test('should skip invalid moves when collecting positions', () => {
+    const positions = analyzer._collectPositions(['e4', 'Qxh7', 'e5']);
+
+    expect(positions).toHaveLength(3);
+  });
+
+  test('should never run more searches than SEARCH_WORKERS at once', async () => {
+    AnalysisConfig.ENGINE.SEARCH_WORKERS = 3;
+    let inFlight = 0;
+    let maxInFlight = 0;
+
+    const fens = ['a', 'b', 'c', 'd', 'e', 'f', 'g'];
+    const results = await analyzer._searchPositions(fens, async (fen) => {
+      inFlight++;
+      maxInFlight = Math.max(maxInFlight, inFlight);
+      await new Promise(resolve => setTimeout(resolve, 5));
+      inFlight--;
+      return fen.toUpperCase();
+    });
+
+    expect(maxInFlight).toBe(3);
+    expect([...results.keys()]).toEqual(fens);
+    expect(results.get('d')).toBe('D');
+  });
+
+  test('should leave failed searches out of the results', async () => {
+    const warnSpy = jest.spyOn(console, 'warn').mockImplementation();
+
+    const results = await analyzer._searchPositions(['a', 'b'], async (fen) => {
+      if (fen === 'a') throw new Error('engine crashed');
+      return fen;
+    });
+
+    expect(results.has('a')).toBe(false);
+    expect(results.get('b')).toBe('b');
+    warnSpy.mockRestore();
+  });
+
+  test('should produce identical analysis regardless of completion order', async () => {
+    const moves = ['e4', 'e5', 'Nf3', 'Nc6', 'Bb5', 'a6'];
+    // Deterministic evaluation per position, with random completion delays
+    const evaluationFor = fen => ({ bestMove: 'e2e4', evaluation: (fen.length * 7) % 90 - 45 });
+    const searchWithJitter = async (fen) => {
+      await new Promise(resolve => setTimeout(resolve, Math.floor(Math.random() * 10)));
+      return evaluationFor(fen);
+    };
+
+    AnalysisConfig.ENGINE.SEARCH_WORKERS = 1;
+    analyzer._evaluateWithFreshEngine = jest.fn(searchWithJitter);
+    const sequential = await analyzer.analyzeGame(moves, false);
+
+    AnalysisConfig.ENGINE.SEARCH_WORKERS = 4;
+    analyzer.evaluationCache.clear();
+    analyzer._evaluateWithFreshEngine = jest.fn(searchWithJitter);
+    const parallel = await analyzer.analyzeGame(moves, false);
+
+    expect(parallel).toEqual(sequential);
+    expect(analyzer._evaluateWithFreshEngine).toHaveBeenCalledTimes(moves.length + 1);
+  }, 10000);
+
+  test('should analyze again after being closed', async () => {
+    const moves = ['e4', 'e5', 'Nf3'];
+    analyzer._evaluateWithFreshEngine = jest.fn(async () => ({ bestMove: 'e2e4', evaluation: 20 }));
+    const first = await analyzer.analyzeGame(moves, false);
+
+    await analyzer.close();
+
+    // The engine pool is usable again and the main engine restarts on demand
+    expect(analyzer.enginePool.closed).toBe(false);
+    const second = await analyzer.analyzeGame(moves, false);
+    expect(second).toEqual(first);
+    expect(analyzer.setupEngine).toHaveBeenCalled();
+  });
+});
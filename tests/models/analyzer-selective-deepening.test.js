@@ -0,0 +1,80 @@
+/**
+ * ChessAnalyzer Selective Deepening Tests
+ *
+ * Screening pass at a cheap search limit, full-strength re-search only
+ * around moves that look like an inaccuracy or worse.
+ */
+
+const ChessAnalyzer = require('../../src/models/analyzer');
+const AnalysisConfig = require('../../src/models/analysis-config');
+
+describe('ChessAnalyzer Selective Deepening', () => {
+  let analyzer;
+  let originalEnabled;
+  const fullOptions = { nodes: AnalysisConfig.NODES.STANDARD };
+
+  beforeEach(() => {
+    originalEnabled = AnalysisConfig.SELECTIVE_DEEPENING.ENABLED;
+    analyzer = new ChessAnalyzer();
+  });
+
+  afterEach(async () => {
+    AnalysisConfig.SELECTIVE_DEEPENING.ENABLED = originalEnabled;
+    if (analyzer) {
+      await analyzer.close();
+    }
+  });
+
+  test('should search every position at full strength when disabled', async () => {
+    AnalysisConfig.SELECTIVE_DEEPENING.ENABLED = false;
+    analyzer.evaluatePosition = jest.fn(async () => ({ bestMove: 'e2e4', evaluation: 20 }));
+
+    const moves = ['e4', 'e5', 'Nf3'];
+    await analyzer._evaluateMainline(moves, analyzer._collectPositions(moves), fullOptions);
+
+    expect(analyzer.evaluatePosition).toHaveBeenCalledTimes(4);
+    analyzer.evaluatePosition.mock.calls.forEach(([, options]) => {
+      expect(options).toEqual(fullOptions);
+    });
+  });
+
+  test('should only re-search positions around a suspicious move', async () => {
+    AnalysisConfig.SELECTIVE_DEEPENING.ENABLED = true;
+    const moves = ['e4', 'e5', 'Qh5', 'Nc6', 'Qxf7+'];
+    const positions = analyzer._collectPositions(moves);
+    const logSpy = jest.spyOn(console, 'log').mockImplementation();
+
+    // Side-to-move evaluations: quiet until Black's 2...Nc6, which loses 280cp
+    const screenEvals = [20, -20, 20, -20, 300, -300];
+    analyzer.evaluatePosition = jest.fn(async (fen, options) => {
+      const index = positions.indexOf(fen);
+      if (options.nodes === AnalysisConfig.NODES.SCREEN) {
+        return { bestMove: 'e2e4', evaluation: screenEvals[index] };
+      }
+      return { bestMove: 'e2e4', evaluation: screenEvals[index] + 1, deep: true };
+    });
+
+    const evaluations = await analyzer._evaluateMainline(moves, positions, fullOptions);
+
+    const deepCalls = analyzer.evaluatePosition.mock.calls.filter(([, options]) => options === fullOptions);
+    // Position before 2...Nc6 and after it
+    expect(deepCalls.map(([fen]) => fen)).toEqual([positions[3], positions[4]]);
+    expect(evaluations.get(positions[3]).deep).toBe(true);
+    expect(evaluations.get(positions[0]).deep).toBeUndefined();
+    expect(evaluations.get(positions[3]).screenEvaluation).toBe(-20);
+    logSpy.mockRestore();
+  });
+
+  test('should score moves next to a re-searched move from screening evaluations only', () => {
+    const screened = { bestMove: 'd1h5', evaluation: 20 };
+    const deepened = { bestMove: 'b8c6', evaluation: -60, screenEvaluation: -20 };
+    const otherDeepened = { bestMove: 'h5f7', evaluation: 310, screenEvaluation: 300 };
+
+    // 2. Qh5: screened before, re-searched after
+    expect(analyzer._pairedScores(screened, deepened)).toEqual([20, -20]);
+    // 2...Nc6: both re-searched at full strength
+    expect(analyzer._pairedScores(deepened, otherDeepened)).toEqual([-60, 310]);
+    // Quiet move, both screened
+    expect(analyzer._pairedScores(screened, { evaluation: -25 })).toEqual([20, -25]);
+  });
+});
@@ -0,0 +1,127 @@
+const { getDatabase } = require('../../src/models/database');
+const { TARGET_PLAYER } = require('../../src/config/app-config');
+
+describe('Database - Batch Inserts', () => {
+  let database;
+  let gameId;
+
+  beforeAll(async () => {
+    database = getDatabase();
+    await database.initialize();
+    await database.runMigrations();
+  });
+
+  afterAll(async () => {
+    await database.close();
+  });
+
+  beforeEach(async () => {
+    // Child tables first, then parent tables
+    await database.run('DELETE FROM blunder_details');
+    await database.run('DELETE FROM alternative_moves');
+    await database.run('DELETE FROM position_evaluations');
+    await database.run('DELETE FROM analysis');
+    await database.run('DELETE FROM games');
+
+    const game = await database.run(
+      `INSERT INTO games (pgn_file_path, white_player, black_player, result, date, event, pgn_content)
+       VALUES (?, ?, ?, ?, ?, ?, ?)`,
+      ['test.pgn', TARGET_PLAYER, 'Opponent', '1-0', '2024-01-01', 'Test Event', 'test pgn']
+    );
+    gameId = game.lastID;
+  });
+
+  test('insertRows should split large inserts into multiple statements', async () => {
+    const runSpy = jest.spyOn(database, 'run');
+    const fen = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1';
+    const rows = Array.from({ length: 400 }, (_, i) => [gameId, i + 1, fen, 10, 'e2e4', 12, null]);
+
+    const inserted = await database.insertRows(
+      'position_evaluations',
+      ['game_id', 'move_number', 'fen', 'evaluation', 'best_move', 'depth', 'mate_in'],
+      rows
+    );
+
+    // 7 columns -> 142 rows per statement
+    expect(inserted).toBe(400);
+    expect(runSpy).toHaveBeenCalledTimes(3);
+    runSpy.mockRestore();
+
+    const count = await database.get('SELECT COUNT(*) as count FROM position_evaluations WHERE game_id = ?', [gameId]);
+    expect(Number(count.count)).toBe(400);
+  });
+
+  test('insertRows should roll back earlier chunks when a later chunk fails', async () => {
+    const fen = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1';
+    const rows = Array.from({ length: 400 }, (_, i) => [gameId, i + 1, fen, 10, 'e2e4', 12, null]);
+    // The last chunk references a game that does not exist (foreign key violation)
+    rows[399][0] = gameId + 100000;
+
+    await expect(database.insertRows(
+      'position_evaluations',
+      ['game_id', 'move_number', 'fen', 'evaluation', 'best_move', 'depth', 'mate_in'],
+      rows
+    )).rejects.toThrow();
+
+    const count = await database.get('SELECT COUNT(*) as count FROM position_evaluations WHERE game_id = ?', [gameId]);
+    expect(Number(count.count)).toBe(0);
+  });
+
+  test('insertRows should do nothing for an empty batch', async () => {
+    const runSpy = jest.spyOn(database, 'run');
+
+    const inserted = await database.insertRows('analysis', ['game_id'], []);
+
+    expect(inserted).toBe(0);
+    expect(runSpy).not.toHaveBeenCalled();
+    runSpy.mockRestore();
+  });
+
+  test('insertAnalysisBatch should store every move and blunder details', async () => {
+    const analysisRows = Array.from({ length: 60 }, (_, i) => ({
+      move_number: i + 1,
+      move: 'e4',
+      evaluation: 20,
+      centipawn_loss: 0,
+      best_move: 'e4',
+      fen_before: 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+    }));
+    analysisRows[4] = {
+      ...analysisRows[4],
+      move: 'Qh5',
+      evaluation: -250,
+      centipawn_loss: 270,
+      is_blunder: true,
+      categorization: {
+        phase: 'opening',
+        tactical_theme: 'hanging_piece',
+        position_type: 'tactical',
+        blunder_severity: 'major',
+        difficulty_level: 3
+      }
+    };
+
+    const inserted = await database.insertAnalysisBatch(gameId, analysisRows);
+
+    expect(inserted).toBe(60);
+    const stored = await database.all('SELECT move_number, move FROM analysis WHERE game_id = ? ORDER BY move_number', [gameId]);
+    expect(stored).toHaveLength(60);
+    expect(stored[4].move).toBe('Qh5');
+
+    const blunders = await database.all('SELECT move_number FROM blunder_details WHERE game_id = ?', [gameId]);
+    expect(blunders).toHaveLength(1);
+    expect(blunders[0].move_number).toBe(5);
+  });
+
+  test('storeAlternativeMovesBatch should store alternatives for all moves', async () => {
+    await database.storeAlternativeMovesBatch(gameId, [
+      { moveNumber: 1, alternatives: [{ move: 'd4', evaluation: 20 }, { move: 'Nf3', evaluation: 18, line: ['Nf3', 'd5'] }] },
+      { moveNumber: 2, alternatives: [{ move: 'c5', evaluation: -15, depth: 12 }] }
+    ]);
+
+    const stored = await database.all('SELECT * FROM alternative_moves WHERE game_id = ? ORDER BY id', [gameId]);
+    expect(stored).toHaveLength(3);
+    expect(stored[1].line_moves).toBe('Nf3 d5');
+    expect(stored[2].depth).toBe(12);
+  });
+});
@@ -0,0 +1,58 @@
+const { getDatabase } = require('../../src/models/database');
+
+describe('Database - Engine Evaluation Cache', () => {
+  let database;
+  const cacheKey = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0|nodes 1000000|Stockfish 16|hash 512|threads 1';
+
+  beforeAll(async () => {
+    database = getDatabase();
+    await database.initialize();
+    await database.runMigrations();
+  });
+
+  afterAll(async () => {
+    await database.close();
+  });
+
+  beforeEach(async () => {
+    await database.run('DELETE FROM engine_eval_cache');
+  });
+
+  test('should return null for an unknown position', async () => {
+    expect(await database.getCachedEngineEvaluation(cacheKey)).toBeNull();
+  });
+
+  test('should round-trip a stored evaluation', async () => {
+    await database.storeCachedEngineEvaluation(cacheKey, { bestMove: 'e2e4', evaluation: 32 });
+
+    expect(await database.getCachedEngineEvaluation(cacheKey)).toEqual({ bestMove: 'e2e4', evaluation: 32 });
+  });
+
+  test('should keep the first evaluation stored for a key', async () => {
+    await database.storeCachedEngineEvaluation(cacheKey, { bestMove: 'e2e4', evaluation: 32 });
+    await database.storeCachedEngineEvaluation(cacheKey, { bestMove: 'd2d4', evaluation: 28 });
+
+    const rows = await database.all('SELECT * FROM engine_eval_cache WHERE cache_key = ?', [cacheKey]);
+    expect(rows).toHaveLength(1);
+    expect(rows[0].best_move).toBe('e2e4');
+  });
+
+  test('should prune all but the newest evaluations', async () => {
+    for (let i = 0; i < 5; i++) {
+      await database.storeCachedEngineEvaluation(`${cacheKey}|${i}`, { bestMove: 'e2e4', evaluation: i });
+    }
+
+    const deleted = await database.pruneEngineEvalCache(2);
+
+    const rows = await database.all('SELECT cache_key FROM engine_eval_cache ORDER BY id');
+    expect(deleted).toBe(3);
+    expect(rows.map(row => row.cache_key)).toEqual([`${cacheKey}|3`, `${cacheKey}|4`]);
+  });
+
+  test('should not prune below the row limit', async () => {
+    await database.storeCachedEngineEvaluation(cacheKey, { bestMove: 'e2e4', evaluation: 32 });
+
+    expect(await database.pruneEngineEvalCache(10)).toBe(0);
+    expect(await database.getCachedEngineEvaluation(cacheKey)).not.toBeNull();
+  });
+});
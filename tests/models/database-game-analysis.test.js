@@ -0,0 +1,92 @@
+const { getDatabase } = require('../../src/models/database');
+const { TARGET_PLAYER } = require('../../src/config/app-config');
+
+describe('Database - Game Analysis Serialization', () => {
+  let database;
+  let gameId;
+
+  beforeAll(async () => {
+    database = getDatabase();
+    await database.initialize();
+    await database.runMigrations();
+  });
+
+  afterAll(async () => {
+    await database.close();
+  });
+
+  beforeEach(async () => {
+    // Child tables first, then parent tables
+    await database.run('DELETE FROM blunder_details');
+    await database.run('DELETE FROM alternative_moves');
+    await database.run('DELETE FROM position_evaluations');
+    await database.run('DELETE FROM analysis');
+    await database.run('DELETE FROM games');
+
+    const game = await database.run(
+      `INSERT INTO games (pgn_file_path, white_player, black_player, result, date, event, pgn_content, user_id)
+       VALUES (?, ?, ?, ?, ?, ?, ?, ?)`,
+      ['test.pgn', TARGET_PLAYER, 'Opponent', '1-0', '2024-01-01', 'Test Event', 'test pgn', 'json_user']
+    );
+    gameId = game.lastID;
+
+    await database.insertAnalysis(gameId, {
+      move_number: 1,
+      move: 'e4',
+      evaluation: 30,
+      best_move: 'e4',
+      alternatives: [{ move: 'd4', evaluation: 25, line: ['d4', 'd5'] }]
+    });
+    await database.insertAnalysis(gameId, { move_number: 2, move: 'e5', evaluation: 25, best_move: 'e5' });
+  });
+
+  test('getGameAnalysisJSON should serialize the same payload as getGameAnalysis', async () => {
+    const parsed = await database.getGameAnalysis(gameId, 'json_user');
+    const serialized = await database.getGameAnalysisJSON(gameId, 'json_user');
+
+    expect(JSON.parse(serialized)).toEqual(JSON.parse(JSON.stringify(parsed)));
+  });
+
+  test('getGameAnalysisJSON should keep stored alternatives intact', async () => {
+    const body = JSON.parse(await database.getGameAnalysisJSON(gameId, 'json_user'));
+
+    expect(body.analysis).toHaveLength(2);
+    expect(body.analysis[0].alternatives).toEqual([{ move: 'd4', evaluation: 25, line: ['d4', 'd5'] }]);
+    expect(body.analysis[1].alternatives).toEqual([]);
+  });
+
+  test('getGameAnalysisJSON should reuse the serialized body while the analysis is unchanged', async () => {
+    const first = await database.getGameAnalysisJSON(gameId, 'json_user');
+
+    const allSpy = jest.spyOn(database, 'all');
+    const second = await database.getGameAnalysisJSON(gameId, 'json_user');
+
+    expect(second).toBe(first);
+    expect(allSpy).not.toHaveBeenCalled();
+    allSpy.mockRestore();
+  });
+
+  test('getGameAnalysisJSON should rebuild the body when moves are added', async () => {
+    await database.getGameAnalysisJSON(gameId, 'json_user');
+    await database.insertAnalysis(gameId, { move_number: 3, move: 'Nf3', evaluation: 30, best_move: 'Nf3' });
+
+    const body = JSON.parse(await database.getGameAnalysisJSON(gameId, 'json_user'));
+
+    expect(body.analysis).toHaveLength(3);
+    expect(body.analysis[2].move).toBe('Nf3');
+  });
+
+  test('getGameAnalysisJSON should rebuild the body when the game changes', async () => {
+    await database.getGameAnalysisJSON(gameId, 'json_user');
+    await database.run('UPDATE games SET event = ? WHERE id = ?', ['Renamed Event', gameId]);
+
+    const body = JSON.parse(await database.getGameAnalysisJSON(gameId, 'json_user'));
+
+    expect(body.game.event).toBe('Renamed Event');
+  });
+
+  test('getGameAnalysisJSON should return null for another user\'s game', async () => {
+    await database.getGameAnalysisJSON(gameId, 'json_user');
+    expect(await database.getGameAnalysisJSON(gameId, 'other_user')).toBeNull();
+  });
+});
@@ -0,0 +1,56 @@
+const { getDatabase } = require('../../src/models/database');
+
+describe('Database - Query Indexes', () => {
+  let database;
+
+  beforeAll(async () => {
+    database = getDatabase();
+    await database.initialize();
+    await database.runMigrations();
+  });
+
+  afterAll(async () => {
+    await database.close();
+  });
+
+  async function queryPlan(sql, params) {
+    const rows = await database.all(`EXPLAIN QUERY PLAN ${sql}`, params);
+    return rows.map(row => row.detail).join('\n');
+  }
+
+  test('should create the composite indexes', async () => {
+    const rows = await database.all("SELECT name FROM sqlite_master WHERE type = 'index'");
+    const names = rows.map(row => row.name);
+
+    expect(names).toEqual(expect.arrayContaining([
+      'idx_games_user_created',
+      'idx_games_user_date',
+      'idx_games_tournament_user',
+      'idx_analysis_game_move'
+    ]));
+  });
+
+  test('should page the games list without sorting', async () => {
+    const plan = await queryPlan(
+      'SELECT id, result FROM games WHERE user_id = ? ORDER BY created_at DESC LIMIT ? OFFSET ?',
+      ['index_user', 50, 0]
+    );
+
+    expect(plan).not.toMatch(/TEMP B-TREE/);
+  });
+
+  test('should read game analysis in move order without sorting', async () => {
+    const plan = await queryPlan('SELECT * FROM analysis WHERE game_id = ? ORDER BY move_number', [1]);
+
+    expect(plan).not.toMatch(/TEMP B-TREE/);
+  });
+
+  test('should aggregate a game\'s centipawn loss from the index alone', async () => {
+    const plan = await queryPlan(
+      'SELECT COALESCE(SUM(centipawn_loss), 0), COUNT(*) FROM analysis WHERE game_id = ? AND move_number % 2 = 1',
+      [1]
+    );
+
+    expect(plan).toMatch(/COVERING INDEX idx_analysis_game_move/);
+  });
+});
@@ -0,0 +1,115 @@
+/**
+ * EnginePool Tests
+ *
+ * Uses a fake Stockfish process so the UCI handshake can be driven
+ * deterministically without the real engine.
+ */
+
+const { EventEmitter } = require('events');
+
+jest.mock('child_process', () => ({ spawn: jest.fn() }));
+
+const { spawn } = require('child_process');
+const EnginePool = require('../../src/models/engine-pool');
+
+function createFakeEngine() {
+  const engine = new EventEmitter();
+  engine.stdout = new EventEmitter();
+  engine.stdin = new EventEmitter();
+  engine.stdin.commands = [];
+  engine.stdin.write = (command) => {
+    engine.stdin.commands.push(command.trim());
+    if (command.startsWith('uci')) {
+      setImmediate(() => engine.stdout.emit('data', Buffer.from('id name Stockfish\nuciok\n')));
+    } else if (command.startsWith('isready')) {
+      setImmediate(() => engine.stdout.emit('data', Buffer.from('readyok\n')));
+    }
+  };
+  engine.kill = jest.fn(() => engine.emit('close', null));
+  return engine;
+}
+
+describe('EnginePool', () => {
+  let pool;
+  let engines;
+
+  beforeEach(() => {
+    engines = [];
+    spawn.mockImplementation(() => {
+      const engine = createFakeEngine();
+      engines.push(engine);
+      return engine;
+    });
+  });
+
+  afterEach(() => {
+    if (pool) {
+      pool.close();
+    }
+    spawn.mockReset();
+  });
+
+  test('should not spawn engines until first acquire', () => {
+    pool = new EnginePool({ size: 2 });
+    expect(spawn).not.toHaveBeenCalled();
+  });
+
+  test('should hand out an engine that completed the UCI handshake', async () => {
+    pool = new EnginePool({ size: 1 });
+    const engine = await pool.acquire();
+
+    expect(engine.stdin.commands[0]).toBe('uci');
+    expect(engine.stdin.commands).toContain('setoption name Threads value 1');
+    expect(engine.stdin.commands[engine.stdin.commands.length - 1]).toBe('isready');
+  });
+
+  test('should keep a warm engine in reserve after acquire', async () => {
+    pool = new EnginePool({ size: 1 });
+    const first = await pool.acquire();
+    await new Promise(resolve => setImmediate(() => setImmediate(resolve)));
+
+    expect(pool.ready).toHaveLength(1);
+    const second = await pool.acquire();
+    expect(second).not.toBe(first);
+  });
+
+  test('should never hand out the same engine twice', async () => {
+    pool = new EnginePool({ size: 1 });
+    const acquired = await Promise.all([pool.acquire(), pool.acquire(), pool.acquire()]);
+
+    expect(new Set(acquired).size).toBe(3);
+  });
+
+  test('should drop reserve engines that exit before being acquired', async () => {
+    pool = new EnginePool({ size: 1 });
+    await pool.acquire();
+    await new Promise(resolve => setImmediate(() => setImmediate(resolve)));
+
+    const reserve = pool.ready[0];
+    reserve.emit('close', 1);
+    expect(pool.ready).not.toContain(reserve);
+  });
+
+  test('should reject pending callers when an engine fails to start', async () => {
+    spawn.mockImplementation(() => {
+      const engine = createFakeEngine();
+      engine.stdin.write = () => setImmediate(() => engine.emit('error', new Error('spawn stockfish ENOENT')));
+      return engine;
+    });
+
+    pool = new EnginePool({ size: 0 });
+    await expect(pool.acquire()).rejects.toThrow('ENOENT');
+  });
+
+  test('should kill engines and reject acquire after close', async () => {
+    pool = new EnginePool({ size: 1 });
+    await pool.acquire();
+    await new Promise(resolve => setImmediate(() => setImmediate(resolve)));
+
+    const reserve = pool.ready[0];
+    pool.close();
+
+    expect(reserve.kill).toHaveBeenCalled();
+    await expect(pool.acquire()).rejects.toThrow('Engine pool is closed');
+  });
+});
@@ -0,0 +1,87 @@
+/**
+ * FileStorage Tests
+ *
+ * Covers the mtime-validated directory listing cache used by the
+ * tournament folder/file endpoints.
+ */
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { FileStorage } = require('../../src/models/file-storage');
+
+describe('FileStorage listing cache', () => {
+  let storage;
+  let tempDir;
+
+  beforeEach(() => {
+    tempDir = fs.mkdtempSync(path.join(os.tmpdir(), 'file-storage-test-'));
+    storage = new FileStorage();
+    storage.tournamentsDir = path.join(tempDir, 'tournaments');
+    fs.mkdirSync(storage.tournamentsDir);
+    jest.spyOn(console, 'log').mockImplementation();
+  });
+
+  afterEach(() => {
+    console.log.mockRestore();
+    fs.rmSync(tempDir, { recursive: true, force: true });
+  });
+
+  test('should reuse the folder listing while the directory is unchanged', () => {
+    storage.createTournamentFolder('Spring Open');
+    const readdirSpy = jest.spyOn(fs, 'readdirSync');
+
+    const first = storage.listTournamentFolders();
+    const callsAfterFirst = readdirSpy.mock.calls.length;
+    const second = storage.listTournamentFolders();
+
+    expect(second).toEqual(first);
+    expect(readdirSpy.mock.calls.length).toBe(callsAfterFirst);
+    readdirSpy.mockRestore();
+  });
+
+  test('should refresh listings after a PGN is stored', async () => {
+    storage.createTournamentFolder('Spring Open');
+    expect(storage.listTournamentFolders()[0].fileCount).toBe(0);
+    expect(storage.listTournamentFiles('Spring Open')).toHaveLength(0);
+
+    await storage.storePGNInTournament('[Event "Spring Open"]\n\n1. e4 e5 *', 'round1.pgn', 'Spring Open');
+
+    expect(storage.listTournamentFolders()[0].fileCount).toBe(1);
+    const files = storage.listTournamentFiles('Spring Open');
+    expect(files).toHaveLength(1);
+    expect(files[0].name).toMatch(/round1\.pgn$/);
+    expect(files[0].size).toBeGreaterThan(0);
+  });
+
+  test('should pick up PGN files added to a folder outside the process', () => {
+    const folderPath = storage.createTournamentFolder('Spring Open');
+    expect(storage.listTournamentFolders()[0].fileCount).toBe(0);
+
+    fs.writeFileSync(path.join(folderPath, 'round1.pgn'), '1. e4 e5 *');
+    const future = new Date(Date.now() + 5000);
+    fs.utimesSync(folderPath, future, future);
+
+    expect(storage.listTournamentFolders()[0].fileCount).toBe(1);
+  });
+
+  test('should report the current size of a file rewritten in place', async () => {
+    const { filePath } = await storage.storePGNInTournament('1. e4 e5 *', 'round1.pgn', 'Spring Open');
+    expect(storage.listTournamentFiles('Spring Open')[0].size).toBe(10);
+
+    fs.writeFileSync(filePath, '1. e4 e5 2. Nf3 Nc6 *');
+
+    expect(storage.listTournamentFiles('Spring Open')[0].size).toBe(21);
+  });
+
+  test('should pick up folders created outside the process', () => {
+    expect(storage.listTournamentFolders()).toHaveLength(0);
+
+    fs.mkdirSync(path.join(storage.tournamentsDir, 'External_Event'));
+    // Force a different mtime in case the filesystem timestamp granularity is coarse
+    const future = new Date(Date.now() + 5000);
+    fs.utimesSync(storage.tournamentsDir, future, future);
+
+    expect(storage.listTournamentFolders().map(f => f.name)).toEqual(['External_Event']);
+  });
+});
@@ -312,4 +312,64 @@ e4 e5 Nf3 Nc6 Bb5 a6`;
       expect(result.name).toBe("Queen's Pawn Game");
     });
   });
+
+  describe('Opening Move Extraction', () => {
+    const longGame = `[Event "Club Championship"]
+[White "Player A"]
+[Black "Player B"]
+
+1. e4 e5 2. Nf3 Nc6 3. Bb5 a6 {Morphy} 4. Ba4 Nf6 5. O-O Be7 6. Re1 b5
+7. Bb3 d6 8. c3 O-O 9. h3 Nb8 10. d4 Nbd7 1-0`;
+
+    test('should only replay the plies needed for detection', () => {
+      const fullParseSpy = jest.spyOn(openingDetector, 'extractMovesFromPgn');
+
+      const moves = openingDetector.extractOpeningMoves(longGame);
+
+      expect(moves).toEqual(['e4', 'e5', 'Nf3', 'Nc6', 'Bb5', 'a6', 'Ba4', 'Nf6', 'O-O', 'Be7']);
+      expect(fullParseSpy).not.toHaveBeenCalled();
+      fullParseSpy.mockRestore();
+    });
+
+    test('should fall back to a full parse for set-up positions', () => {
+      const pgn = `[SetUp "1"]
+[FEN "rnbqkbnr/pppppppp/8/8/4P3/8/PPPP1PPP/RNBQKBNR b KQkq - 0 1"]
+
+1... c5 2. Nf3 *`;
+      const fullParseSpy = jest.spyOn(openingDetector, 'extractMovesFromPgn');
+
+      openingDetector.extractOpeningMoves(pgn);
+
+      expect(fullParseSpy).toHaveBeenCalledWith(pgn);
+      fullParseSpy.mockRestore();
+    });
+
+    test('should not leak moves from nested variations into the mainline', () => {
+      const pgn = `[Event "Annotated (Round 2)"]
+
+1. e4 e5 (1... c5 (1... c6) 2. Nf3 Nc6) 2. Bc4 Bc5 3. c3 Nf6 4. d4 exd4
+5. cxd4 Bb4+ 6. Bd2 Bxd2+ 1-0`;
+      const fullParseSpy = jest.spyOn(openingDetector, 'extractMovesFromPgn');
+
+      const moves = openingDetector.extractOpeningMoves(pgn);
+
+      expect(moves).toEqual(['e4', 'e5', 'Bc4', 'Bc5', 'c3', 'Nf6', 'd4', 'exd4', 'cxd4', 'Bb4+']);
+      expect(fullParseSpy).toHaveBeenCalledWith(pgn);
+      expect(openingDetector.detect(pgn)?.name).not.toMatch(/Italian/);
+      fullParseSpy.mockRestore();
+    });
+
+    test('should reuse the detection for a PGN seen before', () => {
+      openingDetector.detectionCache.clear();
+      const first = openingDetector.detect(longGame);
+      const extractSpy = jest.spyOn(openingDetector, 'extractOpeningMoves');
+
+      const second = openingDetector.detect(longGame);
+
+      expect(second).toEqual(first);
+      expect(second.name).toBe('Ruy Lopez, Morphy Defense');
+      expect(extractSpy).not.toHaveBeenCalled();
+      extractSpy.mockRestore();
+    });
+  });
 });
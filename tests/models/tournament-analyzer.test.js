@@ -254,6 +254,38 @@ describe('TournamentAnalyzer', () => {
       expect(trends[1].gameId).toBe(game2.id);
       expect(trends[1].accuracy).toBeGreaterThan(trends[0].accuracy); // Better accuracy in game 2
     });
+
+    test('should count only the user\'s moves and blunders per game', async () => {
+      const TARGET_PLAYER = 'AdvaitKumar1213';
+
+      const game1 = await testDb.run(`
+        INSERT INTO games (pgn_file_path, white_player, black_player, result, tournament_id, created_at, user_id, user_color)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+      `, ['test_tournament_analyzer', 'Opponent1', TARGET_PLAYER, '0-1', tournamentId, '2024-01-01 10:00:00', 'default_user', 'black']);
+
+      const game2 = await testDb.run(`
+        INSERT INTO games (pgn_file_path, white_player, black_player, result, tournament_id, created_at, user_id, user_color)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+      `, ['test_tournament_analyzer', TARGET_PLAYER, 'Opponent2', '1-0', tournamentId, '2024-01-01 11:00:00', 'default_user', 'white']);
+
+      // Game 1: the opponent's (white) moves must be ignored
+      for (const [moveNumber, cpl, isBlunder] of [[1, 400, 1], [2, 30, 0], [3, 500, 1], [4, 350, 1]]) {
+        await testDb.run(`
+          INSERT INTO analysis (game_id, move_number, move, centipawn_loss, is_blunder)
+          VALUES (?, ?, ?, ?, ?)
+        `, [game1.id, moveNumber, 'e4', cpl, isBlunder]);
+      }
+
+      const trends = await tournamentAnalyzer.getTournamentTrends(tournamentId, 'default_user');
+
+      expect(trends).toHaveLength(2);
+      expect(trends[0].blunders).toBe(1);
+      expect(trends[0].avgCentipawnLoss).toBe(190);
+      // Game 2 has no analysis yet
+      expect(trends[1].gameId).toBe(game2.id);
+      expect(trends[1].blunders).toBe(0);
+      expect(trends[1].avgCentipawnLoss).toBe(0);
+    });
   });
 
   describe('rankTournaments', () => {
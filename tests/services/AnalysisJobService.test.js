@@ -0,0 +1,152 @@
+/**
+ * AnalysisJobService Tests
+ *
+ * Background analysis jobs with a mocked database and upload service.
+ */
+
+const AnalysisJobService = require('../../src/services/AnalysisJobService');
+
+describe('AnalysisJobService', () => {
+  let service;
+  let mockDatabase;
+  let mockUploadService;
+  let nextJobId;
+
+  const flushQueue = () => new Promise(resolve => setTimeout(resolve, 10));
+
+  beforeEach(() => {
+    nextJobId = 1;
+    mockDatabase = {
+      run: jest.fn(async (sql) => (sql.startsWith('INSERT') ? { lastID: nextJobId++ } : { changes: 0 })),
+      get: jest.fn()
+    };
+    mockUploadService = {
+      processPGNUpload: jest.fn()
+    };
+    service = new AnalysisJobService({ uploadService: mockUploadService, database: mockDatabase });
+
+    jest.spyOn(console, 'log').mockImplementation();
+    jest.spyOn(console, 'error').mockImplementation();
+  });
+
+  afterEach(() => {
+    console.log.mockRestore();
+    console.error.mockRestore();
+  });
+
+  const statusUpdates = () => mockDatabase.run.mock.calls
+    .filter(([sql]) => sql.startsWith('UPDATE analysis_jobs SET status'))
+    .map(([, params]) => ({ status: params[0], result: params[1], error: params[2], jobId: params[3] }));
+
+  describe('enqueue', () => {
+    it('should record a queued job and return its id', async () => {
+      mockUploadService.processPGNUpload.mockResolvedValue({ success: true });
+
+      const jobId = await service.enqueue({ pgnContent: '1. e4', userId: 'user1', originalFileName: 'game.pgn' });
+
+      expect(jobId).toBe(1);
+      expect(mockDatabase.run).toHaveBeenCalledWith(
+        expect.stringContaining('INSERT INTO analysis_jobs'),
+        ['user1', 'queued', 'game.pgn', process.pid]
+      );
+      await flushQueue();
+    });
+
+    it('should mark the job completed with the upload result', async () => {
+      mockUploadService.processPGNUpload.mockResolvedValue({ success: true, totalGames: 2 });
+
+      await service.enqueue({ pgnContent: '1. e4', userId: 'user1' });
+      await flushQueue();
+
+      expect(statusUpdates()).toEqual([
+        { status: 'processing', result: null, error: null, jobId: 1 },
+        { status: 'completed', result: JSON.stringify({ success: true, totalGames: 2 }), error: null, jobId: 1 }
+      ]);
+    });
+
+    it('should mark the job failed when the upload throws', async () => {
+      mockUploadService.processPGNUpload.mockRejectedValue(new Error('Stockfish engine not ready'));
+
+      await service.enqueue({ pgnContent: '1. e4', userId: 'user1' });
+      await flushQueue();
+
+      expect(statusUpdates()[1]).toEqual({ status: 'failed', result: null, error: 'Stockfish engine not ready', jobId: 1 });
+    });
+
+    it('should run jobs one at a time in order', async () => {
+      const started = [];
+      let finishFirst;
+      mockUploadService.processPGNUpload
+        .mockImplementationOnce(options => {
+          started.push(options.pgnContent);
+          return new Promise(resolve => { finishFirst = resolve; });
+        })
+        .mockImplementationOnce(async options => {
+          started.push(options.pgnContent);
+          return {};
+        });
+
+      await service.enqueue({ pgnContent: 'first', userId: 'user1' });
+      await service.enqueue({ pgnContent: 'second', userId: 'user1' });
+      await flushQueue();
+
+      expect(started).toEqual(['first']);
+
+      finishFirst({});
+      await flushQueue();
+
+      expect(started).toEqual(['first', 'second']);
+    });
+  });
+
+  describe('getJob', () => {
+    it('should return the job with a parsed result', async () => {
+      mockDatabase.get.mockResolvedValue({
+        id: 3,
+        status: 'completed',
+        original_file_name: 'game.pgn',
+        result: '{"success":true}',
+        error: null,
+        created_at: '2024-01-01 10:00:00',
+        updated_at: '2024-01-01 10:01:00'
+      });
+
+      const job = await service.getJob(3, 'user1');
+
+      expect(mockDatabase.get).toHaveBeenCalledWith(expect.stringContaining('user_id = ?'), [3, 'user1']);
+      expect(job).toEqual({
+        id: 3,
+        status: 'completed',
+        fileName: 'game.pgn',
+        result: { success: true },
+        error: null,
+        createdAt: '2024-01-01 10:00:00',
+        updatedAt: '2024-01-01 10:01:00'
+      });
+    });
+
+    it('should return null for jobs of other users', async () => {
+      mockDatabase.get.mockResolvedValue(undefined);
+
+      expect(await service.getJob(3, 'someone-else')).toBeNull();
+    });
+  });
+
+  describe('recoverInterruptedJobs', () => {
+    it('should fail queued and processing jobs', async () => {
+      await service.recoverInterruptedJobs();
+
+      const [sql, params] = mockDatabase.run.mock.calls[0];
+      expect(sql).toContain('WHERE status IN (?, ?)');
+      expect(params).toEqual(['failed', expect.any(String), 'queued', 'processing']);
+    });
+
+    it('should only fail the jobs of a crashed server worker', async () => {
+      await service.recoverInterruptedJobs({ workerPid: 4242 });
+
+      const [sql, params] = mockDatabase.run.mock.calls[0];
+      expect(sql).toContain('AND worker_pid = ?');
+      expect(params).toEqual(['failed', expect.any(String), 'queued', 'processing', 4242]);
+    });
+  });
+});
@@ -78,6 +78,26 @@ describe('BlunderService', () => {
     });
   });
 
+  describe('getBlunderCountForUser', () => {
+    it('should count the user\'s blunders across all games in one query', async () => {
+      mockDatabase.get.mockResolvedValue({ count: '7' });
+
+      const count = await blunderService.getBlunderCountForUser('user1');
+
+      expect(count).toBe(7);
+      const [query, params] = mockDatabase.get.mock.calls[0];
+      expect(query).toContain('bd.player_color = g.user_color');
+      expect(query).toContain('g.user_id = ?');
+      expect(params).toEqual(['user1']);
+    });
+
+    it('should return 0 when there are no blunders', async () => {
+      mockDatabase.get.mockResolvedValue(undefined);
+
+      expect(await blunderService.getBlunderCountForUser('user1')).toBe(0);
+    });
+  });
+
   describe('getBlundersForUser', () => {
     it('should return all blunders for a user', async () => {
       const mockBlunders = [
@@ -28,7 +28,8 @@ describe('DashboardService', () => {
 
     // Create mock BlunderService
     mockBlunderService = {
-      getBlunderCountForGame: jest.fn()
+      getBlunderCountForGame: jest.fn(),
+      getBlunderCountForUser: jest.fn()
     };
 
     BlunderService.mockImplementation(() => mockBlunderService);
@@ -44,33 +45,48 @@ describe('DashboardService', () => {
   });
 
   describe('getPlayerPerformance', () => {
+    const mockGames = [
+      { id: 1, user_color: 'white', result: '1-0', white_elo: 1500, black_elo: 1450, created_at: '2025-01-01' },
+      { id: 2, user_color: 'black', result: '1-0', white_elo: 1520, black_elo: 1500, created_at: '2025-01-02' },
+      { id: 3, user_color: 'white', result: '1/2-1/2', white_elo: 1500, black_elo: 1490, created_at: '2025-01-03' }
+    ];
+
     it('should use BlunderService to count blunders', async () => {
-      const mockGames = [
-        {
-          id: 1,
-          user_color: 'white',
-          result: '1-0',
-          white_elo: 1500,
-          black_elo: 1450,
-          created_at: '2025-01-01'
-        }
-      ];
-
-      const mockAnalysis = [
-        { move_number: 1, centipawn_loss: 10 }
-      ];
-
-      mockDatabase.all
-        .mockResolvedValueOnce(mockGames)
-        .mockResolvedValue(mockAnalysis);
-
-      mockBlunderService.getBlunderCountForGame.mockResolvedValue(2);
+      mockDatabase.all.mockResolvedValueOnce(mockGames);
+      mockDatabase.get.mockResolvedValue({ total_centipawn_loss: 300, total_moves: 10 });
+      mockBlunderService.getBlunderCountForUser.mockResolvedValue(2);
 
       const result = await dashboardService.getPlayerPerformance('user123');
 
-      expect(mockBlunderService.getBlunderCountForGame).toHaveBeenCalledWith(1, 'white');
+      expect(mockBlunderService.getBlunderCountForUser).toHaveBeenCalledWith('user123');
       expect(result.overall.totalBlunders).toBe(2);
     });
+
+    it('should aggregate moves with a fixed number of queries', async () => {
+      mockDatabase.all.mockResolvedValueOnce(mockGames);
+      mockDatabase.get.mockResolvedValue({ total_centipawn_loss: 300, total_moves: 10 });
+      mockBlunderService.getBlunderCountForUser.mockResolvedValue(0);
+
+      const result = await dashboardService.getPlayerPerformance('user123');
+
+      expect(mockDatabase.all).toHaveBeenCalledTimes(1);
+      expect(mockDatabase.get).toHaveBeenCalledTimes(1);
+      expect(mockDatabase.get).toHaveBeenCalledWith(expect.stringContaining('move_number % 2'), ['user123']);
+      // 30 average centipawn loss -> 90% accuracy
+      expect(result.overall.avgAccuracy).toBe(90);
+      expect(result.overall).toMatchObject({ totalGames: 3, overallWinRate: 33 });
+      expect(result.white).toMatchObject({ games: 2, wins: 1, draws: 1 });
+      expect(result.black).toMatchObject({ games: 1, losses: 1 });
+    });
+
+    it('should report zero accuracy without analyzed moves', async () => {
+      mockDatabase.all.mockResolvedValueOnce([]);
+      mockDatabase.get.mockResolvedValue({ total_centipawn_loss: 0, total_moves: 0 });
+
+      const result = await dashboardService.getPlayerPerformance('user123');
+
+      expect(result.overall).toEqual({ overallWinRate: 0, avgAccuracy: 0, totalGames: 0, totalBlunders: 0 });
+    });
   });
 
   describe('User ID Filtering', () => {
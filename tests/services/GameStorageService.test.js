@@ -10,9 +10,9 @@ describe('GameStorageService', () => {
     mockDatabase = {
       findGameByContentHash: jest.fn(),
       insertGame: jest.fn(),
-      insertAnalysis: jest.fn(),
-      storeAlternativeMoves: jest.fn(),
-      storePositionEvaluation: jest.fn(),
+      insertAnalysisBatch: jest.fn(),
+      storeAlternativeMovesBatch: jest.fn(),
+      storePositionEvaluationsBatch: jest.fn(),
       updatePerformanceMetrics: jest.fn()
     };
 
@@ -171,8 +171,8 @@ describe('GameStorageService', () => {
 
     it('should store game in database', async () => {
       mockDatabase.insertGame.mockResolvedValue({ id: 42 });
-      mockDatabase.insertAnalysis.mockResolvedValue();
-      mockDatabase.storePositionEvaluation.mockResolvedValue();
+      mockDatabase.insertAnalysisBatch.mockResolvedValue();
+      mockDatabase.storePositionEvaluationsBatch.mockResolvedValue();
       const consoleLogSpy = jest.spyOn(console, 'log').mockImplementation();
 
       const gameId = await service.storeGame(
@@ -226,8 +226,8 @@ describe('GameStorageService', () => {
 
     it('should store analysis data when available', async () => {
       mockDatabase.insertGame.mockResolvedValue({ id: 42 });
-      mockDatabase.insertAnalysis.mockResolvedValue();
-      mockDatabase.storePositionEvaluation.mockResolvedValue();
+      mockDatabase.insertAnalysisBatch.mockResolvedValue();
+      mockDatabase.storePositionEvaluationsBatch.mockResolvedValue();
 
       await service.storeGame(
         mockGame,
@@ -239,8 +239,8 @@ describe('GameStorageService', () => {
         0
       );
 
-      expect(mockDatabase.insertAnalysis).toHaveBeenCalled();
-      expect(mockDatabase.storePositionEvaluation).toHaveBeenCalled();
+      expect(mockDatabase.insertAnalysisBatch).toHaveBeenCalled();
+      expect(mockDatabase.storePositionEvaluationsBatch).toHaveBeenCalled();
     });
 
     it('should not store analysis when not available', async () => {
@@ -256,7 +256,7 @@ describe('GameStorageService', () => {
         0
       );
 
-      expect(mockDatabase.insertAnalysis).not.toHaveBeenCalled();
+      expect(mockDatabase.insertAnalysisBatch).not.toHaveBeenCalled();
     });
   });
 
@@ -282,57 +282,51 @@ describe('GameStorageService', () => {
     ];
 
     beforeEach(() => {
-      mockDatabase.insertAnalysis.mockResolvedValue();
-      mockDatabase.storeAlternativeMoves.mockResolvedValue();
-      mockDatabase.storePositionEvaluation.mockResolvedValue();
+      mockDatabase.insertAnalysisBatch.mockResolvedValue();
+      mockDatabase.storeAlternativeMovesBatch.mockResolvedValue();
+      mockDatabase.storePositionEvaluationsBatch.mockResolvedValue();
     });
 
-    it('should store all move analyses', async () => {
+    it('should store all move analyses in one batch', async () => {
       const consoleLogSpy = jest.spyOn(console, 'log').mockImplementation();
 
       await service.storeAnalysisData(1, mockAnalysisData);
 
-      expect(mockDatabase.insertAnalysis).toHaveBeenCalledTimes(2);
-      expect(mockDatabase.storePositionEvaluation).toHaveBeenCalledTimes(2);
+      expect(mockDatabase.insertAnalysisBatch).toHaveBeenCalledTimes(1);
+      expect(mockDatabase.insertAnalysisBatch).toHaveBeenCalledWith(1, mockAnalysisData);
+      expect(mockDatabase.storePositionEvaluationsBatch).toHaveBeenCalledTimes(1);
 
       consoleLogSpy.mockRestore();
     });
 
-    it('should store alternative moves when available', async () => {
-      const consoleLogSpy = jest.spyOn(console, 'log').mockImplementation();
-
+    it('should store alternative moves only for moves that have them', async () => {
       await service.storeAnalysisData(1, mockAnalysisData);
 
-      expect(mockDatabase.storeAlternativeMoves).toHaveBeenCalledWith(
-        1,
-        1,
-        mockAnalysisData[0].alternatives
-      );
-      expect(consoleLogSpy).toHaveBeenCalledWith(
-        expect.stringContaining('Stored 2 alternatives for move 1')
-      );
-
-      consoleLogSpy.mockRestore();
+      expect(mockDatabase.storeAlternativeMovesBatch).toHaveBeenCalledWith(1, [
+        { moveNumber: 1, alternatives: mockAnalysisData[0].alternatives }
+      ]);
     });
 
     it('should store position evaluations with FEN', async () => {
       await service.storeAnalysisData(1, mockAnalysisData);
 
-      expect(mockDatabase.storePositionEvaluation).toHaveBeenCalledWith(
-        1,
-        1,
-        mockAnalysisData[0].fen_before,
-        mockAnalysisData[0].evaluation,
-        mockAnalysisData[0].best_move,
-        12, // depth
-        null // mateIn
-      );
+      const [gameId, evaluations] = mockDatabase.storePositionEvaluationsBatch.mock.calls[0];
+      expect(gameId).toBe(1);
+      expect(evaluations).toHaveLength(2);
+      expect(evaluations[0]).toEqual({
+        moveNumber: 1,
+        fen: mockAnalysisData[0].fen_before,
+        evaluation: mockAnalysisData[0].evaluation,
+        bestMove: mockAnalysisData[0].best_move,
+        depth: 12,
+        mateIn: null
+      });
     });
 
     it('should handle empty analysis data', async () => {
       await service.storeAnalysisData(1, []);
 
-      expect(mockDatabase.insertAnalysis).not.toHaveBeenCalled();
+      expect(mockDatabase.insertAnalysisBatch).not.toHaveBeenCalled();
     });
   });
 
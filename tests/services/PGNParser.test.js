@@ -144,6 +144,16 @@ describe('PGNParser', () => {
       expect(moves).not.toContain('1.');
     });
 
+    test('should strip comments, variations and black move numbers', () => {
+      const lines = [
+        '[White "Player1"]',
+        '[Black "Player2"]',
+        '1. e4 {best by test} e5 (1... c5 2. Nf3) 2. Nf3 2... Nc6 3.Bb5 a6 1/2-1/2'
+      ];
+
+      expect(parser.extractMoves(lines)).toEqual(['e4', 'e5', 'Nf3', 'Nc6', 'Bb5', 'a6']);
+    });
+
     test('should handle empty move section', () => {
       const lines = ['[White "Player1"]', '[Black "Player2"]'];
       const moves = parser.extractMoves(lines);